@@ -18,11 +18,16 @@ import sys
 import json
 import logging
 import shutil
+import re
 import hashlib
+import struct
+import subprocess
+import tempfile
+import time
+import queue
+import multiprocessing
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple, Union
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import glob
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterator, Iterable
 from dataclasses import dataclass
 from enum import Enum
 
@@ -35,6 +40,13 @@ except ImportError:
     PYDUB_AVAILABLE = False
     logging.error("pydub is not available. Please install with: pip install pydub")
 
+# Optional: vectorized loudness analysis
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -42,6 +54,92 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Read size for streamed ffmpeg output; bounds memory per streamed conversion
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Loudness is measured over 400 ms blocks; silent and much quieter blocks are gated out
+LOUDNESS_BLOCK_SECONDS = 0.4
+LOUDNESS_ABSOLUTE_GATE = -70.0
+LOUDNESS_RELATIVE_GATE = -10.0
+
+def analyze_loudness(audio: 'AudioSegment') -> Dict[str, float]:
+    """
+    Measure gated loudness and peak of an audio segment in one vectorized pass.
+    
+    Loudness is the mean power of the 400 ms blocks that pass an absolute gate
+    and a relative gate 10 dB below the ungated level, summed over channels as
+    in ITU-R BS.1770 but without K-weighting.
+    
+    Args:
+        audio: Decoded audio segment
+        
+    Returns:
+        Dictionary with 'loudness' and 'peak' in dBFS
+    """
+    dtype = {1: np.int8, 2: np.int16, 4: np.int32}[audio.sample_width]
+    full_scale = float(2 ** (8 * audio.sample_width - 1))
+    samples = np.frombuffer(audio.raw_data, dtype=dtype)
+    if samples.size == 0:
+        return {'loudness': float('-inf'), 'peak': float('-inf')}
+    
+    # Peak straight from the integer samples, without a float copy
+    peak = max(int(samples.max()), -int(samples.min())) / full_scale
+    
+    frames = samples.reshape(-1, audio.channels).astype(np.float32)
+    block = max(1, int(audio.frame_rate * LOUDNESS_BLOCK_SECONDS))
+    block_count = len(frames) // block
+    if block_count:
+        blocks = frames[:block_count * block].reshape(block_count, block, audio.channels)
+        # Sum of squares over each block's samples and channels in one pass
+        block_power = np.einsum('ijk,ijk->i', blocks, blocks) / (block * full_scale ** 2)
+    else:
+        block_power = np.array([np.einsum('jk,jk->', frames, frames) / (len(frames) * full_scale ** 2)])
+    
+    gated = block_power[block_power > 10 ** (LOUDNESS_ABSOLUTE_GATE / 10)]
+    if gated.size:
+        relative_gate = gated.mean() * 10 ** (LOUDNESS_RELATIVE_GATE / 10)
+        gated = gated[gated > relative_gate]
+    mean_power = float(gated.mean()) if gated.size else 0.0
+    
+    return {
+        'loudness': float(10 * np.log10(mean_power)) if mean_power > 0 else float('-inf'),
+        'peak': float(20 * np.log10(peak)) if peak > 0 else float('-inf')
+    }
+
+def find_sound_bounds(audio: 'AudioSegment', threshold_db: float) -> Tuple[int, int]:
+    """
+    Find the first and one-past-last frame whose level on any channel exceeds the threshold.
+    
+    Compares the whole sample buffer against the threshold in one vectorized
+    pass; returns (0, 0) when every frame is below it.
+    """
+    dtype = {1: np.int8, 2: np.int16, 4: np.int32}[audio.sample_width]
+    threshold = 2 ** (8 * audio.sample_width - 1) * 10 ** (threshold_db / 20)
+    frames = np.frombuffer(audio.raw_data, dtype=dtype).reshape(-1, audio.channels)
+    # Comparing both signs avoids abs(), which overflows on the most negative sample
+    loud = np.flatnonzero(((frames > threshold) | (frames < -threshold)).any(axis=1))
+    if loud.size == 0:
+        return 0, 0
+    return int(loud[0]), int(loud[-1]) + 1
+
+def normalization_gain(loudness: float, peak: float, target_loudness: float, max_peak: float) -> float:
+    """Gain in dB that brings loudness to the target without pushing the peak above max_peak."""
+    if loudness == float('-inf') or peak == float('-inf'):
+        return 0.0
+    return min(target_loudness - loudness, max_peak - peak)
+
+def apply_gain(audio: 'AudioSegment', gain_db: float) -> 'AudioSegment':
+    """Scale every sample by a gain in dB as one array operation, clipping at full scale."""
+    dtype = {1: np.int8, 2: np.int16, 4: np.int32}[audio.sample_width]
+    limits = np.iinfo(dtype)
+    # float32 rounds the 32-bit limit up to 2**31, which the cast back wraps to the most negative sample
+    work_dtype = np.float64 if audio.sample_width == 4 else np.float32
+    samples = np.frombuffer(audio.raw_data, dtype=dtype).astype(work_dtype)
+    samples *= 10 ** (gain_db / 20)
+    np.rint(samples, out=samples)
+    np.clip(samples, limits.min, limits.max, out=samples)
+    return audio._spawn(samples.astype(dtype).tobytes())
+
 class AudioType(Enum):
     """Enumeration of audio file types."""
     MUSIC = "music"
@@ -64,6 +162,85 @@ class AudioFileInfo:
     audio_type: AudioType
     hash: str
 
+class FileHasher:
+    """
+    SHA-256 hashing service shared by validation, caching and the output store.
+    
+    Files are read in large chunks into one reused buffer, and each digest is
+    memoized by (path, size, mtime_ns) so a file is read at most once per run.
+    Entries remembered from an earlier run, or handed over from another process,
+    are reused without reading the file as long as its size and mtime match.
+    """
+    
+    CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(self):
+        self._memo: Dict[str, Dict[str, Any]] = {}
+    
+    @staticmethod
+    def _stat_matches(entry: Optional[Dict[str, Any]], stat: os.stat_result) -> bool:
+        return bool(entry) and entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns
+    
+    def remember(self, file_path: str, entry: Optional[Dict[str, Any]]) -> None:
+        """Record a known {'hash', 'size', 'mtime_ns'} entry; it is used while the file's stat matches."""
+        if entry and entry.get('hash'):
+            self._memo[os.path.abspath(file_path)] = entry
+    
+    def known_entry(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Return the memoized entry for a file without hashing it."""
+        return self._memo.get(os.path.abspath(file_path))
+    
+    def get_entry(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Return the file's {'hash', 'size', 'mtime_ns'} entry, hashing it only if not already known."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        
+        key = os.path.abspath(file_path)
+        entry = self._memo.get(key)
+        if self._stat_matches(entry, stat):
+            return entry
+        
+        try:
+            file_hash = self._hash_contents(file_path)
+        except OSError:
+            return None
+        entry = {'hash': file_hash, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        self._memo[key] = entry
+        return entry
+    
+    def hash_file(self, file_path: str) -> str:
+        """Return the SHA-256 hex digest of a file, or an empty string if it cannot be read."""
+        entry = self.get_entry(file_path)
+        return entry['hash'] if entry else ""
+    
+    def is_unchanged(self, file_path: str, entry: Optional[Dict[str, Any]]) -> bool:
+        """Compare a file with a recorded entry, trusting an unchanged size and mtime without hashing."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        if self._stat_matches(entry, stat):
+            self.remember(file_path, entry)
+            return True
+        return bool(entry) and self.hash_file(file_path) == entry.get('hash')
+    
+    def _hash_contents(self, file_path: str) -> str:
+        hash_sha256 = hashlib.sha256()
+        buffer = bytearray(self.CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(file_path, 'rb', buffering=0) as f:
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                hash_sha256.update(view[:read])
+        return hash_sha256.hexdigest()
+
+# Shared by everything in this process; pool workers receive known entries with each job
+file_hasher = FileHasher()
+
 class AudioProcessor:
     """Advanced audio processing with sophisticated file handling using pydub."""
     
@@ -91,33 +268,59 @@ class AudioProcessor:
             logger.error("Please install pydub: pip install pydub")
             sys.exit(1)
 
-def find_audio_files() -> List[str]:
+# Input formats and folders searched when no source_dirs are configured
+DEFAULT_AUDIO_FORMATS = ['.wav', '.mp3', '.m4a', '.aac', '.flac', '.aiff']
+DEFAULT_SOURCE_DIRS = ['RP/sounds', 'BP/sounds']
+
+def iter_audio_files(source_dirs: List[str], formats: List[str]) -> Iterator[str]:
     """
-    Find audio files using glob patterns like the Blockbench filter.
+    Yield audio files under each source directory in one os.scandir pass per directory.
     
-    Returns:
-        List of discovered audio file paths
-    """
-    audio_files = []
-    supported_formats = ['.wav', '.mp3', '.m4a', '.aac', '.flac', '.aiff']
+    Files are yielded as they are found, so conversion can start before a large
+    sound tree is fully scanned. Entries are visited in name order for
+    reproducible runs; hidden files and folders are skipped like glob does.
     
-    # Use glob patterns to find audio files directly, just like the Blockbench filter
-    for format_ext in supported_formats:
-        # Look for files in RP/sounds/**/*.ext
-        rp_pattern = f"RP/sounds/**/*{format_ext}"
-        rp_files = glob.glob(rp_pattern, recursive=True)
-        audio_files.extend(rp_files)
+    Args:
+        source_dirs: Directories to search recursively
+        formats: File extensions to yield, e.g. ['.mp3', '.flac']
         
-        # Look for files in BP/sounds/**/*.ext
-        bp_pattern = f"BP/sounds/**/*{format_ext}"
-        bp_files = glob.glob(bp_pattern, recursive=True)
-        audio_files.extend(bp_files)
+    Yields:
+        Normalized audio file paths
+    """
+    extensions = {ext.lower() for ext in formats}
+    seen = set()
     
-    # Remove duplicates and normalize paths
-    audio_files = list(set(audio_files))
-    audio_files = [os.path.normpath(f) for f in audio_files]
+    for source_dir in source_dirs:
+        pending = [os.path.normpath(source_dir)]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as scanner:
+                    entries = sorted(scanner, key=lambda entry: entry.name)
+            except OSError:
+                continue
+            
+            subdirectories = []
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir():
+                    subdirectories.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in extensions and entry.path not in seen:
+                    seen.add(entry.path)
+                    yield entry.path
+            
+            # Reversed so the stack pops subdirectories in name order
+            pending.extend(reversed(subdirectories))
+
+def find_audio_files() -> List[str]:
+    """
+    Find audio files in the RP and BP sounds folders like the Blockbench filter.
     
-    return audio_files
+    Returns:
+        List of discovered audio file paths
+    """
+    return list(iter_audio_files(DEFAULT_SOURCE_DIRS, DEFAULT_AUDIO_FORMATS))
 
 class AudioFileDiscoverer:
     """Advanced file discovery with pattern matching and categorization."""
@@ -125,6 +328,7 @@ class AudioFileDiscoverer:
     def __init__(self, supported_formats: List[str]):
         self.supported_formats = supported_formats
         self.audio_patterns = self._build_patterns()
+        self.category_regex = self._compile_patterns(self.audio_patterns)
     
     def _build_patterns(self) -> Dict[str, List[str]]:
         """Build pattern matching rules for different audio types."""
@@ -164,35 +368,68 @@ class AudioFileDiscoverer:
             ]
         }
     
-    def discover_audio_files(self, source_dirs: List[str]) -> Dict[AudioType, List[str]]:
+    @staticmethod
+    def _compile_patterns(audio_patterns: Dict[AudioType, List[str]]) -> 're.Pattern':
         """
-        Discover and categorize audio files by type.
+        Compile every type's glob patterns into one regex with a named group per type.
+        
+        Alternatives are tried in order, so the first type whose pattern matches
+        wins, exactly as when checking the patterns one by one.
+        """
+        def glob_to_regex(pattern: str) -> str:
+            regex = ''
+            for token in re.split(r'(\*\*/|\*\*|\*|\?)', pattern.lower()):
+                if token == '**/':
+                    regex += '(?:.*/)?'
+                elif token == '**':
+                    regex += '.*'
+                elif token == '*':
+                    regex += '[^/]*'
+                elif token == '?':
+                    regex += '[^/]'
+                else:
+                    regex += re.escape(token)
+            return regex
+        
+        groups = [
+            f"(?P<{audio_type.name}>{'|'.join(glob_to_regex(pattern) for pattern in patterns)})"
+            for audio_type, patterns in audio_patterns.items()
+        ]
+        return re.compile('|'.join(groups))
+    
+    def iter_audio_files(self, source_dirs: List[str]) -> Iterator[Tuple[str, AudioType]]:
+        """
+        Yield (file_path, audio_type) for every supported file as it is discovered.
         
         Args:
             source_dirs: List of directories to search
             
-        Returns:
-            Dictionary mapping audio types to file lists
+        Yields:
+            Tuples of (file_path, audio_type)
         """
-        categorized_files = {audio_type: [] for audio_type in AudioType}
-        
         for source_dir in source_dirs:
             if not os.path.exists(source_dir):
                 logger.warning(f"Source directory not found: {source_dir}")
                 continue
-                
+            
             logger.info(f"Scanning directory: {source_dir}")
+            for file_path in iter_audio_files([source_dir], self.supported_formats):
+                yield file_path, self._categorize_file(file_path, source_dir)
+    
+    def discover_audio_files(self, source_dirs: List[str]) -> Dict[AudioType, List[str]]:
+        """
+        Discover and categorize audio files by type.
+        
+        Args:
+            source_dirs: List of directories to search
             
-            # Use simple glob patterns like the Blockbench filter
-            for format_ext in self.supported_formats:
-                pattern = os.path.join(source_dir, f"**/*{format_ext}")
-                files = glob.glob(pattern, recursive=True)
-                
-                if files:
-                    # Categorize files by type
-                    for file_path in files:
-                        audio_type = self._categorize_file(file_path, source_dir)
-                        categorized_files[audio_type].append(file_path)
+        Returns:
+            Dictionary mapping audio types to file lists
+        """
+        categorized_files = {audio_type: [] for audio_type in AudioType}
+        
+        for file_path, audio_type in self.iter_audio_files(source_dirs):
+            categorized_files[audio_type].append(file_path)
         
         # Log summary
         total_files = sum(len(files) for files in categorized_files.values())
@@ -221,59 +458,251 @@ class AudioFileDiscoverer:
             # Handle case where file_path is not relative to source_dir
             relative_path = file_path
         
-        relative_path_lower = relative_path.lower()
-        
-        # Check each audio type pattern
-        for audio_type, patterns in self.audio_patterns.items():
-            for pattern in patterns:
-                # Convert pattern to checkable format
-                pattern_lower = pattern.lower()
-                
-                # Check if the file path matches this pattern
-                if self._matches_pattern(relative_path_lower, pattern_lower):
-                    return audio_type
+        return self.categorize_path(relative_path)
+    
+    def categorize_path(self, relative_path: str) -> AudioType:
+        """Match a path relative to its source directory against the compiled type patterns."""
+        match = self.category_regex.fullmatch(relative_path.replace(os.sep, '/').lower())
         
         # If no pattern matches, categorize as unknown
-        return AudioType.UNKNOWN
+        return AudioType[match.lastgroup] if match else AudioType.UNKNOWN
+
+class AudioHeaderProbe:
+    """
+    Reads duration, sample rate and channel count from audio file headers.
+    
+    WAV, AIFF, FLAC, MP3 and OGG (Vorbis/Opus) headers are parsed directly;
+    other formats go through ffprobe when it is installed. Nothing is decoded,
+    so probing a long track costs a few kilobytes of reads instead of its
+    whole PCM size in memory.
+    """
     
-    def _matches_pattern(self, file_path: str, pattern: str) -> bool:
+    HEADER_BYTES = 65536
+    
+    MP3_BITRATES = {
+        (1, 1): [0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448],
+        (1, 2): [0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384],
+        (1, 3): [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+        (2, 1): [0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256],
+        (2, 2): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+        (2, 3): [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+    }
+    MP3_SAMPLE_RATES = {1: [44100, 48000, 32000], 2: [22050, 24000, 16000], 2.5: [11025, 12000, 8000]}
+    
+    def __init__(self, use_ffprobe: bool = True):
+        self.ffprobe = shutil.which('ffprobe') if use_ffprobe else None
+    
+    def probe(self, file_path: str) -> Optional[Dict[str, Any]]:
         """
-        Check if a file path matches a pattern.
+        Probe an audio file without decoding it.
         
         Args:
-            file_path: Lowercase file path to check
-            pattern: Lowercase pattern to match against
+            file_path: Path to audio file
             
         Returns:
-            True if the file matches the pattern
+            Dictionary with duration, sample_rate, channels and bits_per_sample,
+            or None if the header could not be read
         """
-        # Handle glob patterns
-        if '**' in pattern:
-            # Convert glob pattern to simple string matching
-            pattern_parts = pattern.split('**')
-            
-            for part in pattern_parts:
-                if part and part not in file_path:
-                    return False
-            
-            return True
-        elif '*' in pattern:
-            # Handle simple wildcards
-            import fnmatch
-            return fnmatch.fnmatch(file_path, pattern)
+        try:
+            with open(file_path, 'rb') as f:
+                header = f.read(self.HEADER_BYTES)
+                file_size = os.fstat(f.fileno()).st_size
+                
+                if header[:4] == b'RIFF' and header[8:12] == b'WAVE':
+                    result = self._probe_wav(header)
+                elif header[:4] == b'FORM' and header[8:12] in (b'AIFF', b'AIFC'):
+                    result = self._probe_aiff(header)
+                elif header[:4] == b'OggS':
+                    result = self._probe_ogg(f, header, file_size)
+                else:
+                    audio_start = self._skip_id3(header)
+                    if header[audio_start:audio_start + 4] == b'fLaC':
+                        result = self._probe_flac(header[audio_start:])
+                    else:
+                        result = self._probe_mp3(header, audio_start, file_size)
+        except (OSError, struct.error, ValueError, ZeroDivisionError):
+            result = None
+        
+        if result is None and self.ffprobe:
+            result = self._probe_ffprobe(file_path)
+        
+        if result and result['sample_rate'] > 0 and result['channels'] > 0 and result['duration'] >= 0:
+            return result
+        return None
+    
+    @staticmethod
+    def _result(duration: float, sample_rate: int, channels: int, bits_per_sample: int = 16) -> Dict[str, Any]:
+        return {
+            'duration': duration,
+            'sample_rate': int(sample_rate),
+            'channels': int(channels),
+            'bits_per_sample': bits_per_sample or 16
+        }
+    
+    def _probe_wav(self, header: bytes) -> Optional[Dict[str, Any]]:
+        """Read the fmt and data chunks of a RIFF/WAVE file."""
+        fmt = None
+        offset = 12
+        while offset + 8 <= len(header):
+            chunk_id, chunk_size = struct.unpack_from('<4sI', header, offset)
+            if chunk_id == b'fmt ':
+                fmt = struct.unpack_from('<HHIIHH', header, offset + 8)
+            elif chunk_id == b'data' and fmt:
+                _, channels, sample_rate, byte_rate, _, bits = fmt
+                return self._result(chunk_size / byte_rate, sample_rate, channels, bits)
+            # Chunks are padded to an even size
+            offset += 8 + chunk_size + (chunk_size & 1)
+        return None
+    
+    def _probe_aiff(self, header: bytes) -> Optional[Dict[str, Any]]:
+        """Read the COMM chunk of an AIFF/AIFC file."""
+        offset = 12
+        while offset + 8 <= len(header):
+            chunk_id, chunk_size = struct.unpack_from('>4sI', header, offset)
+            if chunk_id == b'COMM':
+                channels, frames, bits, exponent, mantissa = struct.unpack_from('>hIhHQ', header, offset + 8)
+                # 80-bit IEEE extended sample rate
+                sample_rate = mantissa * 2.0 ** ((exponent & 0x7FFF) - 16383 - 63)
+                return self._result(frames / sample_rate, round(sample_rate), channels, bits)
+            offset += 8 + chunk_size + (chunk_size & 1)
+        return None
+    
+    def _probe_flac(self, data: bytes) -> Optional[Dict[str, Any]]:
+        """Read the STREAMINFO block, which always comes first."""
+        if len(data) < 42 or data[4] & 0x7F != 0:
+            return None
+        packed = int.from_bytes(data[18:26], 'big')
+        sample_rate = packed >> 44
+        channels = ((packed >> 41) & 0x7) + 1
+        bits = ((packed >> 36) & 0x1F) + 1
+        total_samples = packed & 0xFFFFFFFFF
+        return self._result(total_samples / sample_rate, sample_rate, channels, bits)
+    
+    def _probe_ogg(self, f, header: bytes, file_size: int) -> Optional[Dict[str, Any]]:
+        """Read the codec identification packet, then the last page's granule position."""
+        payload = header[27 + header[26]:]
+        if payload[:7] == b'\x01vorbis':
+            channels, sample_rate = struct.unpack_from('<BI', payload, 11)
+            clock_rate, pre_skip = sample_rate, 0
+        elif payload[:8] == b'OpusHead':
+            channels, pre_skip, sample_rate = struct.unpack_from('<BHI', payload, 9)
+            # Opus granule positions always count 48 kHz samples
+            clock_rate = 48000
+            sample_rate = sample_rate or 48000
+        else:
+            return None
+        
+        f.seek(max(0, file_size - self.HEADER_BYTES))
+        tail = f.read()
+        last_page = tail.rfind(b'OggS')
+        if last_page < 0 or last_page + 14 > len(tail):
+            return None
+        granule = struct.unpack_from('<q', tail, last_page + 6)[0]
+        return self._result(max(granule - pre_skip, 0) / clock_rate, sample_rate, channels)
+    
+    @staticmethod
+    def _skip_id3(header: bytes) -> int:
+        """Return the offset just past an ID3v2 tag, or 0 without one."""
+        if header[:3] != b'ID3' or len(header) < 10:
+            return 0
+        size = (header[6] << 21) | (header[7] << 14) | (header[8] << 7) | header[9]
+        footer = 10 if header[5] & 0x10 else 0
+        return 10 + size + footer
+    
+    def _parse_mp3_frame(self, header: bytes, offset: int) -> Optional[Tuple[float, int, int, int, int, int]]:
+        """Decode an MPEG audio frame header into (version, layer, bitrate, sample_rate, channels, frame_length)."""
+        if offset + 4 > len(header):
+            return None
+        value = int.from_bytes(header[offset:offset + 4], 'big')
+        if value >> 21 != 0x7FF:
+            return None
+        version = {0: 2.5, 2: 2, 3: 1}.get((value >> 19) & 0x3)
+        layer = {1: 3, 2: 2, 3: 1}.get((value >> 17) & 0x3)
+        bitrate_index = (value >> 12) & 0xF
+        rate_index = (value >> 10) & 0x3
+        if version is None or layer is None or bitrate_index in (0, 15) or rate_index == 3:
+            return None
+        
+        bitrate = self.MP3_BITRATES[(1 if version == 1 else 2, layer)][bitrate_index] * 1000
+        sample_rate = self.MP3_SAMPLE_RATES[version][rate_index]
+        channels = 1 if (value >> 6) & 0x3 == 3 else 2
+        padding = (value >> 9) & 0x1
+        if layer == 1:
+            frame_length = (12 * bitrate // sample_rate + padding) * 4
         else:
-            # Direct string matching
-            return pattern in file_path
+            coefficient = 72 if layer == 3 and version != 1 else 144
+            frame_length = coefficient * bitrate // sample_rate + padding
+        return version, layer, bitrate, sample_rate, channels, frame_length
+    
+    def _probe_mp3(self, header: bytes, audio_start: int, file_size: int) -> Optional[Dict[str, Any]]:
+        """Find the first MPEG frame and read a Xing/Info/VBRI frame count, or assume constant bitrate."""
+        if audio_start >= len(header):
+            return None
+        
+        frame = None
+        offset = header.find(b'\xff', audio_start)
+        while 0 <= offset < len(header) - 4:
+            frame = self._parse_mp3_frame(header, offset)
+            # Require a second frame header right behind the first to rule out false syncs
+            if frame and (offset + frame[5] + 4 > len(header) or self._parse_mp3_frame(header, offset + frame[5])):
+                break
+            frame = None
+            offset = header.find(b'\xff', offset + 1)
+        if frame is None:
+            return None
+        
+        version, layer, bitrate, sample_rate, channels, _ = frame
+        samples_per_frame = 384 if layer == 1 else 1152 if layer == 2 or version == 1 else 576
+        
+        # VBR files carry the total frame count in their first frame
+        side_info = (32 if channels == 2 else 17) if version == 1 else (17 if channels == 2 else 9)
+        frame_count = None
+        xing = offset + 4 + side_info
+        if header[xing:xing + 4] in (b'Xing', b'Info') and xing + 12 <= len(header):
+            if struct.unpack_from('>I', header, xing + 4)[0] & 0x1:
+                frame_count = struct.unpack_from('>I', header, xing + 8)[0]
+        elif header[offset + 36:offset + 40] == b'VBRI' and offset + 54 <= len(header):
+            frame_count = struct.unpack_from('>I', header, offset + 50)[0]
+        
+        if frame_count:
+            duration = frame_count * samples_per_frame / sample_rate
+        else:
+            duration = (file_size - offset) * 8 / bitrate
+        return self._result(duration, sample_rate, channels)
+    
+    def _probe_ffprobe(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Ask ffprobe for the first audio stream's properties."""
+        try:
+            completed = subprocess.run(
+                [self.ffprobe, '-v', 'error', '-select_streams', 'a:0',
+                 '-show_entries', 'stream=sample_rate,channels,bits_per_sample:format=duration',
+                 '-of', 'json', file_path],
+                capture_output=True, timeout=30, check=True
+            )
+            data = json.loads(completed.stdout)
+            stream = data['streams'][0]
+            return self._result(
+                float(data['format']['duration']),
+                int(stream['sample_rate']),
+                int(stream['channels']),
+                int(stream.get('bits_per_sample') or 16)
+            )
+        except (OSError, subprocess.SubprocessError, ValueError, KeyError, IndexError):
+            return None
 
 class AudioValidator:
     """Advanced audio file validation with detailed analysis using pydub."""
     
-    def __init__(self, calculate_hashes: bool = True):
+    def __init__(self, calculate_hashes: bool = True, probe_headers: bool = True):
         self.calculate_hashes = calculate_hashes
+        self.probe = AudioHeaderProbe() if probe_headers else None
     
     def validate_audio_file(self, file_path: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
         """
-        Validate audio file and extract detailed information using pydub.
+        Validate audio file and extract detailed information.
+        
+        Reads the file header when possible and only decodes the file with
+        pydub when the header cannot be parsed.
         
         Args:
             file_path: Path to audio file
@@ -281,64 +710,224 @@ class AudioValidator:
         Returns:
             Tuple of (is_valid, file_info)
         """
+        file_info = self.probe_audio_file(file_path)
+        if file_info is not None:
+            return True, file_info
+        
+        audio, file_info = self.load_audio_file(file_path)
+        return audio is not None, file_info
+    
+    def probe_audio_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract file information from the header alone, without decoding.
+        
+        Args:
+            file_path: Path to audio file
+            
+        Returns:
+            file_info, or None if probing is disabled or the header could not be read
+        """
+        if self.probe is None or not os.path.isfile(file_path):
+            return None
+        
+        file_size = os.path.getsize(file_path)
+        if file_size == 0:
+            return None
+        
+        header_info = self.probe.probe(file_path)
+        if header_info is None:
+            return None
+        
+        return self._build_file_info(
+            file_path, file_size, header_info['duration'], header_info['sample_rate'],
+            header_info['channels'], header_info['bits_per_sample'] // 8
+        )
+    
+    def load_audio_file(self, file_path: str) -> Tuple[Optional[AudioSegment], Optional[Dict[str, Any]]]:
+        """
+        Decode and validate an audio file, returning the decoded audio with its information.
+        
+        The decoded segment is handed back so conversion can reuse it instead of
+        decoding the file a second time.
+        
+        Args:
+            file_path: Path to audio file
+            
+        Returns:
+            Tuple of (audio, file_info), or (None, None) if the file is invalid
+        """
         try:
             # Check if file exists
             if not os.path.exists(file_path):
-                return False, None
+                return None, None
             
             if not os.path.isfile(file_path):
-                return False, None
+                return None, None
             
             # Check file size
             file_size = os.path.getsize(file_path)
             
             if file_size == 0:
-                return False, None
-            
-            # Check file extension
-            file_ext = Path(file_path).suffix.lower()
+                return None, None
             
             # Load audio file with pydub
             audio = AudioSegment.from_file(file_path)
             
-            # Extract audio properties
-            duration = len(audio) / 1000.0  # Convert to seconds
-            bitrate = audio.frame_rate * audio.sample_width * audio.channels * 8
-            sample_rate = audio.frame_rate
-            channels = audio.channels
-            
-            # Calculate hash if requested
-            file_hash = None
-            if self.calculate_hashes:
-                file_hash = self._calculate_file_hash(file_path)
-            
-            # Build file information
-            file_info = {
-                'path': file_path,
-                'format': file_ext,
-                'duration': duration,
-                'bitrate': bitrate,
-                'sample_rate': sample_rate,
-                'channels': channels,
-                'size': file_size,
-                'hash': file_hash
-            }
+            file_info = self._build_file_info(
+                file_path, file_size, len(audio) / 1000.0, audio.frame_rate, audio.channels, audio.sample_width
+            )
             
-            return True, file_info
+            return audio, file_info
             
         except Exception:
-            return False, None
+            return None, None
+    
+    def _build_file_info(self, file_path: str, file_size: int, duration: float, sample_rate: int,
+                         channels: int, sample_width: int) -> Dict[str, Any]:
+        """Build the file information shared by header probing and full decoding."""
+        # Calculate hash if requested
+        file_hash = None
+        if self.calculate_hashes:
+            file_hash = self._calculate_file_hash(file_path)
+        
+        return {
+            'path': file_path,
+            'format': Path(file_path).suffix.lower(),
+            'duration': duration,
+            'bitrate': sample_rate * sample_width * channels * 8,
+            'sample_rate': sample_rate,
+            'channels': channels,
+            'size': file_size,
+            'mtime_ns': os.stat(file_path).st_mtime_ns,
+            'hash': file_hash
+        }
     
     def _calculate_file_hash(self, file_path: str) -> str:
         """Calculate SHA-256 hash of file."""
+        return file_hasher.hash_file(file_path)
+
+def link_or_copy(source: str, target: str, use_hardlink: bool = False) -> None:
+    """Place a copy of source at target, as a hardlink when requested and possible."""
+    if os.path.exists(target):
+        os.remove(target)
+    if use_hardlink:
         try:
-            hash_sha256 = hashlib.sha256()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
-        except Exception:
-            return ""
+            os.link(source, target)
+            return
+        except OSError:
+            # Different drive or no link support
+            pass
+    shutil.copyfile(source, target)
+
+class ConvertedOutputStore:
+    """
+    Persistent content-addressed store of encoded outputs.
+    
+    Entries are keyed by the SHA-256 of the input file together with the
+    effective conversion settings, so a renamed, moved or re-extracted file
+    still hits, while any settings change misses. The store lives outside
+    Regolith's temporary directory and is trimmed least recently used first.
+    """
+    
+    # Bump when the conversion pipeline changes so older outputs are not reused
+    VERSION = 1
+    
+    def __init__(self, cache_dir: str, max_bytes: int, use_hardlinks: bool = False):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.use_hardlinks = use_hardlinks
+    
+    def make_key(self, file_hash: str, effective_settings: Dict[str, Any]) -> str:
+        """Combine the input hash and the effective settings into a store key."""
+        settings_json = json.dumps(dict(effective_settings, store_version=self.VERSION), sort_keys=True)
+        return hashlib.sha256(f"{file_hash}:{settings_json}".encode('utf-8')).hexdigest()
+    
+    def _entry_path(self, key: str, output_format: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}{output_format}")
+    
+    def fetch(self, key: str, output_file: str) -> bool:
+        """Place a stored output at output_file; returns False on a miss."""
+        entry_path = self._entry_path(key, Path(output_file).suffix)
+        if not os.path.isfile(entry_path):
+            return False
+        
+        try:
+            link_or_copy(entry_path, output_file, self.use_hardlinks)
+            # The modification time is the LRU clock
+            os.utime(entry_path)
+            return True
+        except OSError as e:
+            logger.debug(f"Output store fetch failed for {output_file}: {e}")
+            return False
+    
+    def load_metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load a small JSON document stored under key, such as a loudness analysis."""
+        entry_path = self._entry_path(key, '.json')
+        try:
+            with open(entry_path, 'r') as f:
+                metadata = json.load(f)
+            os.utime(entry_path)
+            return metadata
+        except (OSError, json.JSONDecodeError):
+            return None
+    
+    def store_metadata(self, key: str, metadata: Dict[str, Any]) -> None:
+        """Store a small JSON document under key."""
+        entry_path = self._entry_path(key, '.json')
+        temp_path = f"{entry_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            with open(temp_path, 'w') as f:
+                json.dump(metadata, f)
+            os.replace(temp_path, entry_path)
+        except OSError as e:
+            logger.debug(f"Output store write failed for {key}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def store(self, key: str, output_file: str) -> None:
+        """Add an encoded output to the store."""
+        entry_path = self._entry_path(key, Path(output_file).suffix)
+        temp_path = f"{entry_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            shutil.copyfile(output_file, temp_path)
+            # Atomic, so concurrent workers never see a partial entry
+            os.replace(temp_path, entry_path)
+        except OSError as e:
+            logger.debug(f"Output store write failed for {output_file}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def evict(self) -> Tuple[int, int]:
+        """Remove least recently used entries until the store fits max_bytes.
+        
+        Returns:
+            Tuple of (entries_removed, bytes_removed)
+        """
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, os.path.join(root, name)))
+        
+        total = sum(size for _, size, _ in entries)
+        removed = removed_bytes = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+            removed_bytes += size
+        
+        return removed, removed_bytes
 
 class AudioConverter:
     """Advanced audio conversion with sophisticated processing using pydub."""
@@ -347,7 +936,26 @@ class AudioConverter:
         self.settings = settings
         self.processor = AudioProcessor(settings)
         self.discoverer = AudioFileDiscoverer(settings.get('supported_formats', []))
-        self.validator = AudioValidator(settings.get('calculate_hashes', True))
+        self.validator = AudioValidator(settings.get('calculate_hashes', True), settings.get('probe_headers', True))
+        
+        # Loudness normalization needs numpy; without it every path falls back to peak normalization
+        self.normalize_mode = settings.get('normalize_mode', 'peak')
+        if self.normalize_mode == 'loudness' and not NUMPY_AVAILABLE:
+            logger.warning("numpy is not available; using peak normalization. Install with: pip install numpy")
+            self.normalize_mode = 'peak'
+        
+        # Tracks at least this long are streamed through ffmpeg instead of loaded into memory
+        self.streaming_min_duration = settings.get('streaming_min_duration', 120)
+        self.ffmpeg = shutil.which(AudioSegment.converter)
+        
+        # Persistent store of encoded outputs, shared across runs and projects
+        self.output_store = None
+        if settings.get('enable_cache', True):
+            self.output_store = ConvertedOutputStore(
+                settings.get('output_cache_dir') or get_output_cache_dir(),
+                int(settings.get('output_cache_max_mb', 512) * 1024 * 1024),
+                settings.get('output_cache_hardlinks', False)
+            )
         
         # Quality presets for different audio types
         self.quality_presets = {
@@ -358,17 +966,33 @@ class AudioConverter:
             AudioType.VOICE: 7,
             AudioType.UNKNOWN: 6
         }
+        
+        # Silence trimming per audio type; None leaves the type untouched
+        # (music and ambient beds often rely on their exact length to loop or sync)
+        self.trim_presets = {
+            AudioType.MUSIC: None,
+            AudioType.EFFECT: {'threshold_db': -50.0, 'padding_ms': 20},
+            AudioType.AMBIENT: None,
+            AudioType.UI: {'threshold_db': -45.0, 'padding_ms': 10},
+            AudioType.VOICE: {'threshold_db': -55.0, 'padding_ms': 50},
+            AudioType.UNKNOWN: {'threshold_db': -60.0, 'padding_ms': 50}
+        }
     
     def detect_audio_type(self, file_path: str) -> AudioType:
-        """Detect audio type based on file path and content."""
-        file_path_lower = file_path.lower()
+        """
+        Detect audio type from the file's path below the source directory it was found in.
         
-        for audio_type, patterns in self.discoverer.audio_patterns.items():
-            for pattern in patterns:
-                if any(keyword in file_path_lower for keyword in pattern.split('/')):
-                    return audio_type
+        Uses the same compiled patterns as discovery, so a file gets the same type
+        whether or not source_dirs are configured.
+        """
+        absolute_path = os.path.abspath(file_path)
+        for source_dir in self.settings.get('source_dirs') or DEFAULT_SOURCE_DIRS:
+            source_prefix = os.path.join(os.path.abspath(source_dir), '')
+            if absolute_path.startswith(source_prefix):
+                return self.discoverer.categorize_path(absolute_path[len(source_prefix):])
         
-        return AudioType.UNKNOWN
+        # Outside every source directory: match the path as given
+        return self.discoverer.categorize_path(file_path)
     
     def get_optimized_settings(self, audio_type: AudioType, file_info: Dict[str, Any]) -> Dict[str, Any]:
         """Get optimized conversion settings for audio type and file characteristics."""
@@ -396,9 +1020,24 @@ class AudioConverter:
             'quality': quality,
             'sample_rate': sample_rate,
             'max_bitrate': max_bitrate,
-            'channels': min(file_info['channels'], 2)  # Stereo max
+            'channels': min(file_info['channels'], 2),  # Stereo max
+            'trim': self._get_trim_settings(audio_type)
         }
     
+    def _get_trim_settings(self, audio_type: AudioType) -> Optional[Dict[str, Any]]:
+        """Silence trim threshold and padding for an audio type, or None when it is not trimmed."""
+        if not self.settings.get('trim_silence', False):
+            return None
+        
+        preset = self.trim_presets.get(audio_type)
+        overrides = self.settings.get('trim_presets', {}).get(audio_type.value, {})
+        if overrides is None or (preset is None and not overrides):
+            return None
+        
+        trim = dict(preset or {'threshold_db': -50.0, 'padding_ms': 20})
+        trim.update(overrides)
+        return trim
+    
     def convert_audio_file_advanced(self, file_path: str, audio_type: AudioType) -> Tuple[bool, str, Dict[str, Any]]:
         """
         Convert audio file with advanced processing using pydub.
@@ -411,11 +1050,16 @@ class AudioConverter:
             Tuple of (success, message, conversion_info)
         """
         try:
-            # Validate file
-            is_valid, file_info = self.validator.validate_audio_file(file_path)
+            # Validate from the header; the file is decoded later, and only if it is actually encoded
+            audio = None
+            file_info = self.validator.probe_audio_file(file_path)
             
-            if not is_valid:
-                return False, f"Invalid audio file: {file_path}", {}
+            if file_info is None:
+                # No readable header: validate by decoding, and reuse the decoded audio for conversion
+                audio, file_info = self.validator.load_audio_file(file_path)
+                
+                if audio is None:
+                    return False, f"Invalid audio file: {file_path}", {}
             
             # Check if file is already in acceptable format (WAV or OGG)
             input_ext = Path(file_path).suffix.lower()
@@ -434,26 +1078,16 @@ class AudioConverter:
             
             # Check if conversion is needed
             if self._should_skip_conversion(file_path, output_file, file_info):
-                return True, f"Skipped (up-to-date): {file_path}", {'skipped': True}
+                return True, f"Skipped (up-to-date): {file_path}", {'skipped': True, 'reason': 'up_to_date',
+                                                                      'output_file': output_file}
             
-            # Load audio with pydub
-            audio = AudioSegment.from_file(file_path)
+            # Cutting trailing silence would make ffmpeg buffer the whole track, so streamed tracks
+            # are not trimmed and their settings (and output store key) say so
+            stream = audio is None and self._should_stream(file_info)
+            if stream and conversion_settings.get('trim'):
+                conversion_settings = dict(conversion_settings, trim=None)
             
-            # Apply optimizations
-            audio = self._apply_optimizations(audio, conversion_settings)
-            
-            # Export to ogg format
             export_params = self._get_export_params(conversion_settings)
-            
-            audio.export(
-                output_file,
-                format="ogg",
-                **export_params
-            )
-            
-            # Always delete the original file after successful conversion, just like Blockbench filter
-            os.remove(file_path)
-            
             conversion_info = {
                 'input_info': file_info,
                 'output_file': output_file,
@@ -461,13 +1095,80 @@ class AudioConverter:
                 'audio_type': audio_type.value
             }
             
+            # Reuse a previously encoded output of the same content and settings
+            store_key = None
+            if self.output_store:
+                file_hash = file_info.get('hash') or self.validator._calculate_file_hash(file_path)
+                if file_hash:
+                    store_key = self.output_store.make_key(
+                        file_hash, self._effective_settings(conversion_settings, export_params))
+                    if self.output_store.fetch(store_key, output_file):
+                        os.remove(file_path)
+                        conversion_info['cached'] = True
+                        return True, f"Reused cached output for {audio_type.value}: {file_path}", conversion_info
+            
+            if stream:
+                # Constant memory regardless of track length
+                self._stream_convert(file_path, output_file, conversion_settings, export_params)
+            else:
+                if audio is None:
+                    audio = AudioSegment.from_file(file_path)
+                
+                # Apply optimizations
+                input_ms = len(audio)
+                audio = self._apply_optimizations(audio, conversion_settings, file_path)
+                
+                # Only trimming changes the length; estimate the encoded bytes it saved
+                trimmed_ms = input_ms - len(audio)
+                if trimmed_ms > 0:
+                    conversion_info['trimmed_ms'] = trimmed_ms
+                    conversion_info['trimmed_bytes'] = int(
+                        trimmed_ms / 1000 * int(export_params['bitrate'].rstrip('k')) * 1000 / 8)
+                
+                # Export to ogg format
+                audio.export(
+                    output_file,
+                    format="ogg",
+                    **export_params
+                )
+            
+            if store_key:
+                self.output_store.store(store_key, output_file)
+            
+            # Always delete the original file after successful conversion, just like Blockbench filter
+            os.remove(file_path)
+            
             return True, f"Converted {audio_type.value}: {file_path}", conversion_info
                 
         except Exception as e:
             return False, f"Error converting {file_path}: {str(e)}", {}
     
-    def _apply_optimizations(self, audio: AudioSegment, settings: Dict[str, Any]) -> AudioSegment:
+    def _effective_settings(self, conversion_settings: Dict[str, Any], export_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Everything that influences the encoded output, used to key the output store."""
+        return {
+            'conversion': conversion_settings,
+            'export': export_params,
+            'output_format': self.processor.output_format,
+            'normalize_audio': self.settings.get('normalize_audio', False),
+            'normalization': self._normalization_settings() if self.settings.get('normalize_audio', False) else None,
+        }
+    
+    def _normalization_settings(self) -> Dict[str, Any]:
+        """Normalization mode and targets, as resolved for this run."""
+        mode = self.normalize_mode
+        return {
+            'mode': mode,
+            'target_loudness': self.settings.get('target_loudness', -16.0) if mode == 'loudness' else None,
+            'max_peak': self.settings.get('max_peak', -1.0) if mode == 'loudness' else None,
+        }
+    
+    def _apply_optimizations(self, audio: AudioSegment, settings: Dict[str, Any],
+                             file_path: Optional[str] = None) -> AudioSegment:
         """Apply optimizations to audio segment."""
+        # Trim first so the rest of the pipeline processes less audio
+        if settings.get('trim'):
+            audio = self._trim_silence(audio, settings['trim'])
+        
         # Sample rate conversion
         if settings.get('sample_rate') and audio.frame_rate != settings['sample_rate']:
             audio = audio.set_frame_rate(settings['sample_rate'])
@@ -481,10 +1182,139 @@ class AudioConverter:
         
         # Normalize audio if needed
         if self.settings.get('normalize_audio', False):
-            audio = audio.normalize()
+            audio = self._normalize(audio, file_path, settings.get('trim'))
         
         return audio
     
+    def _trim_silence(self, audio: AudioSegment, trim: Dict[str, Any]) -> AudioSegment:
+        """Cut leading and trailing silence below the threshold, keeping some padding."""
+        padding_frames = int(audio.frame_rate * trim.get('padding_ms', 0) / 1000)
+        
+        if NUMPY_AVAILABLE:
+            start, end = find_sound_bounds(audio, trim['threshold_db'])
+        else:
+            # pydub scans 10 ms chunks in Python; slower but equivalent within a chunk
+            from pydub.silence import detect_leading_silence
+            lead_ms = detect_leading_silence(audio, silence_threshold=trim['threshold_db'])
+            if lead_ms >= len(audio):
+                return audio
+            trail_ms = detect_leading_silence(audio.reverse(), silence_threshold=trim['threshold_db'])
+            start = int(lead_ms * audio.frame_rate / 1000)
+            end = int(audio.frame_count()) - int(trail_ms * audio.frame_rate / 1000)
+        
+        if end <= start:
+            # Entirely silent; leave it alone rather than produce an empty sound
+            return audio
+        
+        start = max(start - padding_frames, 0)
+        end = min(end + padding_frames, int(audio.frame_count()))
+        if start == 0 and end == int(audio.frame_count()):
+            return audio
+        return audio._spawn(audio.raw_data[start * audio.frame_width:end * audio.frame_width])
+    
+    def _normalize(self, audio: AudioSegment, file_path: Optional[str],
+                   trim: Optional[Dict[str, Any]] = None) -> AudioSegment:
+        """Normalize to a loudness target with numpy, or peak-normalize with pydub."""
+        normalization = self._normalization_settings()
+        if normalization['mode'] != 'loudness':
+            return audio.normalize()
+        
+        # The analysis depends only on the content, the trim applied to it, the rate and the channel count
+        analysis, analysis_key = None, None
+        file_hash = file_hasher.hash_file(file_path) if file_path else ""
+        if self.output_store and file_hash:
+            analysis_key = self.output_store.make_key(file_hash, {
+                'analysis': 'loudness', 'trim': trim, 'frame_rate': audio.frame_rate, 'channels': audio.channels})
+            analysis = self.output_store.load_metadata(analysis_key)
+        if analysis is None:
+            analysis = analyze_loudness(audio)
+            if analysis_key:
+                self.output_store.store_metadata(analysis_key, analysis)
+        
+        gain = normalization_gain(analysis['loudness'], analysis['peak'],
+                                  normalization['target_loudness'], normalization['max_peak'])
+        logger.debug(f"Loudness {analysis['loudness']:.1f} dBFS, peak {analysis['peak']:.1f} dBFS, gain {gain:+.1f} dB")
+        return apply_gain(audio, gain) if abs(gain) >= 0.01 else audio
+    
+    def _should_stream(self, file_info: Dict[str, Any]) -> bool:
+        """Check whether a track is long enough to stream, and ffmpeg is there to stream it."""
+        if self.streaming_min_duration is None or file_info['duration'] < self.streaming_min_duration:
+            return False
+        if not self.ffmpeg:
+            logger.debug(f"ffmpeg not found; loading {file_info['path']} into memory")
+            return False
+        return True
+    
+    def _stream_convert(self, file_path: str, output_file: str, settings: Dict[str, Any],
+                        export_params: Dict[str, Any]) -> None:
+        """
+        Decode, resample and encode a file in one ffmpeg process, copying its output in fixed-size chunks.
+        
+        ffmpeg reads the input itself (containers such as m4a need to seek) and
+        streams the encoded ogg through its stdout pipe into a partial file, which
+        replaces the output only once encoding succeeded.
+        
+        Args:
+            file_path: Path to input audio file
+            output_file: Path of the ogg file to write
+            settings: Optimized conversion settings
+            export_params: Export parameters from _get_export_params
+        """
+        command = [self.ffmpeg, '-y', '-v', 'error', '-nostdin', '-i', file_path, '-vn']
+        if settings.get('sample_rate'):
+            command += ['-ar', str(settings['sample_rate'])]
+        if settings.get('channels'):
+            command += ['-ac', str(settings['channels'])]
+        if self.settings.get('normalize_audio', False):
+            command += ['-af', f"volume={self._measure_normalize_gain(file_path):.2f}dB"]
+        command += ['-c:a', 'libvorbis', '-b:a', export_params['bitrate'], '-f', 'ogg', 'pipe:1']
+        
+        partial_file = f"{output_file}.part"
+        try:
+            with tempfile.TemporaryFile() as stderr, open(partial_file, 'wb') as output:
+                process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr, stdin=subprocess.DEVNULL)
+                try:
+                    for chunk in iter(lambda: process.stdout.read(STREAM_CHUNK_SIZE), b''):
+                        output.write(chunk)
+                finally:
+                    process.stdout.close()
+                    return_code = process.wait()
+                
+                if return_code != 0:
+                    stderr.seek(0)
+                    details = stderr.read().decode('utf-8', errors='replace').strip().splitlines()
+                    raise RuntimeError(f"ffmpeg exited with {return_code}: {details[-1] if details else 'no output'}")
+            
+            os.replace(partial_file, output_file)
+        finally:
+            if os.path.exists(partial_file):
+                os.remove(partial_file)
+    
+    def _measure_normalize_gain(self, file_path: str) -> float:
+        """
+        Measure the normalization gain with ffmpeg's volumedetect.
+        
+        Peak mode matches pydub's normalize() headroom; loudness mode uses the
+        ungated mean volume against the same targets as the numpy analysis.
+        """
+        completed = subprocess.run(
+            [self.ffmpeg, '-v', 'info', '-nostdin', '-i', file_path, '-vn', '-af', 'volumedetect', '-f', 'null', '-'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True
+        )
+        volumes = {}
+        for line in completed.stderr.decode('utf-8', errors='replace').splitlines():
+            for name in ('mean_volume', 'max_volume'):
+                if f'{name}:' in line:
+                    volumes[name] = float(line.split(f'{name}:')[1].split()[0])
+        
+        if 'max_volume' not in volumes:
+            return 0.0
+        normalization = self._normalization_settings()
+        if normalization['mode'] == 'loudness' and 'mean_volume' in volumes:
+            return normalization_gain(volumes['mean_volume'], volumes['max_volume'],
+                                      normalization['target_loudness'], normalization['max_peak'])
+        return -volumes['max_volume'] - 0.1
+    
     def _get_export_params(self, settings: Dict[str, Any]) -> Dict[str, Any]:
         """Get export parameters for ogg format."""
         params = {}
@@ -544,6 +1374,119 @@ class AudioConverter:
         
         return False
 
+# Converter owned by each pool worker process, built once by _init_worker
+_worker_converter: Optional[AudioConverter] = None
+
+def _init_worker(settings: Dict[str, Any]) -> None:
+    """Build the converter once per worker process."""
+    global _worker_converter
+    _worker_converter = AudioConverter(settings)
+
+def _convert_in_worker(file_path: str, audio_type: AudioType,
+                       hash_entry: Optional[Dict[str, Any]]) -> Tuple[bool, str, Dict[str, Any]]:
+    """Convert one file inside a pool worker, reusing a hash the main process already computed."""
+    file_hasher.remember(file_path, hash_entry)
+    return _worker_converter.convert_audio_file_advanced(file_path, audio_type)
+
+def convert_files_parallel(converter: AudioConverter, jobs: Iterable[Tuple[str, AudioType]]
+                           ) -> Iterator[Tuple[str, AudioType, bool, str, Dict[str, Any]]]:
+    """
+    Convert files on a process pool sized by max_workers, enforcing the per-file timeout.
+    
+    Jobs are pulled from the iterable only as workers become idle, so a discovery
+    generator can keep scanning while the first files convert. At most one job
+    per idle worker is in flight, so a job's deadline starts when a worker picks
+    it up. A job past its deadline is reported as failed and its worker is written
+    off; when every worker is stuck the pool is terminated and replaced. Results
+    are yielded in input order no matter which worker finishes first.
+    
+    Args:
+        converter: Converter whose settings are used to build the workers
+        jobs: (file_path, audio_type) pairs in input order
+        
+    Yields:
+        Tuples of (file_path, audio_type, success, message, conversion_info)
+    """
+    max_workers = max(1, converter.processor.max_workers or 1)
+    timeout = converter.processor.timeout
+    
+    def new_pool():
+        return multiprocessing.Pool(max_workers, initializer=_init_worker, initargs=(converter.settings,))
+    
+    # Pool callbacks run on the pool's result thread; they only hand results to this queue
+    finished = queue.Queue()
+    pending_jobs = iter(jobs)
+    pulled: Dict[int, Tuple[str, AudioType]] = {}
+    results: Dict[int, Tuple[bool, str, Dict[str, Any]]] = {}
+    in_flight: Dict[int, float] = {}
+    timed_out = set()
+    stuck_pools = []
+    next_job = next_result = 0
+    capacity = max_workers
+    exhausted = False
+    pool = None
+    
+    try:
+        while not exhausted or next_result < next_job:
+            # Keep every idle worker busy
+            while not exhausted and len(in_flight) < capacity:
+                job = next(pending_jobs, None)
+                if job is None:
+                    exhausted = True
+                    break
+                
+                if pool is None:
+                    pool = new_pool()
+                index = next_job
+                file_path, audio_type = pulled[index] = job
+                pool.apply_async(
+                    _convert_in_worker, (file_path, audio_type, file_hasher.known_entry(file_path)),
+                    callback=lambda result, index=index: finished.put((index, result)),
+                    error_callback=lambda error, index=index, file_path=file_path: finished.put(
+                        (index, (False, f"Error converting {file_path}: {error}", {})))
+                )
+                in_flight[index] = time.monotonic() + timeout if timeout else float('inf')
+                next_job += 1
+            
+            if in_flight:
+                # Wait for the next result, or until the earliest deadline passes
+                wait = min(in_flight.values()) - time.monotonic()
+                try:
+                    index, result = finished.get(timeout=max(wait, 0) if wait != float('inf') else None)
+                    if index in timed_out:
+                        # A late finish frees the worker that was written off
+                        timed_out.discard(index)
+                        capacity += 1
+                    elif index in in_flight:
+                        del in_flight[index]
+                        results[index] = result
+                except queue.Empty:
+                    now = time.monotonic()
+                    for index, deadline in list(in_flight.items()):
+                        if deadline <= now:
+                            del in_flight[index]
+                            timed_out.add(index)
+                            capacity -= 1
+                            results[index] = (False, f"Conversion timed out after {timeout}s: {pulled[index][0]}",
+                                              {'timed_out': True})
+                    
+                    if capacity <= 0:
+                        # Every worker is stuck; replace the pool rather than wait on them
+                        pool.terminate()
+                        stuck_pools.append(pool)
+                        pool = new_pool()
+                        timed_out.clear()
+                        capacity = max_workers
+            
+            # Yield the contiguous prefix of finished jobs so output stays in input order
+            while next_result in results:
+                yield pulled.pop(next_result) + results.pop(next_result)
+                next_result += 1
+    finally:
+        for used_pool in stuck_pools + ([pool] if pool else []):
+            used_pool.terminate()
+            used_pool.join()
+
 def parse_settings() -> Dict[str, Any]:
     """Parse settings from command line arguments."""
     try:
@@ -566,14 +1509,12 @@ def get_regolith_environment() -> Dict[str, str]:
 
 def get_file_hash(file_path: str) -> str:
     """Calculate SHA-256 hash of a file."""
-    try:
-        hash_sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()
-    except Exception:
-        return ""
+    return file_hasher.hash_file(file_path)
+
+def get_output_cache_dir() -> str:
+    """Get the output store directory, kept in the project's Regolith cache so it survives runs."""
+    root_dir = os.environ.get('ROOT_DIR') or '.'
+    return os.path.join(root_dir, ".regolith", "cache", "audio_converter")
 
 def get_cache_file_path() -> str:
     """Get the path to the cache file."""
@@ -582,20 +1523,25 @@ def get_cache_file_path() -> str:
         os.makedirs(cache_dir, exist_ok=True)
     return os.path.join(cache_dir, "audio_converter_cache.json")
 
-def load_cache() -> Dict[str, str]:
-    """Load the conversion cache."""
+def load_cache() -> Dict[str, Dict[str, Any]]:
+    """Load the conversion cache of {path: {'hash', 'size', 'mtime_ns'}} entries."""
     cache_file = get_cache_file_path()
     
     if os.path.exists(cache_file):
         try:
             with open(cache_file, 'r') as f:
-                return json.load(f)
+                cache = json.load(f)
+            # Older caches stored the bare hash; without a stat those entries are always hashed
+            return {
+                path: entry if isinstance(entry, dict) else {'hash': entry}
+                for path, entry in cache.items()
+            }
         except Exception:
             pass
     
     return {}
 
-def save_cache(cache: Dict[str, str]) -> None:
+def save_cache(cache: Dict[str, Dict[str, Any]]) -> None:
     """Save the conversion cache."""
     cache_file = get_cache_file_path()
     
@@ -605,13 +1551,12 @@ def save_cache(cache: Dict[str, str]) -> None:
     except Exception:
         pass
 
-def is_file_unchanged(file_path: str, expected_hash: str) -> bool:
-    """Check if a file has changed by comparing its hash."""
+def is_file_unchanged(file_path: str, cache_entry: Dict[str, Any]) -> bool:
+    """Check if a file has changed, by its size and mtime first and by its hash only when those differ."""
     if not os.path.exists(file_path):
         return False
     
-    current_hash = get_file_hash(file_path)
-    return current_hash == expected_hash
+    return file_hasher.is_unchanged(file_path, cache_entry)
 
 def main():
     """Main execution function."""
@@ -642,27 +1587,18 @@ def main():
         else:
             cache = {}
         
-        # Blockbench-style file discovery
+        # Blockbench-style file discovery, streamed so conversion starts while scanning continues
         source_dirs = settings.get('source_dirs')
         
         if not source_dirs:
             logger.info("Discovering audio files...")
-            audio_files = find_audio_files()
-            logger.info(f"Found {len(audio_files)} audio files")
-            
-            if not audio_files:
-                logger.warning("No audio files found to convert")
-                return
-            
-            # Convert the file list to a simple categorization
-            categorized_files = {AudioType.UNKNOWN: audio_files}
+            discovered = (
+                (file_path, AudioType.UNKNOWN)
+                for file_path in iter_audio_files(DEFAULT_SOURCE_DIRS, DEFAULT_AUDIO_FORMATS)
+            )
         else:
             logger.info(f"Using specified directories: {source_dirs}")
-            categorized_files = converter.discoverer.discover_audio_files(source_dirs)
-        
-        if not any(files for files in categorized_files.values()):
-            logger.warning("No audio files found to convert")
-            return
+            discovered = converter.discoverer.iter_audio_files(source_dirs)
         
         # Process files by type
         total_stats = {
@@ -671,63 +1607,150 @@ def main():
             'failed': 0,
             'skipped': 0,
             'cached': 0,
+            'deduplicated': 0,
+            'trimmed': 0,
+            'trimmed_bytes': 0,
             'by_type': {}
         }
         
-        # Process each audio type
-        for audio_type, files in categorized_files.items():
-            if not files:
-                continue
-            
-            logger.info(f"Processing {audio_type.value} files: {len(files)}")
-            total_stats['total'] += len(files)
-            total_stats['by_type'][audio_type.value] = {
-                'total': len(files),
+        def count_file(audio_type: AudioType) -> Dict[str, int]:
+            type_stats = total_stats['by_type'].setdefault(audio_type.value, {
+                'total': 0,
                 'successful': 0,
                 'failed': 0,
                 'skipped': 0,
-                'cached': 0
-            }
+                'cached': 0,
+                'deduplicated': 0
+            })
+            total_stats['total'] += 1
+            type_stats['total'] += 1
+            return type_stats
+        
+        # Identical sources are encoded once; their duplicates wait for that output
+        deduplicate = settings.get('deduplicate', True)
+        use_hardlinks = settings.get('output_cache_hardlinks', False)
+        primaries: Dict[Tuple[str, AudioType], str] = {}
+        duplicates: Dict[str, List[Tuple[str, AudioType]]] = {}
+        primary_results: Dict[str, Tuple[bool, Dict[str, Any]]] = {}
+        
+        def place_duplicate(file_path: str, audio_type: AudioType, primary_path: str) -> None:
+            """Give a duplicate source the output of the identical file that was encoded."""
+            success, conversion_info = primary_results[primary_path]
+            type_stats = total_stats['by_type'][audio_type.value]
+            output_file = converter._generate_output_path(file_path, audio_type)
             
-            # Convert files of this type
-            for file_path in files:
-                # Check cache first
+            # An up-to-date primary says nothing about the duplicate's own output, which may be missing
+            if success and conversion_info.get('skipped') and (
+                    conversion_info.get('reason') == 'acceptable_format'
+                    or converter._should_skip_conversion(file_path, output_file, {})):
+                total_stats['skipped'] += 1
+                type_stats['skipped'] += 1
+                return
+            
+            if success:
+                try:
+                    link_or_copy(conversion_info['output_file'], output_file, use_hardlinks)
+                    os.remove(file_path)
+                    total_stats['deduplicated'] += 1
+                    type_stats['deduplicated'] += 1
+                    logger.info(f"Reused output of identical {primary_path}: {file_path}")
+                    return
+                except OSError as e:
+                    message = f"Error placing deduplicated output for {file_path}: {e}"
+            else:
+                message = f"Not converted: {file_path} is identical to {primary_path}, which failed"
+            
+            total_stats['failed'] += 1
+            type_stats['failed'] += 1
+            logger.error(message)
+        
+        def pending_jobs() -> Iterator[Tuple[str, AudioType]]:
+            """Count discovered files, check the cache and hold back duplicates as the pool asks for work."""
+            for file_path, audio_type in discovered:
+                type_stats = count_file(audio_type)
                 if file_path in cache:
                     if is_file_unchanged(file_path, cache[file_path]):
                         logger.info(f"Skipped (unchanged): {file_path}")
                         total_stats['cached'] += 1
-                        total_stats['by_type'][audio_type.value]['cached'] += 1
+                        type_stats['cached'] += 1
                         continue
                 
-                try:
-                    success, message, conversion_info = converter.convert_audio_file_advanced(file_path, audio_type)
-                    
-                    if success:
-                        if conversion_info.get('skipped'):
-                            total_stats['skipped'] += 1
-                            total_stats['by_type'][audio_type.value]['skipped'] += 1
+                if deduplicate:
+                    # Same content and type means the same effective settings, hence the same output
+                    file_hash = file_hasher.hash_file(file_path)
+                    resolved_type = audio_type
+                    if resolved_type == AudioType.UNKNOWN:
+                        resolved_type = converter.detect_audio_type(file_path)
+                    primary_path = primaries.setdefault((file_hash, resolved_type), file_path) if file_hash else file_path
+                    if primary_path != file_path:
+                        if primary_path in primary_results:
+                            place_duplicate(file_path, audio_type, primary_path)
                         else:
-                            total_stats['successful'] += 1
-                            total_stats['by_type'][audio_type.value]['successful'] += 1
-                            logger.info(message)
-                            
-                            # Update cache with new hash
-                            if conversion_info.get('input_info', {}).get('hash'):
-                                cache[file_path] = conversion_info['input_info']['hash']
-                    else:
-                        total_stats['failed'] += 1
-                        total_stats['by_type'][audio_type.value]['failed'] += 1
-                        logger.error(message)
-                        
-                except Exception as e:
-                    total_stats['failed'] += 1
-                    total_stats['by_type'][audio_type.value]['failed'] += 1
-                    logger.error(f"Error processing {file_path}: {str(e)}")
+                            duplicates.setdefault(primary_path, []).append((file_path, audio_type))
+                        continue
+                
+                yield file_path, audio_type
+        
+        # Convert on the worker pool; results arrive in input order
+        logger.info(f"Converting with up to {converter.processor.max_workers} workers")
+        timed_out_jobs = []
+        for file_path, audio_type, success, message, conversion_info in convert_files_parallel(converter, pending_jobs()):
+            type_stats = total_stats['by_type'][audio_type.value]
+            
+            if success:
+                if conversion_info.get('skipped'):
+                    total_stats['skipped'] += 1
+                    type_stats['skipped'] += 1
+                elif conversion_info.get('cached'):
+                    total_stats['cached'] += 1
+                    type_stats['cached'] += 1
+                    logger.info(message)
+                else:
+                    total_stats['successful'] += 1
+                    type_stats['successful'] += 1
+                    logger.info(message)
+                    
+                    if conversion_info.get('trimmed_ms'):
+                        total_stats['trimmed'] += 1
+                        total_stats['trimmed_bytes'] += conversion_info['trimmed_bytes']
+                        logger.debug(f"Trimmed {conversion_info['trimmed_ms']} ms of silence from {file_path}")
+                    
+                    # Update cache with the new hash and the stat it was taken at
+                    input_info = conversion_info.get('input_info', {})
+                    if input_info.get('hash'):
+                        cache[file_path] = {key: input_info.get(key) for key in ('hash', 'size', 'mtime_ns')}
+            else:
+                total_stats['failed'] += 1
+                type_stats['failed'] += 1
+                logger.error(message)
+                if conversion_info.get('timed_out'):
+                    timed_out_jobs.append((file_path, audio_type))
+            
+            if deduplicate:
+                primary_results[file_path] = (success, conversion_info)
+                for duplicate_path, duplicate_type in duplicates.pop(file_path, []):
+                    place_duplicate(duplicate_path, duplicate_type, file_path)
+        
+        if total_stats['total'] == 0:
+            logger.warning("No audio files found to convert")
+            return
+        
+        # The pool is terminated by now; an original that still exists means its output is partial
+        for file_path, audio_type in timed_out_jobs:
+            output_file = converter._generate_output_path(file_path, audio_type)
+            if os.path.exists(file_path) and os.path.exists(output_file):
+                os.remove(output_file)
         
         # Save updated cache
         if enable_cache:
             save_cache(cache)
         
+        # Trim the output store back to its size limit, least recently used first
+        if converter.output_store:
+            removed, removed_bytes = converter.output_store.evict()
+            if removed:
+                logger.info(f"Evicted {removed} cached outputs ({removed_bytes / (1024 * 1024):.1f} MB)")
+        
         # Report results
         logger.info("=" * 50)
         logger.info("CONVERSION COMPLETED")
@@ -736,13 +1759,18 @@ def main():
         logger.info(f"Converted: {total_stats['successful']}")
         logger.info(f"Failed: {total_stats['failed']}")
         logger.info(f"Skipped: {total_stats['skipped']}")
-        logger.info(f"Cached (unchanged): {total_stats['cached']}")
+        logger.info(f"Cached (unchanged or reused): {total_stats['cached']}")
+        logger.info(f"Deduplicated (encodes saved): {total_stats['deduplicated']}")
+        if total_stats['trimmed']:
+            logger.info(f"Silence trimmed: {total_stats['trimmed']} files, "
+                        f"~{total_stats['trimmed_bytes'] / 1024:.1f} KB saved")
         logger.info("Note: WAV and OGG files are considered acceptable formats and are skipped")
         
         # Report by type
         for audio_type, stats in total_stats['by_type'].items():
             if stats['total'] > 0:
-                logger.info(f"  {audio_type}: {stats['successful']} converted, {stats['cached']} cached")
+                logger.info(f"  {audio_type}: {stats['total']} found, {stats['successful']} converted, "
+                            f"{stats['cached']} cached, {stats['deduplicated']} deduplicated")
         
         if total_stats['failed'] > 0:
             logger.warning(f"{total_stats['failed']} files failed to convert")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the NumPy sample helpers used by normalization and silence trimming.
+
+Builds small segments from raw samples, so no ffmpeg is needed. Runs under
+pytest or directly, exiting non-zero if a check fails.
+
+Usage:
+    python test/test_numpy_helpers.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from pydub import AudioSegment
+
+from main import analyze_loudness, apply_gain, find_sound_bounds, normalization_gain
+
+WIDTH_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+
+def make_segment(samples, sample_width=2, channels=1, frame_rate=8000) -> AudioSegment:
+    data = np.asarray(samples, dtype=WIDTH_DTYPES[sample_width]).tobytes()
+    return AudioSegment(data=data, sample_width=sample_width, frame_rate=frame_rate, channels=channels)
+
+
+def samples_of(audio: AudioSegment) -> np.ndarray:
+    return np.frombuffer(audio.raw_data, dtype=WIDTH_DTYPES[audio.sample_width])
+
+
+def test_apply_gain_clips_32_bit_samples_without_wrapping():
+    # pydub loads 24-bit sources as 32-bit samples
+    limits = np.iinfo(np.int32)
+    audio = make_segment([limits.max - 1000, limits.min + 1000, 1 << 20, 0], sample_width=4)
+    result = samples_of(apply_gain(audio, 6.0))
+    assert result[0] == limits.max
+    assert result[1] == limits.min
+    assert result[2] == round((1 << 20) * 10 ** (6.0 / 20))
+    assert result[3] == 0
+
+
+def test_apply_gain_clips_16_bit_samples():
+    audio = make_segment([30000, -30000, 1000], sample_width=2)
+    result = samples_of(apply_gain(audio, 6.0))
+    assert list(result[:2]) == [32767, -32768]
+    assert result[2] == round(1000 * 10 ** (6.0 / 20))
+
+
+def test_apply_gain_attenuates():
+    audio = make_segment([20000, -20000], sample_width=2)
+    result = samples_of(apply_gain(audio, -20.0))
+    assert list(result) == [2000, -2000]
+
+
+def test_analyze_loudness_of_full_scale_square_wave():
+    audio = make_segment([32767, -32767] * 8000, sample_width=2)
+    analysis = analyze_loudness(audio)
+    assert abs(analysis['peak']) < 0.01
+    assert abs(analysis['loudness']) < 0.01
+
+
+def test_analyze_loudness_of_silence():
+    analysis = analyze_loudness(make_segment([0] * 8000))
+    assert analysis['loudness'] == float('-inf')
+    assert analysis['peak'] == float('-inf')
+
+
+def test_normalization_gain_respects_peak_limit():
+    assert normalization_gain(-20.0, -3.0, -16.0, -1.0) == 2.0
+    assert normalization_gain(-30.0, -6.0, -16.0, -1.0) == 5.0
+    assert normalization_gain(float('-inf'), float('-inf'), -16.0, -1.0) == 0.0
+
+
+def test_find_sound_bounds_on_any_channel():
+    silence, tone = [0, 0] * 100, [0, 0] * 10 + [0, 5000] * 50
+    audio = make_segment(silence + tone + silence, sample_width=2, channels=2)
+    assert find_sound_bounds(audio, -50.0) == (110, 160)
+    assert find_sound_bounds(make_segment([0, -32768, 0], sample_width=2), -50.0) == (1, 2)
+    assert find_sound_bounds(make_segment([0] * 100), -50.0) == (0, 0)
+
+
+def main():
+    failed = 0
+    for name, test in sorted(globals().items()):
+        if name.startswith('test_') and callable(test):
+            try:
+                test()
+                print(f"PASS {name}")
+            except AssertionError as e:
+                failed += 1
+                print(f"FAIL {name} {e}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
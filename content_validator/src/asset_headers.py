@@ -0,0 +1,181 @@
+"""
+Header-only readers for pack assets.
+
+Only the few bytes that describe an asset are read; pixel data is never
+decoded, so thousands of files can be inspected on every build.
+"""
+
+import os
+import struct
+from typing import NamedTuple, Optional
+
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# PNG color type -> channels per pixel
+PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+# Uncompressed and RLE TGA image types (color-mapped, true-color, grayscale)
+TGA_IMAGE_TYPES = {1, 2, 3, 9, 10, 11}
+
+# The last Ogg page is searched for in this many trailing bytes
+OGG_TAIL_BYTES = 64 * 1024
+
+
+class TextureInfo(NamedTuple):
+    """Dimensions and pixel format read from a texture header."""
+    format: str
+    width: int
+    height: int
+    bit_depth: int
+    channels: int
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated memory once loaded; the game expands textures to 8-bit RGBA."""
+        return self.width * self.height * 4
+
+    @property
+    def is_power_of_two(self) -> bool:
+        return _is_power_of_two(self.width) and _is_power_of_two(self.height)
+
+
+def _is_power_of_two(value: int) -> bool:
+    return value > 0 and value & (value - 1) == 0
+
+
+def read_png_header(file_path: str) -> Optional[TextureInfo]:
+    """Read dimensions and bit depth from the IHDR chunk of a PNG file."""
+    with open(file_path, 'rb') as f:
+        header = f.read(29)
+
+    # Signature, then IHDR must be the first chunk: length, type, width, height, depth, color type
+    if len(header) < 29 or header[:8] != PNG_SIGNATURE or header[12:16] != b'IHDR':
+        return None
+
+    width, height, bit_depth, color_type = struct.unpack('>IIBB', header[16:26])
+    channels = PNG_CHANNELS.get(color_type)
+    if channels is None:
+        return None
+    return TextureInfo('png', width, height, bit_depth, channels)
+
+
+def read_tga_header(file_path: str) -> Optional[TextureInfo]:
+    """Read dimensions and pixel depth from the fixed 18-byte TGA header."""
+    with open(file_path, 'rb') as f:
+        header = f.read(18)
+
+    if len(header) < 18:
+        return None
+
+    image_type = header[2]
+    if image_type not in TGA_IMAGE_TYPES:
+        return None
+
+    width, height, pixel_depth, descriptor = struct.unpack('<HHBB', header[12:18])
+    if not width or not height or pixel_depth not in (8, 15, 16, 24, 32):
+        return None
+
+    if pixel_depth in (15, 16):
+        # 5 bits per color channel, plus a 1-bit alpha when the descriptor declares one
+        return TextureInfo('tga', width, height, 5, 4 if descriptor & 0x0F else 3)
+    return TextureInfo('tga', width, height, 8, pixel_depth // 8)
+
+
+def read_texture_header(file_path: str) -> Optional[TextureInfo]:
+    """Read a PNG or TGA header based on the file extension."""
+    lower_path = file_path.lower()
+    if lower_path.endswith('.png'):
+        return read_png_header(file_path)
+    if lower_path.endswith('.tga'):
+        return read_tga_header(file_path)
+    return None
+
+
+class AudioInfo(NamedTuple):
+    """Duration and stream format read from an audio header."""
+    format: str
+    duration_seconds: float
+    sample_rate: int
+    channels: int
+    bits_per_sample: int
+
+
+def read_wav_header(file_path: str) -> Optional[AudioInfo]:
+    """Read the fmt and data chunk headers of a RIFF/WAVE file, skipping the samples."""
+    with open(file_path, 'rb') as f:
+        header = f.read(12)
+        if len(header) < 12 or header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+            return None
+
+        fmt = None
+        data_size = None
+        while fmt is None or data_size is None:
+            chunk_header = f.read(8)
+            if len(chunk_header) < 8:
+                break
+            chunk_id = chunk_header[:4]
+            chunk_size = struct.unpack('<I', chunk_header[4:])[0]
+
+            if chunk_id == b'fmt ':
+                chunk = f.read(chunk_size)
+                if len(chunk) < 16:
+                    return None
+                fmt = struct.unpack('<HHIIHH', chunk[:16])
+                # Chunks are word aligned
+                if chunk_size % 2:
+                    f.seek(1, os.SEEK_CUR)
+            elif chunk_id == b'data':
+                data_size = chunk_size
+                f.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+            else:
+                f.seek(chunk_size + chunk_size % 2, os.SEEK_CUR)
+
+    if fmt is None or data_size is None:
+        return None
+
+    _, channels, sample_rate, byte_rate, _, bits_per_sample = fmt
+    if not byte_rate or not sample_rate:
+        return None
+    return AudioInfo('wav', data_size / byte_rate, sample_rate, channels, bits_per_sample)
+
+
+def read_ogg_header(file_path: str) -> Optional[AudioInfo]:
+    """Read the Vorbis identification header and the granule position of the last Ogg page."""
+    with open(file_path, 'rb') as f:
+        page = f.read(27)
+        if len(page) < 27 or page[:4] != b'OggS':
+            return None
+
+        # The identification packet follows the first page's segment table
+        segment_count = page[26]
+        f.seek(segment_count, os.SEEK_CUR)
+        packet = f.read(16)
+        if len(packet) < 16 or packet[:7] != b'\x01vorbis':
+            return None
+        channels = packet[11]
+        sample_rate = struct.unpack('<I', packet[12:16])[0]
+
+        f.seek(0, os.SEEK_END)
+        file_size = f.tell()
+        f.seek(max(0, file_size - OGG_TAIL_BYTES))
+        tail = f.read()
+
+    last_page = tail.rfind(b'OggS')
+    if last_page < 0 or last_page + 14 > len(tail) or not sample_rate:
+        return None
+
+    granule_position = struct.unpack('<q', tail[last_page + 6:last_page + 14])[0]
+    if granule_position < 0:
+        return None
+    return AudioInfo('ogg', granule_position / sample_rate, sample_rate, channels, 0)
+
+
+def read_audio_header(file_path: str) -> Optional[AudioInfo]:
+    """Read a WAV or Ogg Vorbis header based on the file extension."""
+    lower_path = file_path.lower()
+    if lower_path.endswith('.wav'):
+        return read_wav_header(file_path)
+    if lower_path.endswith('.ogg'):
+        return read_ogg_header(file_path)
+    return None
@@ -0,0 +1,138 @@
+"""
+Batch validation of several projects on one shared worker pool.
+
+Each project root (a Regolith project or any folder holding BP/RP) is
+validated in a pool worker that changes into the project directory, runs the
+full test suite and writes the project's own report. Results are collected into
+one combined summary. Projects are scheduled longest first, using the
+durations recorded by the previous summary, so the slowest projects do not
+start last.
+"""
+
+import copy
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+from .utils import logger
+
+DEFAULT_SUMMARY_PATH = 'content_validator_summary.json'
+REPORT_FILE_NAME = 'content_validator_report.json'
+
+
+def validate_project(project_root: str, settings: Dict[str, Any], report_path: str,
+                     log_level: str = 'WARNING') -> Dict[str, Any]:
+    """Validate one project in the current process and return its summary entry."""
+    from .validator import MainValidator
+
+    project_settings = copy.deepcopy(settings)
+    project_settings['report_path'] = report_path
+    project_settings['display_summary'] = False
+    # The batch pool already uses every core; nested schema pools would oversubscribe it
+    project_settings.setdefault('schema_validation', {})['max_workers'] = 1
+
+    logging.getLogger().setLevel(getattr(logging, log_level.upper(), logging.WARNING))
+    previous_dir = os.getcwd()
+    start = time.perf_counter()
+    try:
+        # Tests resolve pack folders relative to the working directory
+        os.chdir(project_root)
+        report = MainValidator(project_settings).validate_addon()
+    finally:
+        os.chdir(previous_dir)
+
+    return {
+        'project': project_root,
+        'report': report_path,
+        'seconds': round(time.perf_counter() - start, 3),
+        'summary': report.summary,
+    }
+
+
+def _previous_durations(summary_path: str) -> Dict[str, float]:
+    """Durations recorded by the last batch run, keyed by project root."""
+    try:
+        with open(summary_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return {
+        entry['project']: entry.get('seconds', 0)
+        for entry in previous.get('projects', []) if isinstance(entry, dict) and 'project' in entry
+    }
+
+
+def _report_path(report_dir: str, project_root: str, used: set) -> str:
+    """Give every project its own report file, even when folder names repeat."""
+    name = os.path.basename(os.path.normpath(project_root)) or 'project'
+    candidate, suffix = name, 1
+    while candidate in used:
+        suffix += 1
+        candidate = f"{name}_{suffix}"
+    used.add(candidate)
+    return os.path.join(report_dir, candidate, REPORT_FILE_NAME)
+
+
+def validate_many(project_roots: List[str], settings: Dict[str, Any], max_workers: Optional[int] = None,
+                  summary_path: str = DEFAULT_SUMMARY_PATH, log_level: str = 'WARNING') -> Dict[str, Any]:
+    """Validate every project on one process pool and write a combined summary."""
+    project_roots = [os.path.abspath(root) for root in project_roots]
+    summary_path = os.path.abspath(summary_path)
+    report_dir = os.path.join(os.path.dirname(summary_path), 'reports')
+
+    used_names: set = set()
+    report_paths = {root: _report_path(report_dir, root, used_names) for root in project_roots}
+
+    # Unknown projects first, then the slowest from the previous run
+    durations = _previous_durations(summary_path)
+    ordered = sorted(project_roots, key=lambda root: -durations.get(root, float('inf')))
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(ordered)) or 1
+    logger.info(f"Validating {len(ordered)} projects on {max_workers} workers...")
+
+    entries: Dict[str, Dict[str, Any]] = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(validate_project, root, settings, report_paths[root], log_level): root
+            for root in ordered
+        }
+        for future in as_completed(futures):
+            root = futures[future]
+            try:
+                entries[root] = future.result()
+            except Exception as e:
+                # One broken project must not cost the rest of the nightly run
+                logger.error(f"Validation failed for {root}: {e}")
+                entries[root] = {'project': root, 'report': None, 'seconds': 0, 'error': str(e)}
+            else:
+                result = entries[root]['summary']
+                logger.info(f"{root}: {result['total_errors']} errors, {result['total_warnings']} warnings "
+                            f"({entries[root]['seconds']:.1f}s)")
+
+    projects = [entries[root] for root in project_roots]
+    summaries = [entry['summary'] for entry in projects if 'summary' in entry]
+    combined = {
+        'totals': {
+            'projects': len(projects),
+            'valid_projects': sum(1 for summary in summaries if summary['is_valid']),
+            'failed_projects': sum(1 for entry in projects if 'error' in entry),
+            'total_errors': sum(summary['total_errors'] for summary in summaries),
+            'total_warnings': sum(summary['total_warnings'] for summary in summaries),
+            'total_info': sum(summary['total_info'] for summary in summaries),
+            'total_possible_issues': sum(summary['total_possible_issues'] for summary in summaries),
+            'seconds': round(time.perf_counter() - start, 3),
+            'workers': max_workers,
+        },
+        'projects': projects,
+    }
+
+    os.makedirs(os.path.dirname(summary_path), exist_ok=True)
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(combined, f, indent=2)
+    logger.info(f"Batch summary saved to {summary_path}")
+
+    return combined
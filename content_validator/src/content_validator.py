@@ -4,16 +4,18 @@ Content validation for Add-Ons Guidelines compliance.
 
 import os
 import glob
-from typing import Dict, List, Any
+from typing import Dict, List, Any, FrozenSet
 from .models import ValidationResult, ValidationLevel
-from .utils import logger, find_pack_directories, get_first_existing_path, safe_file_read, safe_json_load
+from .rules import RuleSet, TECHNICAL_TERMS
+from .utils import logger, find_pack_directories, get_first_existing_path, safe_file_read, safe_json_load, walk_json, walk_pack
 
 
 class ContentValidator:
     """Validate content compliance with Add-Ons Guidelines."""
     
-    def __init__(self, settings: dict):
+    def __init__(self, settings: dict, rules: RuleSet = None):
         self.settings = settings
+        self.rules = rules if rules is not None else RuleSet.from_settings(settings)
     
     def validate_addon_guidelines(self, report) -> None:
         """Validate compliance with Add-Ons Guidelines."""
@@ -37,32 +39,16 @@ class ContentValidator:
         pack_dirs = find_pack_directories()
         bp_paths = pack_dirs.get('BP', [])
         
-        prohibited_patterns = {
-            'mod_terminology': ['mod', 'modded', 'modification'],
-            'cheat_patterns': [
-                'invincibility', 'invulnerability', 'instakill', 'auto_break', 'auto_mine',
-                'clipping', 'aura', 'aimbot', 'console_command', 'keep_inventory',
-                'fire_tick', 'grief_mobs', 'player_locator', 'inventory_locator'
-            ],
-            'disallowed_genres': [
-                'one_block', 'skyblock', 'lucky_block', 'random_op', 'x_ray', 'xray',
-                'dance_creator', 'skin_generator', 'resource_generator', 'cape_generator'
-            ],
-            'forbidden_items': [
-                'horse_armor', 'ender_pearl', 'saddle', 'portal_frame', 'written_book'
-            ]
-        }
-        
         for path in bp_paths:
             if os.path.exists(path):
-                for root, dirs, files in os.walk(path):
+                for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                     for file in files:
                         if file.endswith(('.json', '.js', '.mcfunction')):
                             file_path = os.path.join(root, file)
-                            self._check_prohibited_patterns_in_file(file_path, prohibited_patterns, report)
+                            self._check_prohibited_patterns_in_file(file_path, report)
                 break  # Found the first valid path
     
-    def _check_prohibited_patterns_in_file(self, file_path: str, prohibited_patterns: Dict[str, List[str]], report) -> None:
+    def _check_prohibited_patterns_in_file(self, file_path: str, report) -> None:
         """Check for prohibited patterns in a specific file."""
         content = safe_file_read(file_path)
         if not content:
@@ -70,16 +56,20 @@ class ContentValidator:
         
         content_lower = content.lower()
         
+        # A single scan over the combined patterns rules out most files up front
+        if not self.rules.prohibited_content_regex or not self.rules.prohibited_content_regex.search(content_lower):
+            return
+        
         # Check for mod terminology (but exclude common technical terms)
-        for pattern in prohibited_patterns['mod_terminology']:
-            if pattern in content_lower:
+        has_technical_terms = any(term in content_lower for term in TECHNICAL_TERMS)
+        for pattern, needle in self.rules.prohibited_terminology:
+            if needle in content_lower:
                 # Skip if it's part of common technical terms
-                technical_terms = ['modules', 'modular', 'modification', 'modify']
-                if any(term in content_lower for term in technical_terms):
+                if has_technical_terms:
                     continue
                 
                 # Check if it's standalone "mod" terminology
-                if pattern == 'mod' and 'modules' in content_lower:
+                if needle == 'mod' and 'modules' in content_lower:
                     continue
                 
                 report.add_result(ValidationResult(
@@ -90,8 +80,8 @@ class ContentValidator:
                 ))
         
         # Check for cheat patterns
-        for pattern in prohibited_patterns['cheat_patterns']:
-            if pattern in content_lower:
+        for pattern, needle in self.rules.cheat_patterns:
+            if needle in content_lower:
                 report.add_result(ValidationResult(
                     ValidationLevel.POSSIBLE_ISSUE,
                     f"Possible cheat pattern '{pattern}' found - cheats/hacks are not allowed (manual review recommended)",
@@ -100,8 +90,8 @@ class ContentValidator:
                 ))
         
         # Check for disallowed genres
-        for pattern in prohibited_patterns['disallowed_genres']:
-            if pattern in content_lower:
+        for pattern, needle in self.rules.disallowed_genres:
+            if needle in content_lower:
                 report.add_result(ValidationResult(
                     ValidationLevel.POSSIBLE_ISSUE,
                     f"Possible disallowed genre '{pattern}' found - this content type may not be allowed as Add-On (manual review recommended)",
@@ -110,11 +100,12 @@ class ContentValidator:
                 ))
         
         # Check for forbidden items only in recipe outputs (not ingredients)
+        forbidden_items = [needle for _, needle in self.rules.forbidden_items]
         if 'recipe.json' in file_path:
-            self._check_forbidden_items_in_recipe(file_path, prohibited_patterns['forbidden_items'], report)
+            self._check_forbidden_items_in_recipe(file_path, forbidden_items, report)
         else:
             # For non-recipe files, only check for forbidden items in specific contexts
-            self._check_forbidden_items_in_context(file_path, content_lower, prohibited_patterns['forbidden_items'], report)
+            self._check_forbidden_items_in_context(file_path, content_lower, forbidden_items, report)
     
     def _check_forbidden_items_in_recipe(self, file_path: str, forbidden_items: List[str], report) -> None:
         """Check for forbidden items only in recipe outputs, not ingredients."""
@@ -176,95 +167,45 @@ class ContentValidator:
         logger.info("Checking for vanilla file modifications...")
         
         pack_dirs = find_pack_directories()
-        vanilla_namespaces = ['minecraft']
+        vanilla_namespaces = self.rules.vanilla_namespaces
         
         for pack_type, possible_paths in pack_dirs.items():
             for path in possible_paths:
                 if os.path.exists(path):
-                    for root, dirs, files in os.walk(path):
+                    for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                         for file in files:
                             if file.endswith('.json'):
                                 file_path = os.path.join(root, file)
                                 self._check_vanilla_modifications_in_file(file_path, vanilla_namespaces, report)
                     break  # Found the first valid path for this pack type
     
-    def _check_vanilla_modifications_in_file(self, file_path: str, vanilla_namespaces: List[str], report) -> None:
+    def _check_vanilla_modifications_in_file(self, file_path: str, vanilla_namespaces: FrozenSet[str], report) -> None:
         """Check for vanilla file modifications in a specific file."""
         data = safe_json_load(file_path)
         if not data:
             return
         
         # Check for vanilla namespace usage in identifiers
-        self._check_vanilla_identifiers_recursive(data, vanilla_namespaces, file_path, report)
+        self._check_vanilla_identifiers(data, vanilla_namespaces, file_path, report)
     
-    def _check_vanilla_identifiers_recursive(self, data: Any, vanilla_namespaces: List[str], file_path: str, report, path: str = "") -> None:
-        """Recursively check for vanilla identifier usage."""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                self._check_vanilla_identifiers_recursive(value, vanilla_namespaces, file_path, report, current_path)
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]"
-                self._check_vanilla_identifiers_recursive(item, vanilla_namespaces, file_path, report, current_path)
-        elif isinstance(data, str):
+    def _check_vanilla_identifiers(self, data: Any, vanilla_namespaces: FrozenSet[str], file_path: str, report) -> None:
+        """Check every string in a document for vanilla identifier usage."""
+        # Subtrees at reference paths can only hold references, never definitions
+        for path, _, value in walk_json(data, prune=lambda path, key, value: self.rules.is_reference_path(path)):
             # Check for vanilla namespace in identifiers
-            if ':' in data:
-                namespace = data.split(':')[0]
+            if isinstance(value, str) and ':' in value:
+                namespace = value.split(':', 1)[0]
                 if namespace in vanilla_namespaces:
                     # Only flag vanilla namespace usage for NEW entity/block/item identifiers
                     # Skip legitimate references like recipe ingredients, loot table items, etc.
-                    if self._is_identifier_definition_legacy(path, file_path):
+                    if self.rules.is_identifier_definition(path, file_path):
                         report.add_result(ValidationResult(
                             ValidationLevel.ERROR,
                             f"Vanilla namespace '{namespace}' should not be modified in Add-Ons",
                             file_path,
-                            context={'value': data, 'path': path}
+                            context={'value': value, 'path': path}
                         ))
     
-    def _is_identifier_definition_legacy(self, path: str, file_path: str) -> bool:
-        """Check if this path represents a new identifier definition (not a reference)."""
-        # These are legitimate references, not new definitions
-        legitimate_reference_paths = [
-            'result.item', 'key.item', 'tags.item', 'item', 'input', 'output', 
-            'ingredient', 'materials', 'drops', 'pools.entries.name', 'give', 
-            'item_name', 'spawn_item'
-        ]
-        
-        # File types that commonly have legitimate minecraft: references
-        legitimate_reference_files = [
-            'recipe.json', 'loot_table.json', 'trade.json', 
-            'crafting_item_catalog.json', 'trading.json'
-        ]
-        
-        # Check if this is a legitimate reference context
-        path_lower = path.lower()
-        for ref_path in legitimate_reference_paths:
-            if ref_path in path_lower:
-                return False
-        
-        # Check if this is a file type that commonly has references
-        file_name = file_path.split('\\')[-1].split('/')[-1]
-        for ref_file in legitimate_reference_files:
-            if ref_file in file_name:
-                return False
-        
-        # Check for entity/block/item identifier definitions (these should be flagged)
-        identifier_definition_paths = [
-            'minecraft:entity.description.identifier',
-            'minecraft:block.description.identifier', 
-            'minecraft:item.description.identifier',
-            'description.identifier',
-            'identifier'
-        ]
-        
-        for def_path in identifier_definition_paths:
-            if def_path in path_lower:
-                return True
-        
-        # Default to not flagging unless we're sure it's a new definition
-        return False
-    
     def _check_experimental_features(self, report) -> None:
         """Check for experimental features."""
         logger.info("Checking for experimental features...")
@@ -274,7 +215,7 @@ class ContentValidator:
         for pack_type, possible_paths in pack_dirs.items():
             for path in possible_paths:
                 if os.path.exists(path):
-                    for root, dirs, files in os.walk(path):
+                    for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                         for file in files:
                             if file.endswith('.json'):
                                 file_path = os.path.join(root, file)
@@ -300,7 +241,7 @@ class ContentValidator:
             if 'manifest.json' in file_path:
                 if 'dependencies' in data:
                     for dep in data['dependencies']:
-                        if isinstance(dep, dict) and dep.get('module_name') in ['@minecraft/server-gametest', '@minecraft/server-admin']:
+                        if isinstance(dep, dict) and dep.get('module_name') in self.rules.experimental_modules:
                             report.add_result(ValidationResult(
                                 ValidationLevel.ERROR,
                                 f"Experimental module '{dep.get('module_name')}' detected - experimental features are not allowed",
@@ -309,42 +250,31 @@ class ContentValidator:
                             ))
             
             # Check for is_experimental: true and other experimental flags
-            self._check_experimental_json_recursive(data, file_path, report)
+            self._check_experimental_json_flags(data, file_path, report)
             
         except (FileNotFoundError, OSError):
             pass
     
-    def _check_experimental_json_recursive(self, data: Any, file_path: str, report, path: str = "") -> None:
-        """Recursively check for experimental features in JSON data."""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                
-                # Only flag is_experimental: true, not is_experimental: false
-                if key == 'is_experimental' and value is True:
-                    report.add_result(ValidationResult(
-                        ValidationLevel.ERROR,
-                        f"Experimental feature indicator 'experimental' found - experimental features are not allowed",
-                        file_path,
-                        context={'experimental_indicator': 'experimental', 'path': current_path}
-                    ))
-                
-                # Check for experimental feature flags that are enabled
-                if key in ['enable_experimental', 'experimental_features'] and value:
-                    report.add_result(ValidationResult(
-                        ValidationLevel.ERROR,
-                        f"Experimental feature flag '{key}' enabled - experimental features are not allowed",
-                        file_path,
-                        context={'experimental_flag': key, 'path': current_path}
-                    ))
-                
-                # Recurse into nested structures
-                self._check_experimental_json_recursive(value, file_path, report, current_path)
-                
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]" if path else f"[{i}]"
-                self._check_experimental_json_recursive(item, file_path, report, current_path)
+    def _check_experimental_json_flags(self, data: Any, file_path: str, report) -> None:
+        """Check every key in a document for experimental features."""
+        for path, key, value in walk_json(data):
+            # Only flag is_experimental: true, not is_experimental: false
+            if key == 'is_experimental' and value is True:
+                report.add_result(ValidationResult(
+                    ValidationLevel.ERROR,
+                    f"Experimental feature indicator 'experimental' found - experimental features are not allowed",
+                    file_path,
+                    context={'experimental_indicator': 'experimental', 'path': path}
+                ))
+            
+            # Check for experimental feature flags that are enabled
+            if key in ['enable_experimental', 'experimental_features'] and value:
+                report.add_result(ValidationResult(
+                    ValidationLevel.ERROR,
+                    f"Experimental feature flag '{key}' enabled - experimental features are not allowed",
+                    file_path,
+                    context={'experimental_flag': key, 'path': path}
+                ))
     
     def _check_experimental_in_script_file(self, file_path: str, report) -> None:
         """Check for experimental features in script files (.js, .mcfunction)."""
@@ -408,22 +338,17 @@ class ContentValidator:
         pack_dirs = find_pack_directories()
         bp_paths = pack_dirs.get('BP', [])
         
-        player_indicators = [
-            'player_character', 'player_model', 'player_skin', 'player_entity',
-            'minecraft:player', 'player_modification'
-        ]
-        
         for path in bp_paths:
             if os.path.exists(path):
-                for root, dirs, files in os.walk(path):
+                for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                     for file in files:
                         if file.endswith(('.json', '.js', '.mcfunction')):
                             file_path = os.path.join(root, file)
                             content = safe_file_read(file_path)
                             if content:
                                 content_lower = content.lower()
-                                for indicator in player_indicators:
-                                    if indicator in content_lower:
+                                for indicator, needle in self.rules.player_indicators:
+                                    if needle in content_lower:
                                         report.add_result(ValidationResult(
                                             ValidationLevel.POSSIBLE_ISSUE,
                                             f"Possible player character modification indicator '{indicator}' found - direct player modifications are not allowed (manual review recommended)",
@@ -441,7 +366,7 @@ class ContentValidator:
         
         for path in bp_paths:
             if os.path.exists(path):
-                for root, dirs, files in os.walk(path):
+                for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                     for file in files:
                         if file.endswith('.json'):
                             file_path = os.path.join(root, file)
@@ -508,28 +433,17 @@ class ContentValidator:
         
         return False
     
-    def _check_dimension_modification_apis(self, data: Any, file_path: str, report, path: str = "") -> None:
-        """Recursively check for dimension modification APIs."""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                
-                # Check for dimension modification methods/properties
-                if key in ['createDimension', 'removeDimension', 'addDimension', 'deleteDimension']:
-                    report.add_result(ValidationResult(
-                        ValidationLevel.ERROR,
-                        f"Dimension modification API '{key}' found - Add-Ons cannot add/subtract dimensions",
-                        file_path,
-                        context={'api_method': key, 'path': current_path}
-                    ))
-                
-                # Recurse into nested structures
-                self._check_dimension_modification_apis(value, file_path, report, current_path)
-                
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]" if path else f"[{i}]"
-                self._check_dimension_modification_apis(item, file_path, report, current_path)
+    def _check_dimension_modification_apis(self, data: Any, file_path: str, report) -> None:
+        """Check every key in a document for dimension modification APIs."""
+        for path, key, _ in walk_json(data):
+            # Check for dimension modification methods/properties
+            if key in ['createDimension', 'removeDimension', 'addDimension', 'deleteDimension']:
+                report.add_result(ValidationResult(
+                    ValidationLevel.ERROR,
+                    f"Dimension modification API '{key}' found - Add-Ons cannot add/subtract dimensions",
+                    file_path,
+                    context={'api_method': key, 'path': path}
+                ))
     
     def _check_dimension_modifications_in_script(self, file_path: str, report) -> None:
         """Check for dimension modifications in script files."""
@@ -566,22 +480,17 @@ class ContentValidator:
         pack_dirs = find_pack_directories()
         bp_paths = pack_dirs.get('BP', [])
         
-        weapon_indicators = [
-            'gun', 'firearm', 'rifle', 'pistol', 'shotgun', 'sniper',
-            'trigger', 'ammo', 'bullet', 'projectile_weapon'
-        ]
-        
         for path in bp_paths:
             if os.path.exists(path):
-                for root, dirs, files in os.walk(path):
+                for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                     for file in files:
                         if file.endswith(('.json', '.js', '.mcfunction')):
                             file_path = os.path.join(root, file)
                             content = safe_file_read(file_path)
                             if content:
                                 content_lower = content.lower()
-                                for indicator in weapon_indicators:
-                                    if indicator in content_lower:
+                                for indicator, needle in self.rules.weapon_indicators:
+                                    if needle in content_lower:
                                         report.add_result(ValidationResult(
                                             ValidationLevel.POSSIBLE_ISSUE,
                                             f"Possible weapon indicator '{indicator}' found - projectile weapons require additional scrutiny (manual review recommended)",
@@ -597,22 +506,17 @@ class ContentValidator:
         pack_dirs = find_pack_directories()
         bp_paths = pack_dirs.get('BP', [])
         
-        dependency_indicators = [
-            'external', 'patreon', 'discord', 'website', 'download',
-            'external_requirement', 'external_dependency'
-        ]
-        
         for path in bp_paths:
             if os.path.exists(path):
-                for root, dirs, files in os.walk(path):
+                for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                     for file in files:
                         if file.endswith(('.json', '.js', '.mcfunction', '.txt', '.md')):
                             file_path = os.path.join(root, file)
                             content = safe_file_read(file_path)
                             if content:
                                 content_lower = content.lower()
-                                for indicator in dependency_indicators:
-                                    if indicator in content_lower:
+                                for indicator, needle in self.rules.dependency_indicators:
+                                    if needle in content_lower:
                                         report.add_result(ValidationResult(
                                             ValidationLevel.POSSIBLE_ISSUE,
                                             f"Possible external dependency indicator '{indicator}' found - Add-Ons cannot require external sources (manual review recommended)",
@@ -638,7 +542,7 @@ class ContentValidator:
             for pack_type, possible_paths in pack_dirs.items():
                 for path in possible_paths:
                     if os.path.exists(path):
-                        for root, dirs, files in os.walk(path):
+                        for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                             for file in files:
                                 file_path = os.path.join(root, file)
                                 try:
@@ -655,17 +559,18 @@ class ContentValidator:
         compressed_size = zip_buffer.tell()
         zip_buffer.close()
         
-        # Check 25MB limit (compressed)
-        size_limit_bytes = 25 * 1024 * 1024
+        # Check size limit (compressed)
+        size_limit_mb = self.rules.guideline_size_limit_mb
+        size_limit_bytes = size_limit_mb * 1024 * 1024
         if compressed_size > size_limit_bytes:
             report.add_result(ValidationResult(
                 ValidationLevel.ERROR,
-                f"Compressed add-on size ({compressed_size / (1024*1024):.2f}MB) exceeds 25MB limit",
-                context={'compressed_size_mb': compressed_size / (1024*1024), 'limit_mb': 25}
+                f"Compressed add-on size ({compressed_size / (1024*1024):.2f}MB) exceeds {size_limit_mb}MB limit",
+                context={'compressed_size_mb': compressed_size / (1024*1024), 'limit_mb': size_limit_mb}
             ))
         
         # Check minimum content requirement
-        if total_files < 5:
+        if total_files < self.rules.guideline_min_file_count:
             report.add_result(ValidationResult(
                 ValidationLevel.WARNING,
                 f"Add-On has very few files ({total_files}) - ensure sufficient content for approval",
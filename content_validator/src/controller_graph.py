@@ -0,0 +1,176 @@
+"""
+State graph for animation controllers.
+
+Each controller is turned into an adjacency list once; reachability from the
+initial state is a breadth-first search and cycles are found with an iterative
+Tarjan strongly-connected-components pass, so the analysis is linear in states
+plus transitions and does not recurse on large controllers.
+"""
+
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+DEFAULT_INITIAL_STATE = 'default'
+
+# on_entry/on_exit entries starting with these are commands or events, not Molang
+_NON_MOLANG_PREFIXES = ('/', '@')
+
+
+class ControllerGraph:
+    """Transition graph and complexity metrics of one animation controller."""
+
+    def __init__(self, identifier: str, initial_state: str):
+        self.identifier = identifier
+        self.initial_state = initial_state
+        self.states: Dict[str, List[str]] = {}
+        # (source state, target state) for transitions to states that are not defined
+        self.undefined_targets: List[Tuple[str, str]] = []
+        self.transition_count = 0
+        self.molang_count = 0
+
+    @classmethod
+    def build(cls, identifier: str, controller: Dict[str, Any]) -> 'ControllerGraph':
+        """Build the graph from a controller definition."""
+        initial_state = controller.get('initial_state', DEFAULT_INITIAL_STATE)
+        graph = cls(identifier, initial_state if isinstance(initial_state, str) else DEFAULT_INITIAL_STATE)
+
+        states = controller.get('states')
+        if not isinstance(states, dict):
+            return graph
+
+        for state_name, state in states.items():
+            graph.states[state_name] = []
+            if isinstance(state, dict):
+                graph._collect_state(state_name, state, states)
+
+        return graph
+
+    def _collect_state(self, state_name: str, state: Dict[str, Any], states: Dict[str, Any]) -> None:
+        """Record a state's transitions and count the Molang expressions it evaluates."""
+        transitions = state.get('transitions')
+        if isinstance(transitions, list):
+            for transition in transitions:
+                if not isinstance(transition, dict):
+                    continue
+                for target, condition in transition.items():
+                    self.transition_count += 1
+                    if isinstance(condition, str):
+                        self.molang_count += 1
+                    if target in states:
+                        self.states[state_name].append(target)
+                    else:
+                        self.undefined_targets.append((state_name, target))
+
+        for key in ('on_entry', 'on_exit'):
+            entries = state.get(key)
+            if isinstance(entries, list):
+                self.molang_count += sum(
+                    1 for entry in entries
+                    if isinstance(entry, str) and entry.strip() and not entry.lstrip().startswith(_NON_MOLANG_PREFIXES)
+                )
+
+        # Animation blend conditions, e.g. [{"walk": "q.modified_move_speed"}]
+        animations = state.get('animations')
+        if isinstance(animations, list):
+            for animation in animations:
+                if isinstance(animation, dict):
+                    self.molang_count += sum(1 for condition in animation.values() if isinstance(condition, str))
+
+        parameters = state.get('parameters')
+        if isinstance(parameters, list):
+            self.molang_count += sum(1 for parameter in parameters if isinstance(parameter, str))
+
+    @property
+    def has_initial_state(self) -> bool:
+        return self.initial_state in self.states
+
+    def reachable(self) -> Set[str]:
+        """Return the states reachable from the initial state."""
+        if not self.has_initial_state:
+            return set()
+
+        seen = {self.initial_state}
+        queue = deque([self.initial_state])
+        while queue:
+            for target in self.states[queue.popleft()]:
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        return seen
+
+    def strongly_connected_components(self) -> List[List[str]]:
+        """Return the strongly connected components, sinks first (Tarjan, iterative)."""
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+        counter = 0
+
+        for root in self.states:
+            if root in index:
+                continue
+            # Each frame is (state, iterator over its targets)
+            work: List[Tuple[str, Iterator[str]]] = [(root, iter(self.states[root]))]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                state, targets = work[-1]
+                advanced = False
+                for target in targets:
+                    if target not in index:
+                        index[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(self.states[target])))
+                        advanced = True
+                        break
+                    if target in on_stack:
+                        low[state] = min(low[state], index[target])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[state])
+                if low[state] == index[state]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == state:
+                            break
+                    components.append(component)
+
+        return components
+
+    def dead_ends(self, reachable: Optional[Set[str]] = None) -> List[str]:
+        """Return reachable states, other than the initial one, that never transition to another state."""
+        reachable = self.reachable() if reachable is None else reachable
+        return [
+            state for state, targets in self.states.items()
+            if state in reachable and state != self.initial_state
+            and all(target == state for target in targets)
+        ]
+
+    def cycle_count(self) -> int:
+        """Count the components that contain a cycle, including self-transitions."""
+        return sum(
+            1 for component in self.strongly_connected_components()
+            if len(component) > 1 or component[0] in self.states[component[0]]
+        )
+
+    def metrics(self) -> Dict[str, int]:
+        """Return the controller's complexity metrics."""
+        return {
+            'states': len(self.states),
+            'transitions': self.transition_count,
+            'molang_expressions': self.molang_count,
+            'cycles': self.cycle_count(),
+        }
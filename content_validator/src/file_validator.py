@@ -6,16 +6,18 @@ import os
 import glob
 from typing import List, Dict
 from .models import ValidationResult, ValidationLevel
-from .utils import logger, find_pack_directories, get_first_existing_path
+from .rules import RuleSet
+from .utils import logger, find_pack_directories, get_first_existing_path, parse_json, walk_pack
 import json
 
 
 class FileValidator:
     """Validate file structure and size requirements."""
     
-    def __init__(self, settings: dict, namespace_info):
+    def __init__(self, settings: dict, namespace_info, rules: RuleSet = None):
         self.settings = settings
         self.namespace_info = namespace_info
+        self.rules = rules if rules is not None else RuleSet.from_settings(settings)
     
     def validate_file_structure(self, report) -> None:
         """Validate required folder structure."""
@@ -85,7 +87,7 @@ class FileValidator:
         for pack_type, possible_paths in pack_dirs.items():
             for path in possible_paths:
                 if os.path.exists(path):
-                    for root, dirs, files in os.walk(path):
+                    for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                         for file in files:
                             file_path = os.path.join(root, file)
                             relative_path = os.path.relpath(file_path, path)
@@ -124,7 +126,7 @@ class FileValidator:
         for pack_type, possible_paths in pack_dirs.items():
             for path in possible_paths:
                 if os.path.exists(path):
-                    for root, dirs, files in os.walk(path):
+                    for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                         # Check folder depth for subcategories
                         relative_path = os.path.relpath(root, path)
                         path_parts = relative_path.split(os.sep)
@@ -143,20 +145,17 @@ class FileValidator:
         logger.info("Validating size limits...")
         
         total_files = 0
-        ignored_dirs = self.settings.get('ignored_directories', [])
         pack_dirs = find_pack_directories()
         
         # Get actual compressed size by creating a zip in memory
-        compressed_size = self._get_actual_compressed_size(pack_dirs, ignored_dirs)
+        compressed_size = self._get_actual_compressed_size(pack_dirs)
         
         # Count files
         for pack_type, possible_paths in pack_dirs.items():
             for path in possible_paths:
                 if os.path.exists(path):
-                    for root, dirs, files in os.walk(path):
-                        # Skip ignored directories
-                        if any(ignored in root for ignored in ignored_dirs):
-                            continue
+                    # Ignored directories are pruned by the walk and never entered
+                    for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                         total_files += len(files)
                     break  # Found the first valid path for this pack type
         
@@ -188,7 +187,7 @@ class FileValidator:
         
         logger.info(f"Size validation complete: {total_files} files, {compressed_size / (1024*1024):.2f}MB compressed")
     
-    def _get_actual_compressed_size(self, pack_dirs: Dict[str, List[str]], ignored_dirs: List[str]) -> int:
+    def _get_actual_compressed_size(self, pack_dirs: Dict[str, List[str]]) -> int:
         """Calculate actual compressed size by creating a zip in memory."""
         import zipfile
         import io
@@ -199,11 +198,7 @@ class FileValidator:
             for pack_type, possible_paths in pack_dirs.items():
                 for path in possible_paths:
                     if os.path.exists(path):
-                        for root, dirs, files in os.walk(path):
-                            # Skip ignored directories
-                            if any(ignored in root for ignored in ignored_dirs):
-                                continue
-                            
+                        for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                             for file in files:
                                 file_path = os.path.join(root, file)
                                 try:
@@ -238,7 +233,7 @@ class FileValidator:
                         for file_path in block_files:
                             try:
                                 with open(file_path, 'r', encoding='utf-8') as f:
-                                    data = json.load(f)
+                                    data = parse_json(f.read())
                                 
                                 if 'minecraft:block' in data:
                                     block_data = data['minecraft:block']
@@ -0,0 +1,103 @@
+"""
+Identifier index for pack definitions.
+
+Maps every defined identifier to all the files that define it, per pack and
+asset kind, so duplicates can be reported instead of silently overriding each
+other. A second map keyed by a normalized form (lowercase, separators removed)
+groups near-duplicates. Both are filled in one pass over the parsed documents.
+"""
+
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Top-level keys whose description.identifier defines an asset
+DESCRIPTION_KINDS = {
+    'minecraft:entity': 'entity',
+    'minecraft:client_entity': 'client_entity',
+    'minecraft:item': 'item',
+    'minecraft:block': 'block',
+    'minecraft:attachable': 'attachable',
+}
+
+# Top-level maps whose keys are identifiers
+SECTION_KINDS = {
+    'animations': 'animation',
+    'animation_controllers': 'animation_controller',
+    'render_controllers': 'render_controller',
+}
+
+_SEPARATORS = re.compile(r'[\s_\-.]+')
+
+# (pack_type, kind)
+IdentifierKey = Tuple[str, str]
+
+
+def normalize_identifier(identifier: str) -> str:
+    """Lowercase an identifier and drop separators, so 'ns:Chair_Squid' and 'ns:chair-squid' match."""
+    return _SEPARATORS.sub('', identifier.lower())
+
+
+class IdentifierIndex:
+    """Identifier -> defining files, per pack and asset kind."""
+
+    def __init__(self):
+        self.identifiers: Dict[IdentifierKey, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
+        self._normalized: Dict[IdentifierKey, Dict[str, set]] = defaultdict(lambda: defaultdict(set))
+
+    @classmethod
+    def build(cls, pack_index) -> 'IdentifierIndex':
+        """Build the index from one pass over the pack index documents."""
+        index = cls()
+        for pack_type, file_path, document in pack_index.iter_documents():
+            if isinstance(document, dict):
+                index._collect(pack_type, file_path, document)
+        return index
+
+    def add(self, pack_type: str, kind: str, identifier: str, file_path: str) -> None:
+        """Record a definition of an identifier."""
+        key = (pack_type, kind)
+        self.identifiers[key][identifier].append(file_path)
+        self._normalized[key][normalize_identifier(identifier)].add(identifier)
+
+    def files_for(self, pack_type: str, kind: str, identifier: str) -> List[str]:
+        """Return every file defining an identifier."""
+        return self.identifiers.get((pack_type, kind), {}).get(identifier, [])
+
+    def duplicates(self) -> Iterator[Tuple[IdentifierKey, str, List[str]]]:
+        """Yield (key, identifier, files) for identifiers defined in more than one file."""
+        for key, identifiers in sorted(self.identifiers.items()):
+            for identifier, files in sorted(identifiers.items()):
+                if len(files) > 1:
+                    yield key, identifier, files
+
+    def near_duplicates(self) -> Iterator[Tuple[IdentifierKey, List[str]]]:
+        """Yield (key, identifiers) for distinct identifiers that only differ by case or separators."""
+        for key, groups in sorted(self._normalized.items()):
+            for _, identifiers in sorted(groups.items()):
+                if len(identifiers) > 1:
+                    yield key, sorted(identifiers)
+
+    def _collect(self, pack_type: str, file_path: str, document: Dict[str, Any]) -> None:
+        """Record the identifiers one document defines."""
+        for top_key, kind in DESCRIPTION_KINDS.items():
+            definition = document.get(top_key)
+            if isinstance(definition, dict):
+                identifier = (definition.get('description') or {}).get('identifier')
+                if isinstance(identifier, str) and identifier:
+                    self.add(pack_type, kind, identifier, file_path)
+
+        geometries = document.get('minecraft:geometry')
+        if isinstance(geometries, list):
+            for geometry in geometries:
+                if isinstance(geometry, dict):
+                    identifier = (geometry.get('description') or {}).get('identifier')
+                    if isinstance(identifier, str) and identifier:
+                        self.add(pack_type, 'geometry', identifier, file_path)
+
+        if 'format_version' in document:
+            for section, kind in SECTION_KINDS.items():
+                entries = document.get(section)
+                if isinstance(entries, dict):
+                    for identifier in entries:
+                        self.add(pack_type, kind, identifier, file_path)
@@ -45,6 +45,7 @@ class ValidationReport:
     naming_issues: List[str] = field(default_factory=list)
     technical_issues: List[str] = field(default_factory=list)
     size_issues: List[str] = field(default_factory=list)
+    metrics: Dict[str, Dict[str, Any]] = field(default_factory=lambda: defaultdict(dict))
     
     def add_result(self, result: ValidationResult):
         """Add a validation result to the report."""
@@ -83,6 +84,10 @@ class ValidationReport:
         self.naming_issues.extend(other_report.naming_issues)
         self.technical_issues.extend(other_report.technical_issues)
         self.size_issues.extend(other_report.size_issues)
+        
+        # Merge metrics sections
+        for section, entries in other_report.metrics.items():
+            self.metrics[section].update(entries)
     
     @property
     def results(self):
@@ -8,14 +8,16 @@ import glob
 import re
 from typing import Optional, List
 from .models import NamespaceInfo, ValidationResult, ValidationLevel
-from .utils import logger, safe_json_load
+from .rules import RuleSet
+from .utils import logger, parse_json, safe_json_load, walk_json
 
 
 class NamespaceExtractor:
     """Extract and validate namespace information from pack files."""
     
-    def __init__(self, settings: dict):
+    def __init__(self, settings: dict, rules: RuleSet = None):
         self.settings = settings
+        self.rules = rules if rules is not None else RuleSet.from_settings(settings)
         self.namespace_info = NamespaceInfo()
     
     def extract_namespace_info(self) -> NamespaceInfo:
@@ -128,7 +130,7 @@ class NamespaceExtractor:
         """Extract namespace from a specific file."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = parse_json(f.read())
         except (json.JSONDecodeError, UnicodeDecodeError, OSError, FileNotFoundError):
             return
         
@@ -147,7 +149,7 @@ class NamespaceExtractor:
                     identifier = description['identifier']
                     if isinstance(identifier, str) and ':' in identifier:
                         namespace = identifier.split(':')[0]
-                        if namespace not in self.settings.get('forbidden_namespaces', ['minecraft']):
+                        if namespace not in self.rules.forbidden_namespaces:
                             namespaces_found.add(namespace)
         
         # Check minecraft:item structure
@@ -159,7 +161,7 @@ class NamespaceExtractor:
                     identifier = description['identifier']
                     if isinstance(identifier, str) and ':' in identifier:
                         namespace = identifier.split(':')[0]
-                        if namespace not in self.settings.get('forbidden_namespaces', ['minecraft']):
+                        if namespace not in self.rules.forbidden_namespaces:
                             namespaces_found.add(namespace)
         
         # Check minecraft:block structure
@@ -171,7 +173,7 @@ class NamespaceExtractor:
                     identifier = description['identifier']
                     if isinstance(identifier, str) and ':' in identifier:
                         namespace = identifier.split(':')[0]
-                        if namespace not in self.settings.get('forbidden_namespaces', ['minecraft']):
+                        if namespace not in self.rules.forbidden_namespaces:
                             namespaces_found.add(namespace)
         
         # Check common identifier fields at root level
@@ -181,11 +183,11 @@ class NamespaceExtractor:
                 value = data[field]
                 if isinstance(value, str) and ':' in value:
                     namespace = value.split(':')[0]
-                    if namespace not in self.settings.get('forbidden_namespaces', ['minecraft']):
+                    if namespace not in self.rules.forbidden_namespaces:
                         namespaces_found.add(namespace)
         
         # Recursively search for any identifier-like fields
-        self._extract_namespace_recursive(data, namespaces_found)
+        self._extract_namespaces(data, namespaces_found)
         
         # Use the first valid namespace found
         if namespaces_found:
@@ -193,25 +195,14 @@ class NamespaceExtractor:
             self.namespace_info.namespace = max(namespaces_found, key=len)
             logger.debug(f"Found namespace '{self.namespace_info.namespace}' in {file_path}")
     
-    def _extract_namespace_recursive(self, data, namespaces_found, path=""):
-        """Recursively search for namespace identifiers."""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                
-                # Look for identifier fields
-                if key in ['identifier', 'name', 'id'] and isinstance(value, str) and ':' in value:
-                    namespace = value.split(':')[0]
-                    if namespace not in self.settings.get('forbidden_namespaces', ['minecraft']):
-                        namespaces_found.add(namespace)
-                
-                # Recurse into nested structures
-                self._extract_namespace_recursive(value, namespaces_found, current_path)
-                
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]" if path else f"[{i}]"
-                self._extract_namespace_recursive(item, namespaces_found, current_path)
+    def _extract_namespaces(self, data, namespaces_found):
+        """Search every key of a document for namespace identifiers."""
+        for _, key, value in walk_json(data):
+            # Look for identifier fields
+            if key in ['identifier', 'name', 'id'] and isinstance(value, str) and ':' in value:
+                namespace = value.split(':')[0]
+                if namespace not in self.rules.forbidden_namespaces:
+                    namespaces_found.add(namespace)
     
     def validate_namespace_requirements(self, report) -> None:
         """Validate namespace requirements."""
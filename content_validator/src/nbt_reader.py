@@ -0,0 +1,235 @@
+"""
+Streaming little-endian NBT reader.
+
+Bedrock .mcstructure files are uncompressed little-endian NBT. Tags are read
+one at a time and yielded as events, so no tree is built; large numeric lists
+and arrays are skipped with a seek unless they are short enough to inline.
+Memory use stays flat regardless of the structure size.
+"""
+
+import os
+import struct
+from typing import BinaryIO, Callable, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+TAG_END = 0
+TAG_BYTE = 1
+TAG_SHORT = 2
+TAG_INT = 3
+TAG_LONG = 4
+TAG_FLOAT = 5
+TAG_DOUBLE = 6
+TAG_BYTE_ARRAY = 7
+TAG_STRING = 8
+TAG_LIST = 9
+TAG_COMPOUND = 10
+TAG_INT_ARRAY = 11
+TAG_LONG_ARRAY = 12
+
+# Fixed-size payloads: tag type -> struct format
+SCALAR_FORMATS = {
+    TAG_BYTE: '<b',
+    TAG_SHORT: '<h',
+    TAG_INT: '<i',
+    TAG_LONG: '<q',
+    TAG_FLOAT: '<f',
+    TAG_DOUBLE: '<d',
+}
+SCALAR_SIZES = {tag_type: struct.calcsize(fmt) for tag_type, fmt in SCALAR_FORMATS.items()}
+
+# Array tag type -> element type
+ARRAY_ELEMENTS = {
+    TAG_BYTE_ARRAY: TAG_BYTE,
+    TAG_INT_ARRAY: TAG_INT,
+    TAG_LONG_ARRAY: TAG_LONG,
+}
+
+# Path from the root compound; strings are compound keys, ints are list indices
+NBTPath = Tuple[Union[str, int], ...]
+
+
+class NBTError(ValueError):
+    """Raised when a file is not valid little-endian NBT."""
+
+
+class NBTEvent(NamedTuple):
+    """A single tag read from the stream.
+
+    Scalars and strings carry their value. Lists and arrays carry their length,
+    and their elements as a tuple when they are numeric and short enough to
+    inline. Compounds carry neither.
+    """
+    path: NBTPath
+    tag_type: int
+    value: object = None
+    length: Optional[int] = None
+
+
+class _Frame:
+    """A compound or list currently being read."""
+    __slots__ = ('path', 'element_type', 'remaining', 'index', 'skipped')
+
+    def __init__(self, path: NBTPath, element_type: Optional[int] = None, remaining: int = 0, skipped: bool = False):
+        self.path = path
+        self.element_type = element_type  # None for compounds
+        self.remaining = remaining
+        self.index = 0
+        self.skipped = skipped
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise NBTError("Unexpected end of NBT data")
+    return data
+
+
+def _read_string(stream: BinaryIO) -> str:
+    length = struct.unpack('<H', _read_exact(stream, 2))[0]
+    return _read_exact(stream, length).decode('utf-8', errors='replace')
+
+
+def _read_length(stream: BinaryIO) -> int:
+    length = struct.unpack('<i', _read_exact(stream, 4))[0]
+    return max(length, 0)
+
+
+def _read_numbers(stream: BinaryIO, element_type: int, length: int) -> tuple:
+    fmt = SCALAR_FORMATS[element_type]
+    size = SCALAR_SIZES[element_type]
+    return struct.unpack(f'<{length}{fmt[1]}', _read_exact(stream, size * length))
+
+
+def _skip_bytes(stream: BinaryIO, size: int) -> None:
+    if size:
+        stream.seek(size, os.SEEK_CUR)
+
+
+def iter_nbt(stream: BinaryIO, skip: Optional[Callable[[NBTPath], bool]] = None,
+             inline_limit: int = 16) -> Iterator[NBTEvent]:
+    """
+    Yield NBTEvents for every tag in a little-endian NBT stream, depth first.
+
+    Args:
+        stream: Binary stream positioned at the root tag
+        skip: Optional predicate; containers whose path it accepts are read
+            past without yielding anything for their contents
+        inline_limit: Numeric lists and arrays up to this length are yielded
+            with their elements, longer ones are skipped with a seek
+    """
+    root_type = _read_exact(stream, 1)[0]
+    if root_type != TAG_COMPOUND:
+        raise NBTError(f"Root tag must be a compound, found type {root_type}")
+    _read_string(stream)
+
+    yield NBTEvent((), TAG_COMPOUND)
+    stack: List[_Frame] = [_Frame(())]
+
+    while stack:
+        frame = stack[-1]
+
+        if frame.element_type is None:
+            tag_type = _read_exact(stream, 1)[0]
+            if tag_type == TAG_END:
+                stack.pop()
+                continue
+            path = frame.path + (_read_string(stream),)
+        else:
+            if frame.remaining == 0:
+                stack.pop()
+                continue
+            tag_type = frame.element_type
+            path = frame.path + (frame.index,)
+            frame.index += 1
+            frame.remaining -= 1
+
+        skipped = frame.skipped or (skip is not None and skip(path))
+
+        if tag_type in SCALAR_FORMATS:
+            if skipped:
+                _skip_bytes(stream, SCALAR_SIZES[tag_type])
+            else:
+                value = struct.unpack(SCALAR_FORMATS[tag_type], _read_exact(stream, SCALAR_SIZES[tag_type]))[0]
+                yield NBTEvent(path, tag_type, value)
+
+        elif tag_type == TAG_STRING:
+            if skipped:
+                _skip_bytes(stream, struct.unpack('<H', _read_exact(stream, 2))[0])
+            else:
+                yield NBTEvent(path, tag_type, _read_string(stream))
+
+        elif tag_type in ARRAY_ELEMENTS:
+            element_type = ARRAY_ELEMENTS[tag_type]
+            length = _read_length(stream)
+            if skipped or length > inline_limit:
+                _skip_bytes(stream, SCALAR_SIZES[element_type] * length)
+                values = None
+            else:
+                values = _read_numbers(stream, element_type, length)
+            if not skipped:
+                yield NBTEvent(path, tag_type, values, length)
+
+        elif tag_type == TAG_LIST:
+            element_type = _read_exact(stream, 1)[0]
+            length = _read_length(stream)
+            if element_type in SCALAR_FORMATS:
+                # Numeric lists are consumed here; they are the bulk of structure data
+                if skipped or length > inline_limit:
+                    _skip_bytes(stream, SCALAR_SIZES[element_type] * length)
+                    values = None
+                else:
+                    values = _read_numbers(stream, element_type, length)
+                if not skipped:
+                    yield NBTEvent(path, tag_type, values, length)
+            else:
+                if not skipped:
+                    yield NBTEvent(path, tag_type, None, length)
+                if length and element_type != TAG_END:
+                    stack.append(_Frame(path, element_type, length, skipped))
+
+        elif tag_type == TAG_COMPOUND:
+            if not skipped:
+                yield NBTEvent(path, tag_type)
+            stack.append(_Frame(path, skipped=skipped))
+
+        else:
+            raise NBTError(f"Unknown NBT tag type {tag_type} at {'/'.join(map(str, path))}")
+
+
+class StructureSummary(NamedTuple):
+    """What a .mcstructure file places in the world."""
+    size: Tuple[int, ...]
+    block_names: FrozenSet[str]
+    entity_identifiers: Tuple[str, ...]
+    item_names: FrozenSet[str]
+
+
+def _skip_structure_bulk(path: NBTPath) -> bool:
+    """Block indices are only numbers; skip them without producing events."""
+    return path == ('structure', 'block_indices')
+
+
+def read_structure_summary(file_path: str) -> StructureSummary:
+    """Stream a .mcstructure file and collect its size, palette, entities and items."""
+    size: Tuple[int, ...] = ()
+    block_names = set()
+    entity_identifiers = []
+    item_names = set()
+
+    with open(file_path, 'rb') as f:
+        for event in iter_nbt(f, skip=_skip_structure_bulk):
+            path = event.path
+            if event.tag_type == TAG_LIST and path == ('size',) and event.value:
+                size = tuple(event.value)
+            elif event.tag_type != TAG_STRING:
+                continue
+            # structure/palette/<name>/block_palette/<i>/name
+            elif len(path) == 6 and path[:2] == ('structure', 'palette') and path[3] == 'block_palette' and path[5] == 'name':
+                block_names.add(event.value)
+            # structure/entities/<i>/identifier
+            elif len(path) == 4 and path[:2] == ('structure', 'entities') and path[3] == 'identifier':
+                entity_identifiers.append(event.value)
+            # Item stacks in entity equipment and container block entities; attributes also use 'Name'
+            elif path[-1] == 'Name' and event.value and 'Attributes' not in path:
+                item_names.add(event.value)
+
+    return StructureSummary(size, frozenset(block_names), tuple(entity_identifiers), frozenset(item_names))
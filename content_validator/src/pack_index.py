@@ -0,0 +1,150 @@
+"""
+Pack index and shared document cache.
+
+The behavior and resource packs are scanned once; tests look files up in the
+index and read parsed JSON from the shared cache instead of walking and
+parsing the packs themselves.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .identifier_index import IdentifierIndex
+from .reference_graph import ReferenceGraph
+from .rules import RuleSet
+from .utils import find_pack_directories, get_first_existing_path, hash_file, load_bedrock_json, walk_pack
+
+_MISSING = object()
+
+
+class PackIndex:
+    """Single-pass index of pack files with a shared parsed-JSON cache."""
+
+    def __init__(self, pack_paths: Optional[Dict[str, str]] = None, rules: Optional[RuleSet] = None):
+        self.pack_paths = self.resolve_pack_paths(pack_paths)
+        self.rules = rules
+        self.files: Dict[str, List[str]] = {}
+        # (pack_type, top-level folder) -> files anywhere below it
+        self._folders: Dict[Tuple[str, str], List[str]] = {}
+        self._documents: Dict[str, Any] = {}
+        self._sizes: Dict[str, int] = {}
+        self._hashes: Dict[str, str] = {}
+        self._reference_graph: Optional[ReferenceGraph] = None
+        self._identifier_index: Optional[IdentifierIndex] = None
+        self._scan()
+
+    @staticmethod
+    def resolve_pack_paths(pack_paths: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Use the given pack paths, falling back to the first existing directory per pack type."""
+        resolved = {}
+        for pack_type, possible_paths in find_pack_directories().items():
+            path = (pack_paths or {}).get(pack_type)
+            if not path or not os.path.isdir(path):
+                path = get_first_existing_path(possible_paths)
+            if path:
+                resolved[pack_type] = path
+        return resolved
+
+    def _scan(self) -> None:
+        """Walk each pack once, recording files in a stable order and skipping ignored folders."""
+        for pack_type, root in self.pack_paths.items():
+            files = []
+            ignore = self.rules.ignore_rules(root) if self.rules is not None else None
+            for dir_path, dir_names, file_names in walk_pack(root, ignore):
+                relative_dir = os.path.relpath(dir_path, root)
+                folder = relative_dir.split(os.sep, 1)[0] if relative_dir != os.curdir else ''
+                folder_files = self._folders.setdefault((pack_type, folder), [])
+                for file_name in file_names:
+                    file_path = os.path.join(dir_path, file_name)
+                    files.append(file_path)
+                    folder_files.append(file_path)
+            self.files[pack_type] = files
+
+    def iter_files(self, pack_type: Optional[str] = None,
+                   extensions: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, str]]:
+        """Yield (pack_type, file_path) pairs, optionally filtered by pack and extension."""
+        suffixes = tuple(ext.lower() for ext in extensions) if extensions else None
+        pack_types = [pack_type] if pack_type else list(self.files)
+        for current_type in pack_types:
+            for file_path in self.files.get(current_type, []):
+                if suffixes is None or file_path.lower().endswith(suffixes):
+                    yield current_type, file_path
+
+    def iter_folder(self, pack_type: str, folder: str,
+                    extensions: Optional[Iterable[str]] = None) -> Iterator[str]:
+        """Yield the files anywhere below a pack folder such as 'animations' or 'models/entity'."""
+        root = self.pack_paths.get(pack_type)
+        if root is None:
+            return
+
+        top, _, rest = folder.strip('/').partition('/')
+        # Nested folders filter the top-level folder's list by path prefix
+        prefix = os.path.join(root, top, *rest.split('/')) + os.sep if rest else None
+        suffixes = tuple(ext.lower() for ext in extensions) if extensions else None
+        for file_path in self._folders.get((pack_type, top), []):
+            if prefix is not None and not file_path.startswith(prefix):
+                continue
+            if suffixes is None or file_path.lower().endswith(suffixes):
+                yield file_path
+
+    def load_json(self, file_path: str) -> Optional[Any]:
+        """Return the parsed document for a file, parsing it at most once."""
+        document = self._documents.get(file_path, _MISSING)
+        if document is _MISSING:
+            document = load_bedrock_json(file_path)
+            self._documents[file_path] = document
+        return document
+
+    def iter_documents(self, pack_type: Optional[str] = None) -> Iterator[Tuple[str, str, Any]]:
+        """Yield (pack_type, file_path, document) for every JSON file that parses."""
+        for current_type, file_path in self.iter_files(pack_type, ('.json',)):
+            document = self.load_json(file_path)
+            if document is not None:
+                yield current_type, file_path, document
+
+    def file_size(self, file_path: str) -> int:
+        """Return a file's size in bytes, statting it at most once."""
+        size = self._sizes.get(file_path)
+        if size is None:
+            try:
+                size = os.path.getsize(file_path)
+            except OSError:
+                size = -1
+            self._sizes[file_path] = size
+        return size
+
+    def file_hashes(self, file_paths: Iterable[str], max_workers: Optional[int] = None) -> Dict[str, str]:
+        """Return SHA-256 digests for files, hashing any not seen before on a thread pool."""
+        file_paths = list(file_paths)
+        missing = [file_path for file_path in file_paths if file_path not in self._hashes]
+
+        if missing:
+            # Hashing is I/O bound and hashlib releases the GIL, so threads scale
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for file_path, digest in zip(missing, executor.map(self._hash_or_none, missing)):
+                    if digest is not None:
+                        self._hashes[file_path] = digest
+
+        return {file_path: self._hashes[file_path] for file_path in file_paths if file_path in self._hashes}
+
+    @staticmethod
+    def _hash_or_none(file_path: str) -> Optional[str]:
+        try:
+            return hash_file(file_path)
+        except OSError:
+            return None
+
+    @property
+    def reference_graph(self) -> ReferenceGraph:
+        """Cross-reference graph of the indexed packs, built on first use and shared."""
+        if self._reference_graph is None:
+            self._reference_graph = ReferenceGraph.build(self)
+        return self._reference_graph
+
+    @property
+    def identifier_index(self) -> IdentifierIndex:
+        """Identifier -> defining files index of the indexed packs, built on first use and shared."""
+        if self._identifier_index is None:
+            self._identifier_index = IdentifierIndex.build(self)
+        return self._identifier_index
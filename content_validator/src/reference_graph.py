@@ -0,0 +1,218 @@
+"""
+Cross-reference graph for pack assets.
+
+Built in a single pass over the pack index: every definition (geometry,
+animation, controller, render controller, sound event, texture or sound file)
+is stored in a hash map per (pack, kind), and every reference from client
+entities, attachables, behavior entities and the RP lookup tables is stored as
+an edge. Resolving an edge is a dictionary lookup.
+"""
+
+import os
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .utils import walk_json
+
+# Reference kind -> definition kinds that satisfy it; entity 'animations' maps
+# accept both animations and animation controllers
+RESOLVES_TO = {
+    'animation': ('animation', 'animation_controller'),
+}
+
+TEXTURE_EXTENSIONS = ('.png', '.tga', '.jpg', '.jpeg')
+SOUND_EXTENSIONS = ('.ogg', '.wav', '.fsb')
+
+# Kinds defined by files rather than identifiers -> their extensions
+FILE_KINDS = {
+    'texture': TEXTURE_EXTENSIONS,
+    'sound_file': SOUND_EXTENSIONS,
+}
+
+# Description blocks that reference RP assets
+CLIENT_DESCRIPTION_KEYS = ('minecraft:client_entity', 'minecraft:attachable')
+
+# sounds.json playback settings; their values never name sound events
+SOUND_SETTING_KEYS = ('volume', 'pitch')
+
+# RP lookup tables that map short names to texture paths
+TEXTURE_TABLE_FILES = ('item_texture.json', 'terrain_texture.json')
+
+
+class Reference(NamedTuple):
+    """An edge from a file to an asset it depends on."""
+    pack_type: str
+    kind: str
+    target: str
+    source: str
+    json_path: str
+
+
+class ReferenceGraph:
+    """Definition maps and reference edges for the indexed packs."""
+
+    def __init__(self):
+        # (pack_type, kind) -> {identifier: defining file}
+        self.definitions: Dict[Tuple[str, str], Dict[str, str]] = defaultdict(dict)
+        self.references: List[Reference] = []
+
+    @classmethod
+    def build(cls, pack_index) -> 'ReferenceGraph':
+        """Build the graph from one pass over the pack index."""
+        graph = cls()
+
+        for pack_type, file_path in pack_index.iter_files():
+            lower_path = file_path.lower()
+            if lower_path.endswith(TEXTURE_EXTENSIONS):
+                graph.define(pack_type, 'texture', graph._asset_name(pack_index, pack_type, file_path), file_path)
+            elif lower_path.endswith(SOUND_EXTENSIONS):
+                graph.define(pack_type, 'sound_file', graph._asset_name(pack_index, pack_type, file_path), file_path)
+
+        for pack_type, file_path, document in pack_index.iter_documents():
+            graph._collect(pack_type, file_path, document)
+
+        return graph
+
+    def define(self, pack_type: str, kind: str, identifier: str, file_path: str) -> None:
+        """Record where an identifier is defined; the first definition wins."""
+        self.definitions[(pack_type, kind)].setdefault(identifier, file_path)
+
+    def add_reference(self, pack_type: str, kind: str, target: Any, source: str, json_path: str) -> None:
+        """Record a reference edge, ignoring empty or non-string targets."""
+        if isinstance(target, str) and target:
+            self.references.append(Reference(pack_type, kind, target, source, json_path))
+
+    def lookup(self, pack_type: str, kind: str, identifier: str) -> Optional[str]:
+        """Return the file defining an identifier, or None."""
+        # Asset paths are written without an extension, but the game also accepts one
+        if kind in FILE_KINDS:
+            base, extension = os.path.splitext(identifier)
+            if extension.lower() in FILE_KINDS[kind]:
+                identifier = base
+
+        for definition_kind in RESOLVES_TO.get(kind, (kind,)):
+            file_path = self.definitions.get((pack_type, definition_kind), {}).get(identifier)
+            if file_path is not None:
+                return file_path
+        return None
+
+    def resolve(self, reference: Reference) -> Optional[str]:
+        """Return the file a reference points to, or None if it is dangling."""
+        return self.lookup(reference.pack_type, reference.kind, reference.target)
+
+    def dangling(self) -> Iterator[Reference]:
+        """Yield every reference whose target is not defined in its pack."""
+        for reference in self.references:
+            if self.resolve(reference) is None:
+                yield reference
+
+    def _asset_name(self, pack_index, pack_type: str, file_path: str) -> str:
+        """Pack-relative path without extension, as used by texture and sound references."""
+        relative_path = os.path.relpath(file_path, pack_index.pack_paths[pack_type])
+        return os.path.splitext(relative_path)[0].replace(os.sep, '/')
+
+    def _collect(self, pack_type: str, file_path: str, document: Any) -> None:
+        """Record the definitions and references of one parsed document."""
+        file_name = os.path.basename(file_path).lower()
+
+        if file_name == 'flipbook_textures.json' and isinstance(document, list):
+            for index, entry in enumerate(document):
+                if isinstance(entry, dict):
+                    self.add_reference(pack_type, 'texture', entry.get('flipbook_texture'), file_path, f"{index}.flipbook_texture")
+            return
+
+        if not isinstance(document, dict):
+            return
+
+        # Definitions
+        geometries = document.get('minecraft:geometry')
+        if isinstance(geometries, list):
+            for geometry in geometries:
+                if isinstance(geometry, dict):
+                    identifier = (geometry.get('description') or {}).get('identifier')
+                    if isinstance(identifier, str):
+                        self.define(pack_type, 'geometry', identifier, file_path)
+        for key in document:
+            # Legacy geometry files: "geometry.name" or "geometry.name:geometry.parent" at the top level
+            if key.startswith('geometry.'):
+                self.define(pack_type, 'geometry', key.split(':', 1)[0], file_path)
+
+        for section, kind in (('animations', 'animation'),
+                              ('animation_controllers', 'animation_controller'),
+                              ('render_controllers', 'render_controller')):
+            entries = document.get(section)
+            if isinstance(entries, dict) and 'format_version' in document:
+                for identifier in entries:
+                    self.define(pack_type, kind, identifier, file_path)
+
+        if file_name == 'sound_definitions.json':
+            self._collect_sound_definitions(pack_type, file_path, document)
+        elif file_name == 'sounds.json':
+            self._collect_sound_events(pack_type, file_path, document)
+        elif file_name in TEXTURE_TABLE_FILES:
+            self._collect_texture_table(pack_type, file_path, document)
+
+        # References from entity descriptions
+        for key in CLIENT_DESCRIPTION_KEYS:
+            description = (document.get(key) or {}).get('description')
+            if isinstance(description, dict):
+                self._collect_client_description(pack_type, file_path, description, key)
+
+        description = (document.get('minecraft:entity') or {}).get('description')
+        if isinstance(description, dict):
+            prefix = 'minecraft:entity.description'
+            for name, target in (description.get('animations') or {}).items():
+                self.add_reference(pack_type, 'animation', target, file_path, f"{prefix}.animations.{name}")
+
+    def _collect_client_description(self, pack_type: str, file_path: str, description: Dict[str, Any], key: str) -> None:
+        """References from a client entity or attachable description."""
+        prefix = f"{key}.description"
+
+        for section, kind in (('geometry', 'geometry'), ('textures', 'texture'), ('animations', 'animation')):
+            entries = description.get(section)
+            if isinstance(entries, dict):
+                for name, target in entries.items():
+                    self.add_reference(pack_type, kind, target, file_path, f"{prefix}.{section}.{name}")
+
+        for index, entry in enumerate(description.get('render_controllers') or []):
+            # Either "controller.render.x" or {"controller.render.x": "condition"}
+            targets = entry.keys() if isinstance(entry, dict) else [entry]
+            for target in targets:
+                self.add_reference(pack_type, 'render_controller', target, file_path, f"{prefix}.render_controllers.{index}")
+
+        sound_effects = description.get('sound_effects')
+        if isinstance(sound_effects, dict):
+            for name, target in sound_effects.items():
+                if isinstance(target, dict):
+                    target = target.get('sound_event')
+                self.add_reference(pack_type, 'sound', target, file_path, f"{prefix}.sound_effects.{name}")
+
+    def _collect_sound_definitions(self, pack_type: str, file_path: str, document: Dict[str, Any]) -> None:
+        """Sound events are definitions; the files they play are references."""
+        # Older files list definitions at the top level instead of under 'sound_definitions'
+        definitions = document.get('sound_definitions', document)
+        for event, definition in definitions.items():
+            if not isinstance(definition, dict):
+                continue
+            self.define(pack_type, 'sound', event, file_path)
+            for index, sound in enumerate(definition.get('sounds') or []):
+                target = sound.get('name') if isinstance(sound, dict) else sound
+                self.add_reference(pack_type, 'sound_file', target, file_path, f"sound_definitions.{event}.sounds.{index}")
+
+    def _collect_sound_events(self, pack_type: str, file_path: str, document: Dict[str, Any]) -> None:
+        """Every 'sound' string in sounds.json names a sound event."""
+        for json_path, key, value in walk_json(document, prune=lambda path, key, value: key in SOUND_SETTING_KEYS):
+            if key == 'sound' and isinstance(value, str):
+                self.add_reference(pack_type, 'sound', value, file_path, json_path)
+
+    def _collect_texture_table(self, pack_type: str, file_path: str, document: Dict[str, Any]) -> None:
+        """Texture paths listed in item_texture.json and terrain_texture.json."""
+        for name, entry in (document.get('texture_data') or {}).items():
+            textures = entry.get('textures') if isinstance(entry, dict) else None
+            if not isinstance(textures, list):
+                textures = [textures]
+            for index, texture in enumerate(textures):
+                # Variations are objects with a 'path'
+                if isinstance(texture, dict):
+                    texture = texture.get('path')
+                self.add_reference(pack_type, 'texture', texture, file_path, f"texture_data.{name}.textures.{index}")
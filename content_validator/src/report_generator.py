@@ -49,6 +49,7 @@ class ReportGenerator:
                     }
                     for result in report.validation_results
                 ],
+                'metrics': report.metrics,
                 'namespace_info': {
                     'namespace': namespace_info.namespace,
                     'studio_name': namespace_info.studio_name,
@@ -57,8 +58,8 @@ class ReportGenerator:
             }
             
             # Save report to file
-            report_path = "data/content_validator_report.json"
-            os.makedirs(os.path.dirname(report_path), exist_ok=True)
+            report_path = self.settings.get('report_path') or "data/content_validator_report.json"
+            os.makedirs(os.path.dirname(report_path) or '.', exist_ok=True)
             
             with open(report_path, 'w', encoding='utf-8') as f:
                 json.dump(report_data, f, indent=2)
@@ -69,7 +70,8 @@ class ReportGenerator:
             logger.info("Report generation disabled by settings")
         
         # Display summary
-        self._display_summary(report, namespace_info)
+        if self.settings.get('display_summary', True):
+            self._display_summary(report, namespace_info)
     
     def _display_summary(self, report: ValidationReport, namespace_info) -> None:
         """Display validation summary."""
@@ -0,0 +1,208 @@
+"""
+Compiled validation rule set.
+
+Settings from filter.json are read once and compiled into an immutable RuleSet
+holding pre-lowercased pattern tuples, frozensets for namespace lookups and
+precompiled regexes. A single instance is shared by every test.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Pattern, Tuple
+
+from .utils import IgnoreRules
+
+
+# (original, lowercase) pairs - the original is kept for reporting
+PatternPairs = Tuple[Tuple[str, str], ...]
+
+# Prefixes checked by the naming test; the stricter naming_patterns setting is not applied
+DEFAULT_NAMING_PATTERNS = {
+    'geometry': 'geometry.{namespace}.',
+    'animation': 'animation.{namespace}.',
+    'render_controller': 'controller.render.{namespace}.',
+}
+
+DEFAULT_PROHIBITED_TERMINOLOGY = ('mod', 'modded', 'modification')
+DEFAULT_CHEAT_PATTERNS = (
+    'invincibility', 'invulnerability', 'instakill', 'auto_break', 'auto_mine',
+    'clipping', 'aura', 'aimbot', 'console_command', 'keep_inventory',
+    'fire_tick', 'grief_mobs', 'player_locator', 'inventory_locator'
+)
+DEFAULT_DISALLOWED_GENRES = (
+    'one_block', 'skyblock', 'lucky_block', 'random_op', 'x_ray', 'xray',
+    'dance_creator', 'skin_generator', 'resource_generator', 'cape_generator'
+)
+DEFAULT_FORBIDDEN_ITEMS = ('horse_armor', 'ender_pearl', 'saddle', 'portal_frame', 'written_book')
+
+# Terms that contain 'mod' but are ordinary technical vocabulary
+TECHNICAL_TERMS = ('modules', 'modular', 'modification', 'modify')
+
+PLAYER_INDICATORS = (
+    'player_character', 'player_model', 'player_skin', 'player_entity',
+    'minecraft:player', 'player_modification'
+)
+WEAPON_INDICATORS = (
+    'gun', 'firearm', 'rifle', 'pistol', 'shotgun', 'sniper',
+    'trigger', 'ammo', 'bullet', 'projectile_weapon'
+)
+DEPENDENCY_INDICATORS = (
+    'external', 'patreon', 'discord', 'website', 'download',
+    'external_requirement', 'external_dependency'
+)
+TICKING_PATTERNS = ('ticking', 'tickarea', 'tick_area', 'tickingarea')
+USER_FACING_WORDS = ('welcome', 'hello', 'goodbye', 'error', 'success', 'failed')
+EXPERIMENTAL_MODULES = ('@minecraft/server-gametest', '@minecraft/server-admin')
+
+# Paths and file names where vanilla identifiers are references, not definitions
+LEGITIMATE_REFERENCE_PATHS = (
+    'result.item', 'key.item', 'tags.item', 'item', 'input', 'output',
+    'ingredient', 'materials', 'drops', 'pools.entries.name', 'give',
+    'item_name', 'spawn_item'
+)
+LEGITIMATE_REFERENCE_FILES = (
+    'recipe.json', 'loot_table.json', 'trade.json',
+    'crafting_item_catalog.json', 'trading.json'
+)
+IDENTIFIER_DEFINITION_PATHS = (
+    'minecraft:entity.description.identifier',
+    'minecraft:block.description.identifier',
+    'minecraft:item.description.identifier',
+    'description.identifier',
+    'identifier'
+)
+
+
+def _pairs(patterns: Iterable[str]) -> PatternPairs:
+    """Pair each pattern with its lowercase form, dropping duplicates but keeping order."""
+    seen = set()
+    pairs = []
+    for pattern in patterns:
+        if isinstance(pattern, str) and pattern and pattern not in seen:
+            seen.add(pattern)
+            pairs.append((pattern, pattern.lower()))
+    return tuple(pairs)
+
+
+def _compile_any(*groups: PatternPairs) -> Optional[Pattern]:
+    """Compile a single alternation matching any lowercase needle, or None if there are none."""
+    needles = {needle for group in groups for _, needle in group}
+    if not needles:
+        return None
+    # Longest first so overlapping needles prefer the most specific match
+    ordered = sorted(needles, key=lambda needle: (-len(needle), needle))
+    return re.compile('|'.join(re.escape(needle) for needle in ordered))
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """Immutable, hashable view of the validation settings."""
+    forbidden_namespaces: FrozenSet[str] = frozenset({'minecraft'})
+    vanilla_namespaces: FrozenSet[str] = frozenset({'minecraft'})
+    ignored_directories: FrozenSet[str] = frozenset()
+    ignore_patterns: Tuple[str, ...] = ()
+    naming_patterns: Tuple[Tuple[str, str], ...] = tuple(sorted(DEFAULT_NAMING_PATTERNS.items()))
+    debug_statement_patterns: PatternPairs = ()
+    forbidden_text_patterns: PatternPairs = ()
+    prohibited_terminology: PatternPairs = _pairs(DEFAULT_PROHIBITED_TERMINOLOGY)
+    cheat_patterns: PatternPairs = _pairs(DEFAULT_CHEAT_PATTERNS)
+    disallowed_genres: PatternPairs = _pairs(DEFAULT_DISALLOWED_GENRES)
+    forbidden_items: PatternPairs = _pairs(DEFAULT_FORBIDDEN_ITEMS)
+    player_indicators: PatternPairs = _pairs(PLAYER_INDICATORS)
+    weapon_indicators: PatternPairs = _pairs(WEAPON_INDICATORS)
+    dependency_indicators: PatternPairs = _pairs(DEPENDENCY_INDICATORS)
+    ticking_patterns: PatternPairs = _pairs(TICKING_PATTERNS)
+    user_facing_words: PatternPairs = _pairs(USER_FACING_WORDS)
+    experimental_modules: FrozenSet[str] = frozenset(EXPERIMENTAL_MODULES)
+    guideline_size_limit_mb: float = 25
+    guideline_min_file_count: int = 5
+
+    # Derived lookups, excluded from equality and hashing
+    debug_statement_regex: Optional[Pattern] = field(default=None, init=False, compare=False, repr=False)
+    prohibited_content_regex: Optional[Pattern] = field(default=None, init=False, compare=False, repr=False)
+    user_facing_regex: Optional[Pattern] = field(default=None, init=False, compare=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'debug_statement_regex', _compile_any(self.debug_statement_patterns))
+        object.__setattr__(self, 'prohibited_content_regex', _compile_any(
+            self.prohibited_terminology, self.cheat_patterns, self.disallowed_genres, self.forbidden_items
+        ))
+        object.__setattr__(self, 'user_facing_regex', _compile_any(self.user_facing_words))
+
+    @classmethod
+    def from_settings(cls, settings: Optional[Dict[str, Any]]) -> 'RuleSet':
+        """Compile a rule set from filter settings, falling back to defaults for missing keys."""
+        settings = settings or {}
+        org = settings.get('organization_specific', {}) or {}
+        guidelines = settings.get('addon_guidelines', {}) or {}
+
+        return cls(
+            forbidden_namespaces=frozenset(settings.get('forbidden_namespaces', ['minecraft'])),
+            vanilla_namespaces=frozenset(settings.get('vanilla_namespaces', ['minecraft'])),
+            ignored_directories=frozenset(settings.get('ignored_directories', [])),
+            ignore_patterns=tuple(settings.get('ignore_patterns', [])),
+            debug_statement_patterns=_pairs(org.get('debug_statement_patterns', [])),
+            forbidden_text_patterns=_pairs(org.get('forbidden_text_patterns', [])),
+            prohibited_terminology=_pairs(guidelines.get('prohibited_terminology', DEFAULT_PROHIBITED_TERMINOLOGY)),
+            cheat_patterns=_pairs(guidelines.get('cheat_patterns', DEFAULT_CHEAT_PATTERNS)),
+            disallowed_genres=_pairs(guidelines.get('disallowed_genres', DEFAULT_DISALLOWED_GENRES)),
+            forbidden_items=_pairs(guidelines.get('forbidden_items', DEFAULT_FORBIDDEN_ITEMS)),
+            guideline_size_limit_mb=guidelines.get('size_limit_mb', 25),
+            guideline_min_file_count=guidelines.get('min_file_count', 5),
+        )
+
+    def ignore_rules(self, root: str) -> IgnoreRules:
+        """Ignore rules for a pack: ignored directories, ignore patterns and the pack's .validatorignore."""
+        return IgnoreRules.for_pack(root, self.ignored_directories, self.ignore_patterns)
+
+    def naming_prefix(self, kind: str, namespace: str) -> Optional[str]:
+        """Expand the naming pattern for an asset kind with the pack namespace."""
+        for pattern_kind, pattern in self.naming_patterns:
+            if pattern_kind == kind:
+                return pattern.replace('{namespace}', namespace)
+        return None
+
+    def namespace_of(self, value: str) -> Optional[str]:
+        """Return the namespace part of an identifier-like string, if any."""
+        if ':' in value:
+            return value.split(':', 1)[0]
+        return None
+
+    def is_forbidden_namespace(self, value: str) -> bool:
+        """Check whether an identifier-like string uses a forbidden namespace."""
+        namespace = self.namespace_of(value)
+        return namespace is not None and namespace in self.forbidden_namespaces
+
+    def is_reference_path(self, path: str) -> bool:
+        """
+        Check if a JSON path lies where vanilla identifiers are references (ingredients, drops...).
+
+        Every path below a reference path is one too, so walks can prune there.
+        """
+        path_lower = path.lower()
+        return any(ref_path in path_lower for ref_path in LEGITIMATE_REFERENCE_PATHS)
+
+    def is_identifier_definition(self, path: str, file_path: str) -> bool:
+        """Check if a JSON path represents a new identifier definition (not a reference)."""
+        if self.is_reference_path(path):
+            return False
+        path_lower = path.lower()
+
+        file_name = file_path.split('\\')[-1].split('/')[-1]
+        if any(ref_file in file_name for ref_file in LEGITIMATE_REFERENCE_FILES):
+            return False
+
+        return any(def_path in path_lower for def_path in IDENTIFIER_DEFINITION_PATHS)
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable digest of the rules, usable as a cache key across processes."""
+        digest = hashlib.sha256()
+        for rule_field in fields(self):
+            if rule_field.compare:
+                value = getattr(self, rule_field.name)
+                if isinstance(value, frozenset):
+                    value = sorted(value)
+                digest.update(f"{rule_field.name}={value!r};".encode('utf-8'))
+        return digest.hexdigest()
@@ -0,0 +1,175 @@
+"""
+JSON Schema validation for Bedrock definition files.
+
+Schemas bundled in ../schemas are selected per document by top-level key and
+format_version. Each schema is compiled into a validator once per process and
+reused for every file; large batches are spread over a process pool.
+"""
+
+import os
+import json
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from typing import Any, Dict, List, Optional, Tuple
+
+from .models import ValidationResult, ValidationLevel
+from .utils import logger, JSONSCHEMA_AVAILABLE
+
+if JSONSCHEMA_AVAILABLE:
+    from jsonschema.validators import validator_for
+
+SCHEMA_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', 'schemas'))
+
+# Compiled validators keyed by schema path, filled lazily in every process
+_VALIDATOR_CACHE: Dict[str, Any] = {}
+
+# (file_path, schema_path, document)
+SchemaJob = Tuple[str, str, Any]
+
+
+def parse_format_version(value: Any) -> Tuple[int, ...]:
+    """Parse a format_version string like '1.16.100' into a comparable tuple."""
+    if not isinstance(value, str):
+        return ()
+    parts = []
+    for part in value.split('.'):
+        if not part.isdigit():
+            break
+        parts.append(int(part))
+    return tuple(parts)
+
+
+def get_schema_validator(schema_path: str):
+    """Return the compiled validator for a schema, compiling it on first use."""
+    validator = _VALIDATOR_CACHE.get(schema_path)
+    if validator is None:
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            schema = json.load(f)
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = validator_class(schema)
+        _VALIDATOR_CACHE[schema_path] = validator
+    return validator
+
+
+def validate_document(schema_path: str, document: Any, max_errors: int) -> List[Tuple[str, str]]:
+    """Validate one document, returning up to max_errors (json_path, message) pairs."""
+    validator = get_schema_validator(schema_path)
+    errors = []
+    try:
+        for error in islice(validator.iter_errors(document), max_errors):
+            json_path = '.'.join(str(part) for part in error.absolute_path) or '<root>'
+            message = error.message if len(error.message) <= 200 else error.message[:197] + '...'
+            errors.append((json_path, message))
+    except RecursionError:
+        # jsonschema descends recursively and cannot follow documents this deep
+        errors.append(('<root>', 'document is nested too deeply to validate'))
+    return errors
+
+
+def _validate_batch(batch: List[SchemaJob], max_errors: int) -> List[Tuple[str, str, List[Tuple[str, str]]]]:
+    """Pool worker: validate a batch of documents with this process's cached validators."""
+    return [
+        (file_path, schema_path, validate_document(schema_path, document, max_errors))
+        for file_path, schema_path, document in batch
+    ]
+
+
+class SchemaCatalog:
+    """Selects the bundled schema for a document by top-level key and format_version."""
+
+    def __init__(self, schema_dir: str = SCHEMA_DIR):
+        self.schema_dir = schema_dir
+        self.entries: List[Dict[str, Any]] = []
+
+        index_path = os.path.join(schema_dir, 'index.json')
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Schema index could not be loaded from {index_path}: {e}")
+            return
+
+        for entry in index.get('schemas', []):
+            self.entries.append({
+                'key': entry['key'],
+                'schema_path': os.path.join(schema_dir, entry['schema']),
+                'min_version': parse_format_version(entry.get('min_format_version')),
+                'max_version': parse_format_version(entry.get('max_format_version')),
+            })
+
+    def select(self, document: Any) -> Optional[str]:
+        """Return the schema path for a document, or None if no bundled schema applies."""
+        if not isinstance(document, dict):
+            return None
+
+        version = parse_format_version(document.get('format_version'))
+        for entry in self.entries:
+            if entry['key'] not in document:
+                continue
+            if entry['min_version'] and version < entry['min_version']:
+                continue
+            if entry['max_version'] and version >= entry['max_version']:
+                continue
+            return entry['schema_path']
+        return None
+
+
+class SchemaValidator:
+    """Validate parsed pack documents against the bundled JSON Schemas."""
+
+    def __init__(self, settings: dict, pack_index):
+        self.settings = settings
+        self.pack_index = pack_index
+        schema_settings = settings.get('schema_validation', {})
+        self.enabled = schema_settings.get('enabled', True)
+        self.max_errors = schema_settings.get('max_errors_per_file', 5)
+        self.parallel_threshold = schema_settings.get('parallel_threshold', 500)
+        self.max_workers = schema_settings.get('max_workers') or os.cpu_count() or 1
+        self.catalog = SchemaCatalog(schema_settings.get('schema_dir') or SCHEMA_DIR)
+
+    def validate_schemas(self, report) -> None:
+        """Validate every document that has a matching schema."""
+        if not self.enabled:
+            logger.info("Schema validation disabled in settings")
+            return
+
+        if not JSONSCHEMA_AVAILABLE:
+            logger.warning("jsonschema not available - skipping schema validation")
+            return
+
+        jobs: List[SchemaJob] = []
+        for _, file_path, document in self.pack_index.iter_documents():
+            schema_path = self.catalog.select(document)
+            if schema_path:
+                jobs.append((file_path, schema_path, document))
+
+        logger.info(f"Validating {len(jobs)} documents against bundled schemas...")
+
+        for file_path, schema_path, errors in self._run_jobs(jobs):
+            for json_path, message in errors:
+                report.add_result(ValidationResult(
+                    ValidationLevel.ERROR,
+                    f"Schema violation at {json_path}: {message}",
+                    file_path,
+                    context={'schema': os.path.basename(schema_path), 'path': json_path}
+                ))
+
+    def _run_jobs(self, jobs: List[SchemaJob]) -> List[Tuple[str, str, List[Tuple[str, str]]]]:
+        """Validate jobs in-process, or across a process pool for large batches."""
+        if len(jobs) < self.parallel_threshold or self.max_workers <= 1:
+            return _validate_batch(jobs, self.max_errors)
+
+        # Several batches per worker keeps the pool busy when file sizes vary
+        batch_size = max(1, len(jobs) // (self.max_workers * 4))
+        batches = [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                results = []
+                for batch_results in executor.map(_validate_batch, batches, repeat(self.max_errors)):
+                    results.extend(batch_results)
+                return results
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Schema validation pool unavailable ({e}), validating serially")
+            return _validate_batch(jobs, self.max_errors)
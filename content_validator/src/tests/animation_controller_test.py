@@ -0,0 +1,120 @@
+"""
+Animation controller validation test.
+Analyzes each controller's state graph for undefined, unreachable and dead-end states.
+"""
+
+from typing import Dict, Any, List
+from .base_test import BaseValidatorTest
+from ..controller_graph import ControllerGraph
+from ..models import ValidationLevel, ValidationReport
+
+DEFAULT_LIMITS = {
+    'max_states': 32,
+    'max_transitions': 64,
+    'max_molang_expressions': 128,
+}
+
+
+class AnimationControllerTest(BaseValidatorTest):
+    """Test for validating animation controller state machines."""
+
+    def get_test_name(self) -> str:
+        return "Animation Controllers"
+
+    def get_test_description(self) -> str:
+        return "Validates controller state graphs and reports their complexity"
+
+    def validate(self, pack_paths: Dict[str, str]) -> ValidationReport:
+        """Build each controller's graph once and check it."""
+        self.log_info("Validating animation controllers...")
+
+        controller_settings = self.settings.get('animation_controllers', {})
+        if not controller_settings.get('enabled', True):
+            return self.report
+
+        limits = {key: controller_settings.get(key, default) for key, default in DEFAULT_LIMITS.items()}
+
+        pack_index = self.get_pack_index(pack_paths)
+        # One row per controller and file: duplicated identifiers each keep their own metrics
+        controller_rows: Dict[str, List[Dict[str, Any]]] = {}
+        for pack_type, file_path, document in pack_index.iter_documents():
+            if not isinstance(document, dict):
+                continue
+            controllers = document.get('animation_controllers')
+            if not isinstance(controllers, dict):
+                continue
+
+            for identifier, controller in controllers.items():
+                if isinstance(controller, dict):
+                    graph = ControllerGraph.build(identifier, controller)
+                    metrics = self._check_graph(pack_type, file_path, graph, limits)
+                    controller_rows.setdefault(pack_type, []).append(
+                        dict(identifier=graph.identifier, file=file_path, **metrics))
+
+        # Rows sorted heaviest first; consumers can re-sort on any column
+        sort_key = lambda row: (-row['molang_expressions'], -row['transitions'], row['identifier'], row['file'])
+        for pack_type, rows in controller_rows.items():
+            self.report.metrics['animation_controllers'][pack_type] = sorted(rows, key=sort_key)
+
+        return self.report
+
+    def _check_graph(self, pack_type: str, file_path: str, graph: ControllerGraph,
+                     limits: Dict[str, int]) -> Dict[str, int]:
+        """Report graph problems and return the controller's metrics."""
+        metrics = graph.metrics()
+        context = {'controller': graph.identifier, 'pack': pack_type}
+
+        if not graph.states:
+            return metrics
+
+        if not graph.has_initial_state:
+            self.add_result(
+                ValidationLevel.ERROR,
+                f"Controller '{graph.identifier}' has no initial state '{graph.initial_state}'",
+                file_path,
+                context=context
+            )
+            return metrics
+
+        for source, target in graph.undefined_targets:
+            self.add_result(
+                ValidationLevel.ERROR,
+                f"Controller '{graph.identifier}' transitions from '{source}' to undefined state '{target}'",
+                file_path,
+                context=dict(context, state=source, target=target)
+            )
+
+        reachable = graph.reachable()
+        unreachable = [state for state in graph.states if state not in reachable]
+        if unreachable:
+            self.add_result(
+                ValidationLevel.WARNING,
+                f"Controller '{graph.identifier}' has unreachable states: {', '.join(unreachable)}",
+                file_path,
+                context=dict(context, states=unreachable)
+            )
+
+        # Terminal states are sometimes intended, e.g. a one-shot setup state
+        for state in graph.dead_ends(reachable):
+            self.add_possible_issue(
+                f"Controller '{graph.identifier}' state '{state}' has no transitions out (dead end)",
+                file_path,
+                context=dict(context, state=state)
+            )
+
+        exceeded = [
+            f"{metrics[name]} {name.replace('_', ' ')}" for name, key in (
+                ('states', 'max_states'),
+                ('transitions', 'max_transitions'),
+                ('molang_expressions', 'max_molang_expressions'),
+            ) if metrics[name] > limits[key]
+        ]
+        if exceeded:
+            self.add_result(
+                ValidationLevel.WARNING,
+                f"Controller '{graph.identifier}' is heavy ({', '.join(exceeded)}); it is evaluated every tick",
+                file_path,
+                context=dict(context, metrics=metrics)
+            )
+
+        return metrics
@@ -0,0 +1,151 @@
+"""
+Audio budget validation test.
+Reads WAV and Ogg Vorbis headers to check sound durations against per-category budgets.
+"""
+
+import os
+from collections import defaultdict
+from typing import Dict, Any, Optional
+from .base_test import BaseValidatorTest
+from ..asset_headers import read_audio_header
+from ..models import ValidationLevel, ValidationReport
+
+DEFAULT_CATEGORY_MAX_SECONDS = {
+    'ui': 5,
+    'player': 10,
+    'block': 10,
+    'neutral': 15,
+    'hostile': 15,
+    'ambient': 60,
+    'weather': 60,
+    'music': 300,
+    'record': 300
+}
+
+UNCATEGORIZED = 'uncategorized'
+
+
+class AudioBudgetTest(BaseValidatorTest):
+    """Test for validating sound durations and total audio per pack."""
+
+    def get_test_name(self) -> str:
+        return "Audio Budgets"
+
+    def get_test_description(self) -> str:
+        return "Validates sound durations against per-category budgets and totals audio per pack"
+
+    def validate(self, pack_paths: Dict[str, str]) -> ValidationReport:
+        """Validate audio headers against the configured budgets."""
+        self.log_info("Validating audio budgets...")
+
+        audio_settings = self.settings.get('audio_budgets', {})
+        if not audio_settings.get('enabled', True):
+            return self.report
+
+        pack_index = self.get_pack_index(pack_paths)
+        rp_path = pack_index.pack_paths.get('RP')
+        if not rp_path:
+            return self.report
+
+        category_budgets = dict(DEFAULT_CATEGORY_MAX_SECONDS)
+        category_budgets.update(audio_settings.get('category_max_seconds', {}))
+        default_budget = audio_settings.get('default_max_seconds', 30)
+        pack_budget = audio_settings.get('pack_max_seconds')
+
+        categories = self._load_sound_categories(pack_index, rp_path)
+        category_seconds: Dict[str, float] = defaultdict(float)
+        total_seconds = 0.0
+        file_count = 0
+
+        for _, file_path in pack_index.iter_files('RP', ('.wav', '.ogg')):
+            try:
+                info = read_audio_header(file_path)
+            except OSError as e:
+                info = None
+                self.log_warning(f"Could not read {file_path}: {e}")
+
+            if info is None:
+                self.add_result(
+                    ValidationLevel.WARNING,
+                    "Audio header could not be read",
+                    file_path
+                )
+                continue
+
+            sound_name = os.path.splitext(os.path.relpath(file_path, rp_path))[0].replace(os.sep, '/').lower()
+            category = categories.get(sound_name, UNCATEGORIZED)
+            budget = category_budgets.get(category, default_budget)
+
+            file_count += 1
+            total_seconds += info.duration_seconds
+            category_seconds[category] += info.duration_seconds
+
+            if info.duration_seconds > budget:
+                self.add_result(
+                    ValidationLevel.WARNING,
+                    f"Sound is {info.duration_seconds:.1f}s long, over the {budget}s budget for '{category}' sounds",
+                    file_path,
+                    context={
+                        'category': category,
+                        'duration_seconds': round(info.duration_seconds, 3),
+                        'budget_seconds': budget,
+                        'sample_rate': info.sample_rate,
+                        'channels': info.channels,
+                        'format': info.format
+                    }
+                )
+
+        if not file_count:
+            return self.report
+
+        context = {
+            'file_count': file_count,
+            'total_seconds': round(total_seconds, 3),
+            'category_seconds': {category: round(seconds, 3) for category, seconds in sorted(category_seconds.items())},
+            'budget_seconds': pack_budget
+        }
+
+        if pack_budget is not None and total_seconds > pack_budget:
+            self.add_result(
+                ValidationLevel.WARNING,
+                f"Resource pack contains {total_seconds:.1f}s of audio, over the {pack_budget}s budget",
+                rp_path,
+                context=context
+            )
+        else:
+            self.add_result(
+                ValidationLevel.INFO,
+                f"Resource pack contains {total_seconds:.1f}s of audio across {file_count} files",
+                rp_path,
+                context=context
+            )
+
+        return self.report
+
+    def _load_sound_categories(self, pack_index, rp_path: str) -> Dict[str, str]:
+        """Map sound file names (pack-relative, no extension) to their sound_definitions category."""
+        definitions_path = os.path.join(rp_path, 'sounds', 'sound_definitions.json')
+        data = pack_index.load_json(definitions_path) if os.path.isfile(definitions_path) else None
+        if not isinstance(data, dict):
+            return {}
+
+        # Older files list definitions at the top level instead of under 'sound_definitions'
+        definitions = data.get('sound_definitions', data)
+        categories = {}
+        for definition in definitions.values():
+            if not isinstance(definition, dict):
+                continue
+            category = definition.get('category', UNCATEGORIZED)
+            for sound in definition.get('sounds', []):
+                name = self._sound_name(sound)
+                if name:
+                    categories.setdefault(name.replace('\\', '/').lower(), category)
+        return categories
+
+    def _sound_name(self, sound: Any) -> Optional[str]:
+        """Return the file name of a sound entry, which is either a string or an object."""
+        if isinstance(sound, str):
+            return sound
+        if isinstance(sound, dict) and isinstance(sound.get('name'), str):
+            return sound['name']
+        return None
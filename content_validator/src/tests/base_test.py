@@ -4,17 +4,22 @@ Defines the standard API that all tests must implement.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Set
 from ..models import ValidationReport, ValidationResult, ValidationLevel
+from ..pack_index import PackIndex
+from ..rules import RuleSet
 from ..utils import logger
 
 
 class BaseValidatorTest(ABC):
     """Base class for all validation tests."""
     
-    def __init__(self, settings: Dict[str, Any], namespace_info=None):
+    def __init__(self, settings: Dict[str, Any], namespace_info=None, rules: RuleSet = None, pack_index: PackIndex = None):
         self.settings = settings
         self.namespace_info = namespace_info
+        # Compiled once by the validator and shared; only compiled here for standalone runs
+        self.rules = rules if rules is not None else RuleSet.from_settings(settings)
+        self.pack_index = pack_index
         self.report = ValidationReport()
     
     @abstractmethod
@@ -40,9 +45,24 @@ class BaseValidatorTest(ABC):
         """Return test description."""
         raise NotImplementedError
     
+    def get_pack_index(self, pack_paths: Dict[str, str]) -> PackIndex:
+        """Return the shared pack index, scanning the packs only if none was provided."""
+        if self.pack_index is None:
+            self.pack_index = PackIndex(pack_paths, self.rules)
+        return self.pack_index
+    
+    def get_own_namespaces(self) -> Set[str]:
+        """Namespaces the pack defines content in (namespace and studio name), if known."""
+        if not self.namespace_info or not self.namespace_info.namespace:
+            return set()
+        return {
+            name for name in (self.namespace_info.namespace, self.namespace_info.studio_name)
+            if name
+        }
+    
     def add_result(self, level: ValidationLevel, message: str, file_path: str = None, context: Dict[str, Any] = None):
         """Helper method to add validation results."""
-        self.report.add_result(ValidationResult(level, message, file_path, context))
+        self.report.add_result(ValidationResult(level, message, file_path, context=context))
     
     def add_possible_issue(self, message: str, file_path: str = None, context: Dict[str, Any] = None):
         """Helper method to add possible issue results."""
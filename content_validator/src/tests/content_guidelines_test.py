@@ -23,7 +23,7 @@ class ContentGuidelinesTest(BaseValidatorTest):
         self.log_info("Validating content guidelines...")
         
         # Create content validator instance
-        content_validator = ContentValidator(self.settings)
+        content_validator = ContentValidator(self.settings, self.rules)
         
         # Run content guidelines validation
         content_validator.validate_addon_guidelines(self.report)
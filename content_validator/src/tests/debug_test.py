@@ -4,10 +4,10 @@ Validates that debug statements are removed from the final content.
 """
 
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any
 from .base_test import BaseValidatorTest
 from ..models import ValidationLevel, ValidationReport
-from ..utils import find_pack_directories
+from ..utils import find_pack_directories, walk_pack
 
 
 class DebugTest(BaseValidatorTest):
@@ -23,29 +23,35 @@ class DebugTest(BaseValidatorTest):
         """Validate that debug statements are removed."""
         self.log_info("Validating debug statements...")
         
-        debug_patterns = self.settings.get('organization_specific', {}).get('debug_statement_patterns', [])
+        if not self.rules.debug_statement_patterns:
+            return self.report
+        
         pack_dirs = find_pack_directories()
         
         for pack_type, possible_paths in pack_dirs.items():
             for path in possible_paths:
                 if os.path.exists(path):
-                    for root, dirs, files in os.walk(path):
+                    for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                         for file in files:
                             if file.endswith(('.json', '.js', '.mcfunction')):
                                 file_path = os.path.join(root, file)
-                                self._check_debug_statements_in_file(file_path, debug_patterns)
+                                self._check_debug_statements_in_file(file_path)
                     break  # Found the first valid path for this pack type
         
         return self.report
     
-    def _check_debug_statements_in_file(self, file_path: str, debug_patterns: List[str]):
+    def _check_debug_statements_in_file(self, file_path: str):
         """Check for debug statements in a specific file."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                content_lower = f.read().lower()
+            
+            # Most files contain no debug statements - one regex scan rules them out
+            if not self.rules.debug_statement_regex.search(content_lower):
+                return
             
-            for pattern in debug_patterns:
-                if pattern.lower() in content.lower():
+            for pattern, needle in self.rules.debug_statement_patterns:
+                if needle in content_lower:
                     self.add_result(
                         ValidationLevel.WARNING,
                         f"Debug statement found: '{pattern}'",
@@ -0,0 +1,73 @@
+"""
+Duplicate file validation test.
+Finds byte-identical files within a pack and reports the space they waste.
+"""
+
+from collections import defaultdict
+from typing import Dict, Any, List
+from .base_test import BaseValidatorTest
+from ..models import ValidationLevel, ValidationReport
+
+
+class DuplicateFileTest(BaseValidatorTest):
+    """Test for finding duplicate files that inflate the package size."""
+
+    def get_test_name(self) -> str:
+        return "Duplicate Files"
+
+    def get_test_description(self) -> str:
+        return "Finds byte-identical files within a pack and the bytes that could be saved"
+
+    def validate(self, pack_paths: Dict[str, str]) -> ValidationReport:
+        """Group files by size, then hash only same-size candidates."""
+        self.log_info("Searching for duplicate files...")
+
+        duplicate_settings = self.settings.get('duplicate_files', {})
+        if not duplicate_settings.get('enabled', True):
+            return self.report
+
+        min_size = duplicate_settings.get('min_size_bytes', 1024)
+        max_workers = duplicate_settings.get('max_workers')
+
+        pack_index = self.get_pack_index(pack_paths)
+        total_saved = 0
+
+        # Files can't be shared between packs, so duplicates are only grouped within one
+        for pack_type in pack_index.files:
+            by_size: Dict[int, List[str]] = defaultdict(list)
+            for _, file_path in pack_index.iter_files(pack_type):
+                size = pack_index.file_size(file_path)
+                if size >= min_size:
+                    by_size[size].append(file_path)
+
+            # A file with a unique size can't have a duplicate; skip hashing it
+            candidates = [file_path for files in by_size.values() if len(files) > 1 for file_path in files]
+            hashes = pack_index.file_hashes(candidates, max_workers)
+
+            by_hash: Dict[str, List[str]] = defaultdict(list)
+            for file_path in candidates:
+                if file_path in hashes:
+                    by_hash[hashes[file_path]].append(file_path)
+
+            for digest, files in sorted(by_hash.items(), key=lambda item: item[1][0]):
+                if len(files) < 2:
+                    continue
+                size = pack_index.file_size(files[0])
+                saved = size * (len(files) - 1)
+                total_saved += saved
+                self.add_result(
+                    ValidationLevel.WARNING,
+                    f"{len(files)} identical files of {size} bytes; removing copies would save {saved / 1024:.1f} KB",
+                    files[0],
+                    context={'pack': pack_type, 'sha256': digest, 'size_bytes': size,
+                             'saved_bytes': saved, 'files': files}
+                )
+
+        if total_saved:
+            self.add_result(
+                ValidationLevel.INFO,
+                f"Duplicate files waste {total_saved / 1024:.1f} KB before compression",
+                context={'saved_bytes': total_saved}
+            )
+
+        return self.report
@@ -0,0 +1,46 @@
+"""
+Duplicate identifier validation test.
+Reports identifiers defined in more than one file, and identifiers that differ only by case or separators.
+"""
+
+from typing import Dict, Any
+from .base_test import BaseValidatorTest
+from ..models import ValidationLevel, ValidationReport
+
+
+class DuplicateIdentifierTest(BaseValidatorTest):
+    """Test for validating that identifiers are unique."""
+
+    def get_test_name(self) -> str:
+        return "Duplicate Identifiers"
+
+    def get_test_description(self) -> str:
+        return "Validates that entity, item, block and asset identifiers are defined only once"
+
+    def validate(self, pack_paths: Dict[str, str]) -> ValidationReport:
+        """Report duplicate and near-duplicate identifiers."""
+        self.log_info("Validating identifier uniqueness...")
+
+        identifier_index = self.get_pack_index(pack_paths).identifier_index
+
+        for (pack_type, kind), identifier, files in identifier_index.duplicates():
+            self.add_result(
+                ValidationLevel.ERROR,
+                f"Duplicate {kind} identifier '{identifier}' is defined in {len(files)} places; only one will load",
+                files[0],
+                context={'pack': pack_type, 'kind': kind, 'identifier': identifier, 'files': files}
+            )
+
+        for (pack_type, kind), identifiers in identifier_index.near_duplicates():
+            files = [
+                file_path
+                for identifier in identifiers
+                for file_path in identifier_index.files_for(pack_type, kind, identifier)
+            ]
+            self.add_possible_issue(
+                f"Near-duplicate {kind} identifiers differ only by case or separators: {', '.join(identifiers)}",
+                files[0],
+                context={'pack': pack_type, 'kind': kind, 'identifiers': identifiers, 'files': files}
+            )
+
+        return self.report
@@ -23,7 +23,7 @@ class FileStructureTest(BaseValidatorTest):
         self.log_info("Validating file structure...")
         
         # Create file validator instance with namespace info
-        file_validator = FileValidator(self.settings, self.namespace_info)
+        file_validator = FileValidator(self.settings, self.namespace_info, self.rules)
         
         # Run file structure validation
         file_validator.validate_file_structure(self.report)
@@ -0,0 +1,164 @@
+"""
+Geometry complexity validation test.
+Counts bones, cubes and polygons per geometry and per client entity against render budgets.
+"""
+
+from typing import Dict, Any, Iterator, List, NamedTuple, Tuple
+from .base_test import BaseValidatorTest
+from ..models import ValidationLevel, ValidationReport
+
+DEFAULT_BUDGETS = {
+    'max_bones': 60,
+    'max_cubes': 250,
+    'max_polygons': 1500,
+    'max_entity_polygons': 3000,
+}
+
+# A box-UV cube renders all six faces; per-face UV renders only the faces listed
+CUBE_FACES = 6
+
+
+class GeometryStats(NamedTuple):
+    """Render cost counters of one geometry."""
+    bones: int = 0
+    cubes: int = 0
+    polygons: int = 0
+
+    def __add__(self, other: 'GeometryStats') -> 'GeometryStats':
+        return GeometryStats(self.bones + other.bones, self.cubes + other.cubes, self.polygons + other.polygons)
+
+
+def count_geometry(geometry: Dict[str, Any]) -> GeometryStats:
+    """Count the bones, cubes and polygons of one geometry definition."""
+    bones = geometry.get('bones')
+    if not isinstance(bones, list):
+        return GeometryStats()
+
+    cube_count = polygon_count = 0
+    for bone in bones:
+        if not isinstance(bone, dict):
+            continue
+        for cube in bone.get('cubes') or []:
+            if isinstance(cube, dict):
+                cube_count += 1
+                uv = cube.get('uv')
+                polygon_count += len(uv) if isinstance(uv, dict) else CUBE_FACES
+        poly_mesh = bone.get('poly_mesh')
+        if isinstance(poly_mesh, dict) and isinstance(poly_mesh.get('polys'), list):
+            polygon_count += len(poly_mesh['polys'])
+
+    return GeometryStats(len(bones), cube_count, polygon_count)
+
+
+def iter_geometries(document: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (identifier, geometry) for both the current and the legacy geometry formats."""
+    geometries = document.get('minecraft:geometry')
+    if isinstance(geometries, list):
+        for geometry in geometries:
+            if isinstance(geometry, dict):
+                identifier = (geometry.get('description') or {}).get('identifier')
+                if isinstance(identifier, str) and identifier:
+                    yield identifier, geometry
+
+    # Legacy files: "geometry.name" or "geometry.name:geometry.parent" at the top level
+    for key, geometry in document.items():
+        if key.startswith('geometry.') and isinstance(geometry, dict):
+            yield key.split(':', 1)[0], geometry
+
+
+class GeometryBudgetTest(BaseValidatorTest):
+    """Test for validating model complexity against render budgets."""
+
+    def get_test_name(self) -> str:
+        return "Geometry Budgets"
+
+    def get_test_description(self) -> str:
+        return "Validates bone, cube and polygon counts per geometry and per client entity"
+
+    def validate(self, pack_paths: Dict[str, str]) -> ValidationReport:
+        """Count every RP geometry, then total them per client entity."""
+        self.log_info("Validating geometry budgets...")
+
+        budget_settings = self.settings.get('geometry_budgets', {})
+        if not budget_settings.get('enabled', True):
+            return self.report
+
+        budgets = {key: budget_settings.get(key, default) for key, default in DEFAULT_BUDGETS.items()}
+        pack_index = self.get_pack_index(pack_paths)
+
+        geometry_stats: Dict[str, GeometryStats] = {}
+        geometry_rows: List[Dict[str, Any]] = []
+        for _, file_path, document in pack_index.iter_documents('RP'):
+            if not isinstance(document, dict):
+                continue
+            for identifier, geometry in iter_geometries(document):
+                stats = count_geometry(geometry)
+                geometry_stats.setdefault(identifier, stats)
+                geometry_rows.append(dict(identifier=identifier, file=file_path, **stats._asdict()))
+                self._check_geometry(identifier, file_path, stats, budgets)
+
+        entity_rows = self._total_entities(pack_index, geometry_stats, budgets)
+
+        # Rows sorted heaviest first; consumers can re-sort on any column
+        sort_key = lambda row: (-row['polygons'], -row['cubes'], row['identifier'])
+        self.report.metrics['geometry']['RP'] = {
+            'geometries': sorted(geometry_rows, key=sort_key),
+            'entities': sorted(entity_rows, key=sort_key),
+        }
+
+        return self.report
+
+    def _check_geometry(self, identifier: str, file_path: str, stats: GeometryStats, budgets: Dict[str, int]):
+        """Flag a geometry exceeding any per-geometry budget."""
+        exceeded = [
+            f"{value} {name} (max {budgets[key]})" for name, value, key in (
+                ('bones', stats.bones, 'max_bones'),
+                ('cubes', stats.cubes, 'max_cubes'),
+                ('polygons', stats.polygons, 'max_polygons'),
+            ) if value > budgets[key]
+        ]
+        if exceeded:
+            self.add_result(
+                ValidationLevel.WARNING,
+                f"Geometry '{identifier}' exceeds its budget: {', '.join(exceeded)}",
+                file_path,
+                context=dict(stats._asdict(), identifier=identifier)
+            )
+
+    def _total_entities(self, pack_index, geometry_stats: Dict[str, GeometryStats],
+                        budgets: Dict[str, int]) -> List[Dict[str, Any]]:
+        """Total the geometries each client entity or attachable references, via the reference graph."""
+        referenced: Dict[str, List[str]] = {}
+        for reference in pack_index.reference_graph.references:
+            if reference.kind == 'geometry' and reference.pack_type == 'RP':
+                targets = referenced.setdefault(reference.source, [])
+                if reference.target not in targets:
+                    targets.append(reference.target)
+
+        rows = []
+        for file_path, targets in referenced.items():
+            identifier = self._entity_identifier(pack_index.load_json(file_path)) or file_path
+            # Missing geometry is reported by the reference test
+            counted = [target for target in targets if target in geometry_stats]
+            total = sum((geometry_stats[target] for target in counted), GeometryStats())
+            rows.append(dict(identifier=identifier, file=file_path, geometries=counted, **total._asdict()))
+
+            if total.polygons > budgets['max_entity_polygons']:
+                self.add_result(
+                    ValidationLevel.WARNING,
+                    f"Entity '{identifier}' references {total.polygons} polygons across {len(counted)} geometries "
+                    f"(max {budgets['max_entity_polygons']})",
+                    file_path,
+                    context=dict(total._asdict(), identifier=identifier, geometries=counted)
+                )
+
+        return rows
+
+    @staticmethod
+    def _entity_identifier(document: Any) -> str:
+        if isinstance(document, dict):
+            for key in ('minecraft:client_entity', 'minecraft:attachable'):
+                description = (document.get(key) or {}).get('description')
+                if isinstance(description, dict) and isinstance(description.get('identifier'), str):
+                    return description['identifier']
+        return ''
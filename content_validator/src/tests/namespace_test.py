@@ -5,10 +5,10 @@ Validates namespace usage across all files and checks for forbidden namespaces.
 
 import os
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, FrozenSet
 from .base_test import BaseValidatorTest
 from ..models import ValidationLevel, ValidationReport
-from ..utils import find_pack_directories
+from ..utils import find_pack_directories, parse_json, walk_json, walk_pack
 
 
 class NamespaceTest(BaseValidatorTest):
@@ -32,13 +32,13 @@ class NamespaceTest(BaseValidatorTest):
             return self.report
         
         # Check for forbidden namespace usage
-        forbidden_namespaces = self.settings.get('forbidden_namespaces', [])
+        forbidden_namespaces = self.rules.forbidden_namespaces
         pack_dirs = find_pack_directories()
         
         for pack_type, possible_paths in pack_dirs.items():
             for path in possible_paths:
                 if os.path.exists(path):
-                    for root, dirs, files in os.walk(path):
+                    for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                         for file in files:
                             if file.endswith('.json'):
                                 file_path = os.path.join(root, file)
@@ -47,35 +47,27 @@ class NamespaceTest(BaseValidatorTest):
         
         return self.report
     
-    def _validate_namespace_in_file(self, file_path: str, forbidden_namespaces: List[str]):
+    def _validate_namespace_in_file(self, file_path: str, forbidden_namespaces: FrozenSet[str]):
         """Validate namespace usage in a specific file."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = parse_json(f.read())
             
-            self._check_namespace_recursive(data, forbidden_namespaces, file_path)
+            self._check_namespace_usage(data, forbidden_namespaces, file_path)
             
         except (json.JSONDecodeError, UnicodeDecodeError):
             pass  # Skip invalid JSON files
     
-    def _check_namespace_recursive(self, data: Any, forbidden_namespaces: List[str], file_path: str, path: str = ""):
-        """Recursively check for forbidden namespace usage."""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                self._check_namespace_recursive(value, forbidden_namespaces, file_path, current_path)
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]"
-                self._check_namespace_recursive(item, forbidden_namespaces, file_path, current_path)
-        elif isinstance(data, str):
+    def _check_namespace_usage(self, data: Any, forbidden_namespaces: FrozenSet[str], file_path: str):
+        """Check every string in a document for forbidden namespace usage."""
+        for path, _, value in walk_json(data):
             # Check for namespace patterns
-            if ':' in data:
-                namespace = data.split(':')[0]
+            if isinstance(value, str) and ':' in value:
+                namespace = value.split(':', 1)[0]
                 if namespace in forbidden_namespaces:
                     self.add_result(
                         ValidationLevel.ERROR,
                         f"Forbidden namespace '{namespace}' used in {path}",
                         file_path,
-                        context={'value': data, 'path': path}
+                        context={'value': value, 'path': path}
                     )
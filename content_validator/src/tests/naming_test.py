@@ -3,13 +3,9 @@ Naming convention validation test.
 Validates naming conventions for various asset types like geometry, animations, and render controllers.
 """
 
-import os
-import json
-import glob
 from typing import Dict, Any
 from .base_test import BaseValidatorTest
 from ..models import ValidationLevel, ValidationReport
-from ..utils import find_pack_directories
 
 
 class NamingTest(BaseValidatorTest):
@@ -28,99 +24,86 @@ class NamingTest(BaseValidatorTest):
         if not self.namespace_info or not self.namespace_info.namespace:
             return self.report
         
-        naming_patterns = self.settings.get('naming_patterns', {})
-        pack_dirs = find_pack_directories()
+        pack_index = self.get_pack_index(pack_paths)
         
-        for pack_type, possible_paths in pack_dirs.items():
-            for path in possible_paths:
-                if os.path.exists(path):
-                    # Validate geometry identifiers
-                    self._validate_geometry_naming(path)
-                    
-                    # Validate animation naming
-                    self._validate_animation_naming(path)
-                    
-                    # Validate render controller naming
-                    self._validate_render_controller_naming(path)
-                    break  # Found the first valid path for this pack type
+        for pack_type in pack_index.pack_paths:
+            # Validate geometry identifiers
+            self._validate_geometry_naming(pack_index, pack_type)
+            
+            # Validate animation naming
+            self._validate_animation_naming(pack_index, pack_type)
+            
+            # Validate render controller naming
+            self._validate_render_controller_naming(pack_index, pack_type)
         
         return self.report
     
-    def _validate_geometry_naming(self, pack_path: str):
+    def _validate_geometry_naming(self, pack_index, pack_type: str):
         """Validate geometry identifier naming."""
-        geometry_files = glob.glob(f"{pack_path}/models/entity/*.json")
+        prefix = self.rules.naming_prefix('geometry', self.namespace_info.namespace)
         
-        for file_path in geometry_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                if 'minecraft:geometry' in data:
-                    geometry_data = data['minecraft:geometry']
-                    
-                    # Handle both old format (string) and new format (list)
-                    geometry_ids = []
-                    if isinstance(geometry_data, str):
-                        geometry_ids = [geometry_data]
-                    elif isinstance(geometry_data, list):
-                        # Extract identifiers from geometry objects
-                        for geom in geometry_data:
-                            if isinstance(geom, dict) and 'description' in geom:
-                                identifier = geom['description'].get('identifier')
-                                if identifier:
-                                    geometry_ids.append(identifier)
-                    
-                    # Validate each geometry identifier
-                    for geometry_id in geometry_ids:
-                        if isinstance(geometry_id, str) and not geometry_id.startswith(f"geometry.{self.namespace_info.namespace}."):
-                            self.add_result(
-                                ValidationLevel.WARNING,
-                                f"Geometry identifier should start with 'geometry.{self.namespace_info.namespace}.'",
-                                file_path,
-                                context={'current_id': geometry_id}
-                            )
+        for file_path in pack_index.iter_folder(pack_type, 'models/entity', ('.json',)):
+            data = pack_index.load_json(file_path)
+            if not isinstance(data, dict):
+                continue
             
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                pass
-    
-    def _validate_animation_naming(self, pack_path: str):
-        """Validate animation naming."""
-        animation_files = glob.glob(f"{pack_path}/animations/*.json")
-        
-        for file_path in animation_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            if 'minecraft:geometry' in data:
+                geometry_data = data['minecraft:geometry']
                 
-                for animation_name in data.get('animations', {}):
-                    if not animation_name.startswith(f"animation.{self.namespace_info.namespace}."):
+                # Handle both old format (string) and new format (list)
+                geometry_ids = []
+                if isinstance(geometry_data, str):
+                    geometry_ids = [geometry_data]
+                elif isinstance(geometry_data, list):
+                    # Extract identifiers from geometry objects
+                    for geom in geometry_data:
+                        if isinstance(geom, dict) and 'description' in geom:
+                            identifier = geom['description'].get('identifier')
+                            if identifier:
+                                geometry_ids.append(identifier)
+                
+                # Validate each geometry identifier
+                for geometry_id in geometry_ids:
+                    if isinstance(geometry_id, str) and not geometry_id.startswith(prefix):
                         self.add_result(
                             ValidationLevel.WARNING,
-                            f"Animation name should start with 'animation.{self.namespace_info.namespace}.'",
+                            f"Geometry identifier should start with '{prefix}'",
                             file_path,
-                            context={'animation_name': animation_name}
+                            context={'current_id': geometry_id}
                         )
+    
+    def _validate_animation_naming(self, pack_index, pack_type: str):
+        """Validate animation naming."""
+        prefix = self.rules.naming_prefix('animation', self.namespace_info.namespace)
+        
+        for file_path in pack_index.iter_folder(pack_type, 'animations', ('.json',)):
+            data = pack_index.load_json(file_path)
+            if not isinstance(data, dict):
+                continue
             
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                pass
+            for animation_name in data.get('animations', {}):
+                if not animation_name.startswith(prefix):
+                    self.add_result(
+                        ValidationLevel.WARNING,
+                        f"Animation name should start with '{prefix}'",
+                        file_path,
+                        context={'animation_name': animation_name}
+                    )
     
-    def _validate_render_controller_naming(self, pack_path: str):
+    def _validate_render_controller_naming(self, pack_index, pack_type: str):
         """Validate render controller naming."""
-        render_files = glob.glob(f"{pack_path}/render_controllers/*.json")
+        prefix = self.rules.naming_prefix('render_controller', self.namespace_info.namespace)
         
-        for file_path in render_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                for controller_name in data.get('render_controllers', {}):
-                    if not controller_name.startswith(f"controller.render.{self.namespace_info.namespace}."):
-                        self.add_result(
-                            ValidationLevel.WARNING,
-                            f"Render controller name should start with 'controller.render.{self.namespace_info.namespace}.'",
-                            file_path,
-                            context={'controller_name': controller_name}
-                        )
+        for file_path in pack_index.iter_folder(pack_type, 'render_controllers', ('.json',)):
+            data = pack_index.load_json(file_path)
+            if not isinstance(data, dict):
+                continue
             
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                pass
+            for controller_name in data.get('render_controllers', {}):
+                if not controller_name.startswith(prefix):
+                    self.add_result(
+                        ValidationLevel.WARNING,
+                        f"Render controller name should start with '{prefix}'",
+                        file_path,
+                        context={'controller_name': controller_name}
+                    )
@@ -23,7 +23,7 @@ class OrganizationTest(BaseValidatorTest):
         self.log_info("Validating organization-specific requirements...")
         
         # Create namespace extractor instance
-        namespace_extractor = NamespaceExtractor(self.settings)
+        namespace_extractor = NamespaceExtractor(self.settings, self.rules)
         
         # Validate namespace prefix
         namespace_extractor.validate_namespace_prefix(self.report)
@@ -0,0 +1,193 @@
+"""
+Entity runtime cost lint.
+Scores behavior pack entities against a component cost table and flags entities over budget.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+from .base_test import BaseValidatorTest
+from ..models import ValidationLevel, ValidationReport
+
+# Relative per-tick cost of a component; keys ending in '.' match every component with that prefix
+DEFAULT_COMPONENT_COSTS = {
+    'minecraft:tick_world': 10,
+    'minecraft:environment_sensor': 6,
+    'minecraft:entity_sensor': 5,
+    'minecraft:target_nearby_sensor': 5,
+    'minecraft:area_attack': 4,
+    'minecraft:mob_effect': 4,
+    'minecraft:timer': 3,
+    'minecraft:scheduler': 3,
+    'minecraft:lookat': 3,
+    'minecraft:physics': 2,
+    'minecraft:inventory': 2,
+    'minecraft:rideable': 2,
+    'minecraft:breathable': 2,
+    'minecraft:pushable': 1,
+    'minecraft:push_through': 1,
+    'minecraft:collision_box': 1,
+    'minecraft:interact': 1,
+    'minecraft:damage_sensor': 1,
+    'minecraft:movement': 1,
+    'minecraft:navigation.': 6,
+    'minecraft:behavior.': 3,
+    'minecraft:movement.': 2,
+    'minecraft:jump.': 1,
+}
+
+# Looping timers faster than min_timer_interval cost this many times their table cost
+FREQUENT_TIMER_MULTIPLIER = 2
+
+
+class PerformanceLintTest(BaseValidatorTest):
+    """Test for estimating the per-tick cost of behavior pack entities."""
+
+    def get_test_name(self) -> str:
+        return "Entity Performance"
+
+    def get_test_description(self) -> str:
+        return "Scores entities against a component cost table and flags entities over budget"
+
+    def validate(self, pack_paths: Dict[str, str]) -> ValidationReport:
+        """Score every BP entity from the shared document cache."""
+        self.log_info("Linting entity runtime cost...")
+
+        lint_settings = self.settings.get('performance_lint', {})
+        if not lint_settings.get('enabled', True):
+            return self.report
+
+        costs = dict(DEFAULT_COMPONENT_COSTS, **lint_settings.get('component_costs', {}))
+        # Longest prefix first so 'minecraft:movement.' wins over shorter prefixes
+        prefixes = sorted((key for key in costs if key.endswith('.')), key=len, reverse=True)
+        budget = lint_settings.get('entity_budget', 20)
+        min_timer_interval = lint_settings.get('min_timer_interval', 1.0)
+
+        pack_index = self.get_pack_index(pack_paths)
+        # Keyed by file: entities sharing an identifier each still count toward the totals
+        entity_rows: List[Dict[str, Any]] = []
+
+        for _, file_path, document in pack_index.iter_documents('BP'):
+            if not isinstance(document, dict) or not isinstance(document.get('minecraft:entity'), dict):
+                continue
+
+            entity = document['minecraft:entity']
+            identifier = (entity.get('description') or {}).get('identifier') or file_path
+            cost, breakdown = self._score_entity(entity, costs, prefixes, min_timer_interval)
+            entity_rows.append({'identifier': identifier, 'file': file_path, 'cost': cost})
+
+            if cost > budget:
+                top = sorted(breakdown.items(), key=lambda item: (-item[1], item[0]))[:5]
+                self.add_result(
+                    ValidationLevel.WARNING,
+                    f"Entity '{identifier}' has an estimated runtime cost of {cost} (budget {budget}); "
+                    f"most expensive: {', '.join(f'{name} ({value})' for name, value in top)}",
+                    file_path,
+                    context={'identifier': identifier, 'cost': cost, 'budget': budget, 'components': breakdown}
+                )
+
+            self._check_static_pathfinding(entity, identifier, file_path)
+
+        if entity_rows:
+            total = sum(row['cost'] for row in entity_rows)
+            self.report.metrics['performance']['BP'] = {
+                'total_cost': total,
+                'entity_count': len(entity_rows),
+                'over_budget': sum(1 for row in entity_rows if row['cost'] > budget),
+                'budget': budget,
+                'entities': sorted(entity_rows, key=lambda row: (-row['cost'], row['identifier'], row['file'])),
+            }
+            self.add_result(
+                ValidationLevel.INFO,
+                f"{len(entity_rows)} entities have a combined estimated runtime cost of {total}",
+                context={'total_cost': total, 'entity_count': len(entity_rows)}
+            )
+
+        return self.report
+
+    def _score_entity(self, entity: Dict[str, Any], costs: Dict[str, int], prefixes: List[str],
+                      min_timer_interval: float) -> Tuple[int, Dict[str, int]]:
+        """Return an entity's cost and per-component breakdown.
+
+        Base components always count; of the component groups only the most
+        expensive one is added, since groups are usually swapped rather than
+        stacked (variants, open/closed states).
+        """
+        breakdown = self._score_components(entity.get('components'), costs, prefixes, min_timer_interval)
+
+        heaviest: Dict[str, int] = {}
+        groups = entity.get('component_groups')
+        if isinstance(groups, dict):
+            for group in groups.values():
+                group_costs = self._score_components(group, costs, prefixes, min_timer_interval)
+                if sum(group_costs.values()) > sum(heaviest.values()):
+                    heaviest = group_costs
+
+        for name, value in heaviest.items():
+            breakdown[name] = max(breakdown.get(name, 0), value)
+
+        return sum(breakdown.values()), breakdown
+
+    def _score_components(self, components: Any, costs: Dict[str, int], prefixes: List[str],
+                          min_timer_interval: float) -> Dict[str, int]:
+        """Look each component up in the cost table."""
+        scores: Dict[str, int] = {}
+        if not isinstance(components, dict):
+            return scores
+
+        for name, component in components.items():
+            cost = self._component_cost(name, costs, prefixes)
+            if name == 'minecraft:timer' and self._is_frequent_timer(component, min_timer_interval):
+                cost *= FREQUENT_TIMER_MULTIPLIER
+            if cost:
+                scores[name] = cost
+        return scores
+
+    @staticmethod
+    def _component_cost(name: str, costs: Dict[str, int], prefixes: List[str]) -> int:
+        if name in costs:
+            return costs[name]
+        for prefix in prefixes:
+            if name.startswith(prefix):
+                return costs[prefix]
+        return 0
+
+    @staticmethod
+    def _is_frequent_timer(component: Any, min_timer_interval: float) -> bool:
+        """Check for a looping timer that fires more often than the interval."""
+        if not isinstance(component, dict) or not component.get('looping', True):
+            return False
+        interval = component.get('time', 0)
+        # A [min, max] range may mix numbers with Molang strings; only the numbers bound it
+        intervals = interval if isinstance(interval, list) else [interval]
+        numbers = [value for value in intervals if isinstance(value, (int, float)) and not isinstance(value, bool)]
+        return bool(numbers) and min(numbers) < min_timer_interval
+
+    def _check_static_pathfinding(self, entity: Dict[str, Any], identifier: str, file_path: str):
+        """Flag navigation components on entities that cannot move."""
+        component_sets = [entity.get('components')]
+        groups = entity.get('component_groups')
+        if isinstance(groups, dict):
+            component_sets.extend(groups.values())
+
+        names = {name for components in component_sets if isinstance(components, dict) for name in components}
+        navigation = sorted(name for name in names if name.startswith('minecraft:navigation.'))
+        if navigation and self._movement_speed(component_sets) in (None, 0):
+            self.add_result(
+                ValidationLevel.WARNING,
+                f"Entity '{identifier}' pathfinds ({', '.join(navigation)}) but cannot move; "
+                f"remove navigation from static props",
+                file_path,
+                context={'identifier': identifier, 'components': navigation}
+            )
+
+    @staticmethod
+    def _movement_speed(component_sets: List[Any]) -> Optional[float]:
+        """Return the highest movement speed among the entity's components, or None without movement."""
+        speeds = []
+        for components in component_sets:
+            if isinstance(components, dict) and isinstance(components.get('minecraft:movement'), dict):
+                movement = components['minecraft:movement']
+                speed = movement.get('value', movement.get('max', 0))
+                if isinstance(speed, dict):
+                    speed = speed.get('range_max', speed.get('max', 0))
+                speeds.append(speed if isinstance(speed, (int, float)) else 0)
+        return max(speeds) if speeds else None
@@ -0,0 +1,119 @@
+"""
+Asset reference validation test.
+Resolves every edge of the shared reference graph and reports missing assets.
+"""
+
+import re
+from typing import Dict, Any, Set, Tuple
+from .base_test import BaseValidatorTest
+from ..models import ValidationLevel, ValidationReport
+
+KIND_LABELS = {
+    'geometry': 'geometry',
+    'texture': 'texture',
+    'animation': 'animation or animation controller',
+    'render_controller': 'render controller',
+    'sound': 'sound event',
+    'sound_file': 'sound file',
+}
+
+# Target prefixes of built-in assets; reference_check.vanilla_references adds more
+DEFAULT_VANILLA_REFERENCES = (
+    'minecraft:',
+    'geometry.humanoid', 'geometry.player',
+    'animation.humanoid.', 'animation.player.',
+    'controller.animation.humanoid.', 'controller.animation.player.',
+    'controller.render.default', 'controller.render.item_default',
+    'controller.render.armor', 'controller.render.player',
+    'textures/misc/enchanted_',
+)
+
+# First segment of vanilla sound events (beacon.activate, mob.zombie.say, ...)
+VANILLA_SOUND_CATEGORIES = frozenset((
+    'ambient', 'armor', 'beacon', 'bell', 'block', 'bottle', 'break', 'bubble', 'bucket', 'camera',
+    'cauldron', 'chime', 'conduit', 'crossbow', 'damage', 'dig', 'elytra', 'entity', 'fall', 'fire',
+    'game', 'hit', 'item', 'jump', 'land', 'leashknot', 'liquid', 'lodestone', 'minecart', 'mob',
+    'music', 'note', 'particle', 'place', 'portal', 'raid', 'random', 'record', 'respawn_anchor',
+    'smithing_table', 'step', 'tile', 'trident', 'ui', 'use', 'vr',
+))
+
+# Vanilla render controllers are named after the entity, without a namespace segment
+_VANILLA_RENDER_CONTROLLER = re.compile(r'controller\.render\.[a-z0-9_]+')
+
+_TOKEN_SPLIT = re.compile(r'[./:]')
+
+
+class ReferenceTest(BaseValidatorTest):
+    """Test for validating that referenced assets exist."""
+
+    def get_test_name(self) -> str:
+        return "Asset References"
+
+    def get_test_description(self) -> str:
+        return "Validates that referenced geometry, textures, animations, controllers and sounds exist"
+
+    def validate(self, pack_paths: Dict[str, str]) -> ValidationReport:
+        """Report references that do not resolve to a definition in the pack."""
+        self.log_info("Validating asset references...")
+
+        reference_settings = self.settings.get('reference_check', {})
+        if not reference_settings.get('enabled', True):
+            return self.report
+
+        report_external = reference_settings.get('report_external', False)
+        vanilla_references = DEFAULT_VANILLA_REFERENCES + tuple(reference_settings.get('vanilla_references', []))
+        own_namespaces = self.get_own_namespaces()
+        graph = self.get_pack_index(pack_paths).reference_graph
+
+        for reference in graph.dangling():
+            label = KIND_LABELS.get(reference.kind, reference.kind)
+            context = {
+                'kind': reference.kind,
+                'target': reference.target,
+                'path': reference.json_path,
+                'pack': reference.pack_type
+            }
+
+            if self._is_pack_local(reference.target, own_namespaces):
+                self.add_result(
+                    ValidationLevel.ERROR,
+                    f"Missing {label} '{reference.target}' referenced at {reference.json_path}",
+                    reference.source,
+                    context=context
+                )
+            elif self._is_vanilla(reference.kind, reference.target, vanilla_references):
+                if report_external:
+                    self.add_possible_issue(
+                        f"Unresolved {label} '{reference.target}' is not defined in the pack (vanilla asset?)",
+                        reference.source,
+                        context=context
+                    )
+            else:
+                # Also every unresolved target when no pack namespace was detected
+                self.add_result(
+                    ValidationLevel.WARNING,
+                    f"Unresolved {label} '{reference.target}' referenced at {reference.json_path} is not "
+                    f"defined in the pack (list it in vanilla_references if it is a vanilla asset)",
+                    reference.source,
+                    context=context
+                )
+
+        return self.report
+
+    def _is_vanilla(self, kind: str, target: str, vanilla_references: Tuple[str, ...]) -> bool:
+        """Check whether an unresolved target names a built-in asset."""
+        if target.startswith(vanilla_references):
+            return True
+        if kind == 'sound':
+            return target.split('.', 1)[0] in VANILLA_SOUND_CATEGORIES
+        if kind == 'render_controller':
+            return _VANILLA_RENDER_CONTROLLER.fullmatch(target) is not None
+        return False
+
+    def _is_pack_local(self, target: str, own_namespaces: Set[str]) -> bool:
+        """Check whether a target names the pack's own namespace, e.g. geometry.<ns>.x or textures/<studio>/x."""
+        for token in _TOKEN_SPLIT.split(target):
+            for namespace in own_namespaces:
+                if token == namespace or token.startswith(namespace + '_'):
+                    return True
+        return False
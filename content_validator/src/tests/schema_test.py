@@ -0,0 +1,29 @@
+"""
+Schema validation test.
+Wrapper for the schema validator module.
+"""
+
+from typing import Dict, Any
+from .base_test import BaseValidatorTest
+from ..models import ValidationReport
+from ..schema_validator import SchemaValidator
+
+
+class SchemaTest(BaseValidatorTest):
+    """Test for validating definition files against JSON Schemas."""
+
+    def get_test_name(self) -> str:
+        return "Schema Validation"
+
+    def get_test_description(self) -> str:
+        return "Validates entity, item and block definitions against bundled JSON Schemas"
+
+    def validate(self, pack_paths: Dict[str, str]) -> ValidationReport:
+        """Validate definition files against schemas."""
+        self.log_info("Validating definition files against schemas...")
+
+        # Documents come from the shared cache, parsed once for all tests
+        schema_validator = SchemaValidator(self.settings, self.get_pack_index(pack_paths))
+        schema_validator.validate_schemas(self.report)
+
+        return self.report
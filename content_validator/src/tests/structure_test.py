@@ -0,0 +1,97 @@
+"""
+Structure file validation test.
+Streams .mcstructure NBT to check structure size and the blocks, entities and items they place.
+"""
+
+from typing import Dict, Any, Iterable, Set
+from .base_test import BaseValidatorTest
+from ..models import ValidationLevel, ValidationReport
+from ..nbt_reader import NBTError, StructureSummary, read_structure_summary
+
+DEFAULT_MAX_SIZE = [64, 384, 64]
+
+
+class StructureTest(BaseValidatorTest):
+    """Test for validating .mcstructure files."""
+
+    def get_test_name(self) -> str:
+        return "Structure Files"
+
+    def get_test_description(self) -> str:
+        return "Validates structure size and the namespaces and items placed by .mcstructure files"
+
+    def validate(self, pack_paths: Dict[str, str]) -> ValidationReport:
+        """Validate every structure file in the behavior pack."""
+        self.log_info("Validating structure files...")
+
+        structure_settings = self.settings.get('structure_limits', {})
+        if not structure_settings.get('enabled', True):
+            return self.report
+
+        max_size = structure_settings.get('max_size', DEFAULT_MAX_SIZE)
+        own_namespaces = self.get_own_namespaces()
+
+        pack_index = self.get_pack_index(pack_paths)
+        for _, file_path in pack_index.iter_files('BP', ('.mcstructure',)):
+            try:
+                summary = read_structure_summary(file_path)
+            except (NBTError, OSError) as e:
+                self.add_result(
+                    ValidationLevel.WARNING,
+                    f"Structure file could not be read: {e}",
+                    file_path
+                )
+                continue
+
+            self._check_size(file_path, summary, max_size)
+            self._check_identifiers(file_path, 'block', summary.block_names, own_namespaces)
+            self._check_identifiers(file_path, 'entity', summary.entity_identifiers, own_namespaces)
+            self._check_identifiers(file_path, 'item', summary.item_names, own_namespaces)
+
+        return self.report
+
+    def _check_size(self, file_path: str, summary: StructureSummary, max_size):
+        """Flag structures larger than the configured size on any axis."""
+        if len(summary.size) != 3:
+            return
+
+        if any(size > limit for size, limit in zip(summary.size, max_size)):
+            self.add_result(
+                ValidationLevel.WARNING,
+                f"Structure size {'x'.join(map(str, summary.size))} exceeds the {'x'.join(map(str, max_size))} limit",
+                file_path,
+                context={'size': list(summary.size), 'max_size': list(max_size)}
+            )
+
+    def _check_identifiers(self, file_path: str, kind: str, identifiers: Iterable[str], own_namespaces: Set[str]):
+        """Check the namespaces and forbidden items among a structure's identifiers."""
+        # Entities are listed once per placement; report each identifier once
+        for identifier in sorted(set(identifiers)):
+            namespace = self.rules.namespace_of(identifier)
+            context = {'identifier': identifier, 'kind': kind}
+
+            if namespace is not None and namespace not in self.rules.vanilla_namespaces:
+                if namespace in self.rules.forbidden_namespaces:
+                    self.add_result(
+                        ValidationLevel.ERROR,
+                        f"Structure places {kind} '{identifier}' from forbidden namespace '{namespace}'",
+                        file_path,
+                        context=context
+                    )
+                elif own_namespaces and namespace not in own_namespaces:
+                    self.add_result(
+                        ValidationLevel.WARNING,
+                        f"Structure places {kind} '{identifier}' from unknown namespace '{namespace}'",
+                        file_path,
+                        context=context
+                    )
+
+            name_lower = identifier.split(':', 1)[-1].lower()
+            for item, needle in self.rules.forbidden_items:
+                if needle in name_lower:
+                    self.add_result(
+                        ValidationLevel.WARNING,
+                        f"Structure places forbidden item '{item}' ({identifier})",
+                        file_path,
+                        context=dict(context, forbidden_item=item)
+                    )
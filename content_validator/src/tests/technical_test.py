@@ -6,10 +6,10 @@ Validates various technical restrictions like runtime_identifier, experimental f
 import os
 import json
 import glob
-from typing import Dict, Any, List
+from typing import Dict, Any, FrozenSet
 from .base_test import BaseValidatorTest
 from ..models import ValidationLevel, ValidationReport
-from ..utils import find_pack_directories
+from ..utils import find_pack_directories, parse_json, walk_json, walk_pack
 
 
 class TechnicalTest(BaseValidatorTest):
@@ -54,7 +54,7 @@ class TechnicalTest(BaseValidatorTest):
                 for file_path in entity_files:
                     try:
                         with open(file_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
+                            data = parse_json(f.read())
                         
                         if 'minecraft:entity' in data:
                             entity_data = data['minecraft:entity']
@@ -77,7 +77,7 @@ class TechnicalTest(BaseValidatorTest):
         for pack_type, possible_paths in pack_dirs.items():
             for path in possible_paths:
                 if os.path.exists(path):
-                    for root, dirs, files in os.walk(path):
+                    for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                         for file in files:
                             if file.endswith('.json'):
                                 file_path = os.path.join(root, file)
@@ -88,13 +88,13 @@ class TechnicalTest(BaseValidatorTest):
         """Check for actual experimental features usage in a specific file."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = parse_json(f.read())
             
             # Check for experimental features in manifest files
             if 'manifest.json' in file_path:
                 if 'dependencies' in data:
                     for dep in data['dependencies']:
-                        if isinstance(dep, dict) and dep.get('module_name') in ['@minecraft/server-gametest', '@minecraft/server-admin']:
+                        if isinstance(dep, dict) and dep.get('module_name') in self.rules.experimental_modules:
                             self.add_result(
                                 ValidationLevel.ERROR,
                                 f"Experimental module '{dep.get('module_name')}' detected - experimental features are not allowed",
@@ -103,63 +103,52 @@ class TechnicalTest(BaseValidatorTest):
                             )
             
             # Check for is_experimental: true in any JSON
-            self._check_experimental_recursive(data, file_path)
+            self._check_experimental_flags(data, file_path)
             
         except (json.JSONDecodeError, UnicodeDecodeError, OSError):
             pass
     
-    def _check_experimental_recursive(self, data: Any, file_path: str, path: str = ""):
-        """Recursively check for experimental features in JSON data."""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                
-                # Check for is_experimental: true
-                if key == 'is_experimental' and value is True:
-                    self.add_result(
-                        ValidationLevel.ERROR,
-                        f"Experimental feature indicator 'experimental' found - experimental features are not allowed",
-                        file_path,
-                        context={'experimental_indicator': 'experimental', 'path': current_path}
-                    )
-                
-                # Check for experimental feature flags
-                if key in ['enable_experimental', 'experimental_features'] and value:
-                    self.add_result(
-                        ValidationLevel.ERROR,
-                        f"Experimental feature flag '{key}' enabled - experimental features are not allowed",
-                        file_path,
-                        context={'experimental_flag': key, 'path': current_path}
-                    )
-                
-                # Recurse into nested structures
-                self._check_experimental_recursive(value, file_path, current_path)
-                
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]" if path else f"[{i}]"
-                self._check_experimental_recursive(item, file_path, current_path)
+    def _check_experimental_flags(self, data: Any, file_path: str):
+        """Check every key in a document for experimental features."""
+        for path, key, value in walk_json(data):
+            # Check for is_experimental: true
+            if key == 'is_experimental' and value is True:
+                self.add_result(
+                    ValidationLevel.ERROR,
+                    f"Experimental feature indicator 'experimental' found - experimental features are not allowed",
+                    file_path,
+                    context={'experimental_indicator': 'experimental', 'path': path}
+                )
+            
+            # Check for experimental feature flags
+            if key in ['enable_experimental', 'experimental_features'] and value:
+                self.add_result(
+                    ValidationLevel.ERROR,
+                    f"Experimental feature flag '{key}' enabled - experimental features are not allowed",
+                    file_path,
+                    context={'experimental_flag': key, 'path': path}
+                )
     
     def _check_vanilla_overrides(self, pack_paths: Dict[str, str]):
         """Check for vanilla content overrides."""
-        vanilla_namespaces = ['minecraft']
+        vanilla_namespaces = self.rules.vanilla_namespaces
         pack_dirs = find_pack_directories()
         
         for pack_type, possible_paths in pack_dirs.items():
             for path in possible_paths:
                 if os.path.exists(path):
-                    for root, dirs, files in os.walk(path):
+                    for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                         for file in files:
                             if file.endswith('.json'):
                                 file_path = os.path.join(root, file)
                                 self._check_vanilla_override_in_file(file_path, vanilla_namespaces)
                     break  # Found the first valid path for this pack type
     
-    def _check_vanilla_override_in_file(self, file_path: str, vanilla_namespaces: List[str]):
+    def _check_vanilla_override_in_file(self, file_path: str, vanilla_namespaces: FrozenSet[str]):
         """Check for vanilla overrides in a specific file."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = parse_json(f.read())
             
             # Check for vanilla namespace usage in identifiers
             self._check_vanilla_identifiers(data, vanilla_namespaces, file_path)
@@ -167,104 +156,43 @@ class TechnicalTest(BaseValidatorTest):
         except (json.JSONDecodeError, UnicodeDecodeError):
             pass
     
-    def _check_vanilla_identifiers(self, data: Any, vanilla_namespaces: List[str], file_path: str, path: str = ""):
-        """Recursively check for vanilla identifier usage."""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                self._check_vanilla_identifiers(value, vanilla_namespaces, file_path, current_path)
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]"
-                self._check_vanilla_identifiers(item, vanilla_namespaces, file_path, current_path)
-        elif isinstance(data, str):
+    def _check_vanilla_identifiers(self, data: Any, vanilla_namespaces: FrozenSet[str], file_path: str):
+        """Check every string in a document for vanilla identifier usage."""
+        # Subtrees at reference paths can only hold references, never definitions
+        for path, _, value in walk_json(data, prune=lambda path, key, value: self.rules.is_reference_path(path)):
             # Check for vanilla namespace in identifiers
-            if ':' in data:
-                namespace = data.split(':')[0]
+            if isinstance(value, str) and ':' in value:
+                namespace = value.split(':', 1)[0]
                 if namespace in vanilla_namespaces:
                     # Only flag vanilla namespace usage for NEW entity/block/item identifiers
                     # Skip legitimate references like recipe ingredients, loot table items, etc.
-                    if self._is_identifier_definition(path, file_path):
+                    if self.rules.is_identifier_definition(path, file_path):
                         self.add_result(
                             ValidationLevel.ERROR,
                             f"Vanilla namespace '{namespace}' should not be overridden in Add-Ons",
                             file_path,
-                            context={'value': data, 'path': path}
+                            context={'value': value, 'path': path}
                         )
     
-    def _is_identifier_definition(self, path: str, file_path: str) -> bool:
-        """Check if this path represents a new identifier definition (not a reference)."""
-        # These are legitimate references, not new definitions
-        legitimate_reference_paths = [
-            'result.item',           # Recipe results can use minecraft: items
-            'key.item',             # Recipe ingredients can use minecraft: items  
-            'tags.item',            # Recipe tags can reference minecraft: items
-            'item',                 # General item references
-            'input',                # Recipe inputs
-            'output',               # Recipe outputs
-            'ingredient',           # Recipe ingredients
-            'materials',            # Crafting materials
-            'drops',                # Loot table drops
-            'pools.entries.name',   # Loot table entries
-            'give',                 # Give commands
-            'item_name',            # Item name references
-            'spawn_item',           # Spawn item references
-        ]
-        
-        # File types that commonly have legitimate minecraft: references
-        legitimate_reference_files = [
-            'recipe.json',
-            'loot_table.json',
-            'trade.json',
-            'crafting_item_catalog.json',
-            'trading.json'
-        ]
-        
-        # Check if this is a legitimate reference context
-        path_lower = path.lower()
-        for ref_path in legitimate_reference_paths:
-            if ref_path in path_lower:
-                return False
-        
-        # Check if this is a file type that commonly has references
-        file_name = file_path.split('\\')[-1].split('/')[-1]
-        for ref_file in legitimate_reference_files:
-            if ref_file in file_name:
-                return False
-        
-        # Check for entity/block/item identifier definitions (these should be flagged)
-        identifier_definition_paths = [
-            'minecraft:entity.description.identifier',
-            'minecraft:block.description.identifier', 
-            'minecraft:item.description.identifier',
-            'description.identifier',
-            'identifier'
-        ]
-        
-        for def_path in identifier_definition_paths:
-            if def_path in path_lower:
-                return True
-        
-        # Default to not flagging unless we're sure it's a new definition
-        return False
-    
     def _check_setlore_restrictions(self, pack_paths: Dict[str, str]):
         """Check for setLore API restrictions."""
-        forbidden_patterns = self.settings.get('organization_specific', {}).get('forbidden_text_patterns', [])
+        if not self.rules.forbidden_text_patterns:
+            return
+        
         pack_dirs = find_pack_directories()
         bp_paths = pack_dirs.get('BP', [])
         
         for path in bp_paths:
             if os.path.exists(path):
                 # Check for setLore usage on forbidden items
-                for root, dirs, files in os.walk(path):
+                for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                     for file in files:
                         if file.endswith(('.js', '.mcfunction')):
                             file_path = os.path.join(root, file)
-                            self._check_setlore_in_file(file_path, forbidden_patterns)
+                            self._check_setlore_in_file(file_path)
                 break  # Found the first valid path
     
-    def _check_setlore_in_file(self, file_path: str, forbidden_patterns: List[str]):
+    def _check_setlore_in_file(self, file_path: str):
         """Check for setLore usage on forbidden items."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -272,7 +200,7 @@ class TechnicalTest(BaseValidatorTest):
             
             # Look for setLore usage
             if 'setLore' in content:
-                for pattern in forbidden_patterns:
+                for pattern, _ in self.rules.forbidden_text_patterns:
                     if pattern in content:
                         self.add_result(
                             ValidationLevel.ERROR,
@@ -292,7 +220,7 @@ class TechnicalTest(BaseValidatorTest):
         for path in bp_paths:
             if os.path.exists(path):
                 # Check for ticking area usage in various file types
-                for root, dirs, files in os.walk(path):
+                for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                     for file in files:
                         if file.endswith(('.json', '.js', '.mcfunction')):
                             file_path = os.path.join(root, file)
@@ -303,11 +231,10 @@ class TechnicalTest(BaseValidatorTest):
         """Check for ticking area usage in a specific file."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                content_lower = f.read().lower()
             
-            ticking_patterns = ['ticking', 'tickarea', 'tick_area', 'tickingarea']
-            for pattern in ticking_patterns:
-                if pattern in content.lower():
+            for pattern, needle in self.rules.ticking_patterns:
+                if needle in content_lower:
                     self.add_result(
                         ValidationLevel.ERROR,
                         f"Ticking areas are not allowed in Add-Ons",
@@ -3,8 +3,11 @@ Test registry for managing all validation tests.
 Handles test discovery, registration, and execution order.
 """
 
+import time
 from typing import Dict, List, Type
 from .base_test import BaseValidatorTest
+from ..pack_index import PackIndex
+from ..rules import RuleSet
 
 # Import all test classes
 from .pack_structure_test import PackStructureTest
@@ -18,6 +21,16 @@ from .translatable_test import TranslatableTest
 from .content_guidelines_test import ContentGuidelinesTest
 from .mct_test import MCTTest
 from .organization_test import OrganizationTest
+from .schema_test import SchemaTest
+from .texture_test import TextureTest
+from .audio_budget_test import AudioBudgetTest
+from .structure_test import StructureTest
+from .reference_test import ReferenceTest
+from .duplicate_identifier_test import DuplicateIdentifierTest
+from .duplicate_file_test import DuplicateFileTest
+from .animation_controller_test import AnimationControllerTest
+from .performance_lint_test import PerformanceLintTest
+from .geometry_budget_test import GeometryBudgetTest
 
 
 class TestRegistry:
@@ -41,7 +54,17 @@ class TestRegistry:
         self.register_test(TranslatableTest, 7)  # Translatable text
         self.register_test(OrganizationTest, 8)  # Organization requirements
         self.register_test(ContentGuidelinesTest, 9)  # Content guidelines
-        self.register_test(MCTTest, 10)  # MCT validation (last)
+        self.register_test(SchemaTest, 10)  # JSON Schema validation
+        self.register_test(TextureTest, 11)  # Texture budgets
+        self.register_test(AudioBudgetTest, 12)  # Audio budgets
+        self.register_test(StructureTest, 13)  # Structure files
+        self.register_test(ReferenceTest, 14)  # Asset references
+        self.register_test(DuplicateIdentifierTest, 15)  # Duplicate identifiers
+        self.register_test(DuplicateFileTest, 16)  # Duplicate files
+        self.register_test(AnimationControllerTest, 17)  # Animation controllers
+        self.register_test(PerformanceLintTest, 18)  # Entity runtime cost
+        self.register_test(GeometryBudgetTest, 19)  # Geometry budgets
+        self.register_test(MCTTest, 20)  # MCT validation (last)
     
     def register_test(self, test_class: Type[BaseValidatorTest], execution_order: int = None):
         """
@@ -77,20 +100,33 @@ class TestRegistry:
         """Get the execution order of tests."""
         return self._execution_order.copy()
     
-    def create_test_instance(self, test_name: str, settings: Dict, namespace_info=None) -> BaseValidatorTest:
+    def create_test_instance(self, test_name: str, settings: Dict, namespace_info=None, rules: RuleSet = None,
+                             pack_index: PackIndex = None) -> BaseValidatorTest:
         """Create an instance of a test."""
         test_class = self.get_test(test_name)
         if test_class:
-            return test_class(settings, namespace_info)
+            return test_class(settings, namespace_info, rules, pack_index)
         raise ValueError(f"Test '{test_name}' not found")
     
-    def run_all_tests(self, settings: Dict, pack_paths: Dict[str, str], namespace_info=None) -> List[BaseValidatorTest]:
+    def run_all_tests(self, settings: Dict, pack_paths: Dict[str, str], namespace_info=None, rules: RuleSet = None,
+                      pack_index: PackIndex = None) -> List[BaseValidatorTest]:
         """Run all tests in execution order."""
         test_instances = []
         
+        # Compile the rule set once and share it between all tests
+        if rules is None:
+            rules = RuleSet.from_settings(settings)
+        
+        # Scan the packs once; tests share the index and its parsed documents
+        if pack_index is None:
+            pack_index = PackIndex(pack_paths, rules)
+        
         for test_name in self._execution_order:
-            test_instance = self.create_test_instance(test_name, settings, namespace_info)
+            test_instance = self.create_test_instance(test_name, settings, namespace_info, rules, pack_index)
+            start = time.perf_counter()
             test_instance.validate(pack_paths)
+            # Per-test wall time, kept in the report so slow tests show up between runs
+            test_instance.report.metrics['timings'][test_instance.get_test_name()] = round(time.perf_counter() - start, 4)
             test_instances.append(test_instance)
         
         return test_instances
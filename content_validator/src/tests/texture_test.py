@@ -0,0 +1,151 @@
+"""
+Texture budget validation test.
+Reads PNG and TGA headers to check dimensions and per-folder texture memory.
+"""
+
+import os
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Tuple
+from .base_test import BaseValidatorTest
+from ..asset_headers import TextureInfo, read_texture_header
+from ..models import ValidationLevel, ValidationReport
+
+MB = 1024 * 1024
+
+
+class TextureTest(BaseValidatorTest):
+    """Test for validating texture dimensions and memory budgets."""
+
+    def get_test_name(self) -> str:
+        return "Texture Budgets"
+
+    def get_test_description(self) -> str:
+        return "Validates texture dimensions and per-folder texture memory against budgets"
+
+    def validate(self, pack_paths: Dict[str, str]) -> ValidationReport:
+        """Validate texture headers against the configured budgets."""
+        self.log_info("Validating texture budgets...")
+
+        texture_settings = self.settings.get('texture_budgets', {})
+        if not texture_settings.get('enabled', True):
+            return self.report
+
+        pack_index = self.get_pack_index(pack_paths)
+        rp_path = pack_index.pack_paths.get('RP')
+        if not rp_path:
+            return self.report
+
+        max_dimension = texture_settings.get('max_dimension', 1024)
+        require_power_of_two = texture_settings.get('require_power_of_two', True)
+        folder_budgets = self._normalize_budgets(texture_settings.get('folder_budgets_mb', {}))
+        default_budget_mb = texture_settings.get('default_folder_budget_mb', 16)
+
+        # Budget folder -> [(relative path, header)]
+        folders: Dict[str, List[Tuple[str, TextureInfo]]] = defaultdict(list)
+
+        for _, file_path in pack_index.iter_files('RP', ('.png', '.tga')):
+            relative_path = os.path.relpath(file_path, rp_path).replace(os.sep, '/')
+            if not relative_path.startswith('textures/'):
+                continue
+
+            try:
+                info = read_texture_header(file_path)
+            except OSError as e:
+                info = None
+                self.log_warning(f"Could not read {file_path}: {e}")
+
+            if info is None:
+                self.add_result(
+                    ValidationLevel.WARNING,
+                    "Texture header could not be read",
+                    file_path
+                )
+                continue
+
+            self._check_texture(file_path, info, max_dimension, require_power_of_two)
+
+            folder = self._budget_folder(relative_path, folder_budgets)
+            folders[folder].append((relative_path, info))
+
+        for folder, textures in sorted(folders.items()):
+            budget_mb = folder_budgets.get(folder, default_budget_mb)
+            self._check_folder_budget(folder, textures, budget_mb)
+
+        return self.report
+
+    def _normalize_budgets(self, budgets: Dict[str, Any]) -> Dict[str, float]:
+        """Normalize configured budget folders to slash-separated paths without a trailing slash."""
+        return {
+            folder.replace('\\', '/').strip('/'): budget
+            for folder, budget in budgets.items()
+            if isinstance(budget, (int, float))
+        }
+
+    def _budget_folder(self, relative_path: str, folder_budgets: Dict[str, float]) -> str:
+        """Return the most specific configured folder containing a texture, else its own folder."""
+        parent = relative_path.rsplit('/', 1)[0]
+        best: Optional[str] = None
+        for folder in folder_budgets:
+            if parent == folder or parent.startswith(folder + '/'):
+                if best is None or len(folder) > len(best):
+                    best = folder
+        return best or parent
+
+    def _check_texture(self, file_path: str, info: TextureInfo, max_dimension: int, require_power_of_two: bool):
+        """Check the dimensions of a single texture."""
+        context = {
+            'width': info.width,
+            'height': info.height,
+            'bit_depth': info.bit_depth,
+            'channels': info.channels,
+            'format': info.format
+        }
+
+        if max(info.width, info.height) > max_dimension:
+            self.add_result(
+                ValidationLevel.WARNING,
+                f"Texture is {info.width}x{info.height}, larger than the {max_dimension}px limit",
+                file_path,
+                context=context
+            )
+
+        if require_power_of_two and not info.is_power_of_two:
+            self.add_possible_issue(
+                f"Texture dimensions {info.width}x{info.height} are not powers of two",
+                file_path,
+                context=context
+            )
+
+    def _check_folder_budget(self, folder: str, textures: List[Tuple[str, TextureInfo]], budget_mb: float):
+        """Report the texture memory of a folder and flag it if over budget."""
+        total_bytes = sum(info.memory_bytes for _, info in textures)
+        total_mb = total_bytes / MB
+        context = {
+            'folder': folder,
+            'texture_count': len(textures),
+            'memory_mb': round(total_mb, 3),
+            'budget_mb': budget_mb,
+            'textures': [
+                {
+                    'path': relative_path,
+                    'width': info.width,
+                    'height': info.height,
+                    'bit_depth': info.bit_depth,
+                    'memory_mb': round(info.memory_bytes / MB, 3)
+                }
+                for relative_path, info in textures
+            ]
+        }
+
+        if total_mb > budget_mb:
+            self.add_result(
+                ValidationLevel.WARNING,
+                f"Texture memory in '{folder}' is {total_mb:.2f} MB, over the {budget_mb} MB budget",
+                context=context
+            )
+        else:
+            self.add_result(
+                ValidationLevel.INFO,
+                f"Texture memory in '{folder}': {total_mb:.2f} MB of {budget_mb} MB across {len(textures)} textures",
+                context=context
+            )
@@ -8,7 +8,7 @@ import json
 from typing import Dict, Any
 from .base_test import BaseValidatorTest
 from ..models import ValidationLevel, ValidationReport
-from ..utils import find_pack_directories
+from ..utils import find_pack_directories, parse_json, walk_json, walk_pack
 
 
 class TranslatableTest(BaseValidatorTest):
@@ -31,7 +31,7 @@ class TranslatableTest(BaseValidatorTest):
             for path in possible_paths:
                 if os.path.exists(path):
                     # Check for hardcoded text in JSON files
-                    for root, dirs, files in os.walk(path):
+                    for root, dirs, files in walk_pack(path, self.rules.ignore_rules(path)):
                         for file in files:
                             if file.endswith('.json'):
                                 file_path = os.path.join(root, file)
@@ -44,31 +44,23 @@ class TranslatableTest(BaseValidatorTest):
         """Check for hardcoded text in JSON files."""
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+                data = parse_json(f.read())
             
-            self._check_hardcoded_text_recursive(data, file_path)
+            self._check_hardcoded_text(data, file_path)
         
         except (json.JSONDecodeError, UnicodeDecodeError):
             pass
     
-    def _check_hardcoded_text_recursive(self, data: Any, file_path: str, path: str = ""):
-        """Recursively check for hardcoded text."""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                self._check_hardcoded_text_recursive(value, file_path, current_path)
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]"
-                self._check_hardcoded_text_recursive(item, file_path, current_path)
-        elif isinstance(data, str):
+    def _check_hardcoded_text(self, data: Any, file_path: str):
+        """Check every string in a document for hardcoded text."""
+        for path, _, value in walk_json(data):
             # Check for potential user-facing text
-            if len(data) > 3 and not data.startswith('minecraft:') and not data.startswith(self.namespace_info.namespace or ''):
+            if isinstance(value, str) and len(value) > 3 and not value.startswith('minecraft:') and not value.startswith(self.namespace_info.namespace or ''):
                 # Look for common user-facing text patterns
-                if any(word in data.lower() for word in ['welcome', 'hello', 'goodbye', 'error', 'success', 'failed']):
+                if self.rules.user_facing_regex.search(value.lower()):
                     self.add_result(
                         ValidationLevel.WARNING,
                         f"Potential hardcoded user-facing text found",
                         file_path,
-                        context={'text': data, 'path': path}
+                        context={'text': value, 'path': path}
                     )
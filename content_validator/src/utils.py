@@ -9,9 +9,10 @@ import logging
 import shutil
 import hashlib
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple, Union, Set
+from typing import List, Dict, Any, Optional, Tuple, Union, Set, Callable, Iterator, Iterable
 import glob
 import re
+import fnmatch
 from collections import defaultdict
 
 # Import validation libraries
@@ -126,11 +127,101 @@ def get_first_existing_path(possible_paths: List[str]) -> Optional[str]:
     return None
 
 
+_JSON_WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+_JSON_NUMBER_RE = re.compile(r'(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?')
+_JSON_CONSTANTS = (('true', True), ('false', False), ('null', None),
+                   ('NaN', float('nan')), ('Infinity', float('inf')), ('-Infinity', float('-inf')))
+
+
+def _parse_json_iteratively(text: str) -> Any:
+    """
+    Parse JSON text with an explicit stack of open containers.
+
+    Accepts the same documents as json.loads but is not bound by the recursion
+    limit, which the C decoder hits at a few thousand levels. It is slower, so
+    parse_json only falls back to it for documents json.loads refuses.
+    """
+    skip = _JSON_WHITESPACE_RE.match
+    # Open containers as [container, pending dict key]
+    stack: List[List[Any]] = []
+
+    def read_key(pos: int) -> int:
+        if text[pos:pos + 1] != '"':
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, pos)
+        key, pos = json.decoder.scanstring(text, pos + 1, True)
+        pos = skip(text, pos).end()
+        if text[pos:pos + 1] != ':':
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+        stack[-1][1] = key
+        return skip(text, pos + 1).end()
+
+    pos = skip(text, 0).end()
+    while True:
+        char = text[pos:pos + 1]
+        if char in ('{', '['):
+            container: Any = {} if char == '{' else []
+            pos = skip(text, pos + 1).end()
+            if text[pos:pos + 1] != ('}' if char == '{' else ']'):
+                stack.append([container, None])
+                if char == '{':
+                    pos = read_key(pos)
+                continue
+            value, pos = container, pos + 1
+        elif char == '"':
+            value, pos = json.decoder.scanstring(text, pos + 1, True)
+        else:
+            match = _JSON_NUMBER_RE.match(text, pos)
+            if match:
+                integer, fraction, exponent = match.groups()
+                value = float(integer + (fraction or '') + (exponent or '')) if fraction or exponent else int(integer)
+                pos = match.end()
+            else:
+                for literal, value in _JSON_CONSTANTS:
+                    if text.startswith(literal, pos):
+                        pos += len(literal)
+                        break
+                else:
+                    raise json.JSONDecodeError("Expecting value", text, pos)
+
+        # Store the value, closing every container that ends right after it
+        while True:
+            pos = skip(text, pos).end()
+            if not stack:
+                if pos != len(text):
+                    raise json.JSONDecodeError("Extra data", text, pos)
+                return value
+
+            container, key = stack[-1]
+            if isinstance(container, list):
+                container.append(value)
+            else:
+                container[key] = value
+
+            char = text[pos:pos + 1]
+            if char == ',':
+                pos = skip(text, pos + 1).end()
+                if isinstance(container, dict):
+                    pos = read_key(pos)
+                break
+            if char != (']' if isinstance(container, list) else '}'):
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+            stack.pop()
+            value, pos = container, pos + 1
+
+
+def parse_json(text: str) -> Any:
+    """json.loads that also accepts documents nested past the recursion limit."""
+    try:
+        return json.loads(text)
+    except RecursionError:
+        return _parse_json_iteratively(text)
+
+
 def safe_json_load(file_path: str) -> Optional[Dict[str, Any]]:
     """Safely load JSON file with error handling."""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return parse_json(f.read())
     except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
         return None
 
@@ -142,3 +233,152 @@ def safe_file_read(file_path: str) -> Optional[str]:
             return f.read()
     except (UnicodeDecodeError, OSError):
         return None
+
+
+# Bedrock JSON allows // and /* */ comments; strings are matched first so they survive
+_JSON_COMMENT_RE = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*|/\*.*?\*/', re.DOTALL)
+
+
+def strip_json_comments(text: str) -> str:
+    """Remove // and /* */ comments from Bedrock-style JSON text."""
+    if '/' not in text:
+        return text
+    return _JSON_COMMENT_RE.sub(lambda match: match.group(1) or '', text)
+
+
+def load_bedrock_json(file_path: str) -> Optional[Any]:
+    """Load a JSON file that may contain comments, returning None if it can't be parsed."""
+    content = safe_file_read(file_path)
+    if content is None:
+        return None
+    content = content.lstrip('\ufeff')
+    try:
+        return parse_json(content)
+    except json.JSONDecodeError:
+        pass
+    try:
+        return parse_json(strip_json_comments(content))
+    except json.JSONDecodeError:
+        return None
+
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(file_path: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """Return the SHA-256 hex digest of a file, read in large chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# (path, key, value); key is a dict key, a list index, or None for the root
+JsonNode = Tuple[str, Any, Any]
+
+
+def walk_json(data: Any, prune: Optional[Callable[[str, Any, Any], bool]] = None) -> Iterator[JsonNode]:
+    """
+    Yield (path, key, value) for every node of a parsed JSON document, depth first.
+
+    Uses an explicit stack, so nesting depth is not bound by the recursion
+    limit. Nodes come in the same order a recursive walk would visit them, with
+    paths like 'a.b[0].c'. Break out of the loop to stop early; pass prune to
+    skip a node's children when it returns True for that node's
+    (path, key, value). The pruned node itself is still yielded.
+    """
+    stack: List[JsonNode] = [("", None, data)]
+    while stack:
+        path, key, value = stack.pop()
+        yield path, key, value
+
+        if prune is not None and prune(path, key, value):
+            continue
+
+        # Children are pushed in reverse so they are popped in document order
+        if isinstance(value, dict):
+            for child_key, child in reversed(list(value.items())):
+                stack.append((f"{path}.{child_key}" if path else child_key, child_key, child))
+        elif isinstance(value, list):
+            for index in range(len(value) - 1, -1, -1):
+                stack.append((f"{path}[{index}]", index, value[index]))
+
+
+IGNORE_FILE_NAME = '.validatorignore'
+
+
+class IgnoreRules:
+    """
+    Folder names and glob patterns excluded from every pack traversal.
+
+    Names match whole path components exactly, so 'Store Art' ignores
+    BP/Store Art/ but not BP/textures/store_art_preview/. Patterns use fnmatch
+    syntax, one per line in a .validatorignore file at the pack root ('#'
+    starts a comment). A pattern containing '/' matches the pack-relative path,
+    otherwise the file or folder name; a trailing '/' matches folders only.
+    """
+
+    def __init__(self, names: Iterable[str] = (), patterns: Iterable[str] = ()):
+        self.names: Set[str] = set()
+        self.relative_paths: Set[str] = set()
+        for name in names:
+            name = name.strip('/')
+            (self.relative_paths if '/' in name else self.names).add(name)
+
+        # (regex, folders only, match against the relative path)
+        self.patterns: List[Tuple[re.Pattern, bool, bool]] = []
+        for pattern in patterns:
+            pattern = pattern.strip()
+            if not pattern or pattern.startswith('#'):
+                continue
+            folders_only = pattern.endswith('/')
+            pattern = pattern.strip('/')
+            self.patterns.append((re.compile(fnmatch.translate(pattern)), folders_only, '/' in pattern))
+
+    @classmethod
+    def for_pack(cls, root: str, names: Iterable[str] = (), patterns: Iterable[str] = ()) -> 'IgnoreRules':
+        """Combine configured names and patterns with the pack's .validatorignore file."""
+        patterns = list(patterns)
+        try:
+            with open(os.path.join(root, IGNORE_FILE_NAME), 'r', encoding='utf-8') as f:
+                patterns.extend(f.read().splitlines())
+        except OSError:
+            pass
+        return cls(names, patterns)
+
+    def ignores(self, relative_path: str, is_dir: bool) -> bool:
+        """Check a '/'-separated pack-relative path against the rules."""
+        name = relative_path.rsplit('/', 1)[-1]
+        if not is_dir and name == IGNORE_FILE_NAME:
+            return True
+        if is_dir and (name in self.names or relative_path in self.relative_paths):
+            return True
+        for regex, folders_only, match_path in self.patterns:
+            if folders_only and not is_dir:
+                continue
+            if regex.match(relative_path if match_path else name):
+                return True
+        return False
+
+
+def walk_pack(root: str, ignore: Optional[IgnoreRules] = None) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """
+    os.walk over a pack that never enters ignored folders.
+
+    Ignored folders are removed from the directory list in place before
+    os.walk descends, so nothing below them is listed or statted; ignored
+    files are left out of the file list. Folders and files come in sorted
+    order so results are stable between runs.
+    """
+    for dir_path, dir_names, file_names in os.walk(root):
+        relative_dir = os.path.relpath(dir_path, root).replace(os.sep, '/')
+        prefix = '' if relative_dir == '.' else relative_dir + '/'
+
+        if ignore is None:
+            dir_names.sort()
+            yield dir_path, dir_names, sorted(file_names)
+            continue
+
+        dir_names[:] = sorted(name for name in dir_names if not ignore.ignores(prefix + name, True))
+        yield dir_path, dir_names, sorted(name for name in file_names if not ignore.ignores(prefix + name, False))
@@ -12,6 +12,8 @@ import glob
 
 from .utils import logger, find_pack_directories, get_first_existing_path
 from .namespace_extractor import NamespaceExtractor
+from .pack_index import PackIndex
+from .rules import RuleSet
 from .report_generator import ReportGenerator
 from .tests.test_registry import test_registry
 
@@ -24,8 +26,11 @@ class MainValidator:
         self.report = ValidationReport()
         self.namespace_info = None
         
+        # Compile settings into the rule set shared by every test
+        self.rules = RuleSet.from_settings(settings)
+        
         # Initialize namespace extractor and report generator
-        self.namespace_extractor = NamespaceExtractor(settings)
+        self.namespace_extractor = NamespaceExtractor(settings, self.rules)
         self.report_generator = ReportGenerator(settings)
     
     def validate_addon(self) -> ValidationReport:
@@ -42,7 +47,9 @@ class MainValidator:
         test_instances = test_registry.run_all_tests(
             self.settings, 
             pack_paths,
-            self.namespace_info
+            self.namespace_info,
+            self.rules,
+            PackIndex(pack_paths, self.rules)
         )
         
         # Merge all test results into the main report
@@ -112,6 +119,16 @@ class MainValidator:
             "Translatable Text": "TranslatableTest",
             "Organization Requirements": "OrganizationTest",
             "Content Guidelines": "ContentGuidelinesTest",
+            "Schema Validation": "SchemaTest",
+            "Texture Budgets": "TextureTest",
+            "Audio Budgets": "AudioBudgetTest",
+            "Structure Files": "StructureTest",
+            "Asset References": "ReferenceTest",
+            "Duplicate Identifiers": "DuplicateIdentifierTest",
+            "Duplicate Files": "DuplicateFileTest",
+            "Animation Controllers": "AnimationControllerTest",
+            "Entity Performance": "PerformanceLintTest",
+            "Geometry Budgets": "GeometryBudgetTest",
             "Minecraft Creator Tools": "MCTTest"
         }
         
@@ -121,7 +138,8 @@ class MainValidator:
         test_instance = test_registry.create_test_instance(
             class_name, 
             self.settings, 
-            self.namespace_info
+            self.namespace_info,
+            self.rules
         )
         test_instance.validate(pack_paths)
         
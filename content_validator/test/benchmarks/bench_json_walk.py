@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Stress benchmark for deeply nested pack documents.
+
+Writes an entity file nested 10,000 levels deep (alternating objects and
+arrays, far past the depth at which json.loads raises RecursionError) into a
+generated project, then times parsing it through load_bedrock_json and the
+pack index, walk_json over it and a wide document, the namespace and
+translatable checks that read it from disk, and a full project validation.
+Exits non-zero if the file is not parsed, a check misses the identifier at the
+bottom, the validation run fails, or the timed steps exceed the time limit.
+
+Usage:
+    python test/benchmarks/bench_json_walk.py [depth] [limit_seconds]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.batch import validate_project
+from src.models import NamespaceInfo
+from src.pack_index import PackIndex
+from src.tests.namespace_test import NamespaceTest
+from src.tests.translatable_test import TranslatableTest
+from src.utils import load_bedrock_json, walk_json
+
+# External tools would dominate the full run; only the in-process tests matter here
+BENCH_SETTINGS = {'generate_report': False, 'minecraft_creator_tools': {'enabled': False}}
+
+
+def deep_document_text(depth: int) -> str:
+    """Nest alternating objects and arrays, with a forbidden identifier at the bottom."""
+    opening, closing = [], []
+    for level in reversed(range(depth)):
+        if level % 2:
+            opening.append(f'{{"level": {level}, "child": ')
+            closing.append('}')
+        else:
+            opening.append(f'[{level}, ')
+            closing.append(']')
+    bottom = json.dumps({'identifier': 'minecraft:deep_entity', 'text': 'Welcome to the bottom'})
+    # The document root is an entity file, so tests that expect an object still read it
+    return ('{"format_version": "1.20.0", "bench:deep": '
+            + ''.join(opening) + bottom + ''.join(reversed(closing)) + '}')
+
+
+def build_wide_document(width: int):
+    return {f'key_{i}': {'values': list(range(10)), 'name': f'bench:item_{i}'} for i in range(width)}
+
+
+def build_project(root: str, depth: int) -> str:
+    """Write a minimal project whose only entity is the deep document."""
+    entities = os.path.join(root, 'BP', 'entities')
+    os.makedirs(entities)
+    os.makedirs(os.path.join(root, 'RP'))
+    deep_path = os.path.join(entities, 'deep_entity.json')
+    with open(deep_path, 'w', encoding='utf-8') as f:
+        f.write(deep_document_text(depth))
+    return deep_path
+
+
+def timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed:.3f}s")
+    return result, elapsed
+
+
+def main():
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    limit_seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+
+    print(f"Recursion limit: {sys.getrecursionlimit()}, document depth: {depth}")
+    wide = build_wide_document(depth)
+    total = 0.0
+    failures = []
+
+    with tempfile.TemporaryDirectory() as root:
+        deep_path = build_project(root, depth)
+        previous_dir = os.getcwd()
+        os.chdir(root)
+        try:
+            deep, elapsed = timed("load_bedrock_json (deep file)", lambda: load_bedrock_json(deep_path))
+            total += elapsed
+            if deep is None:
+                print("FAIL: the deep file was not parsed")
+                sys.exit(1)
+
+            node_count, elapsed = timed("walk_json (deep)", lambda: sum(1 for _ in walk_json(deep)))
+            total += elapsed
+            print(f"  {node_count} nodes")
+
+            def first_forbidden():
+                for path, _, value in walk_json(deep):
+                    if isinstance(value, str) and value.startswith('minecraft:'):
+                        return path.count('[') + path.count('.')
+                return None
+
+            found_depth, elapsed = timed("walk_json early exit (deep)", first_forbidden)
+            total += elapsed
+            if not found_depth:
+                failures.append("early exit did not reach the bottom of the document")
+
+            node_count, elapsed = timed("walk_json (wide)", lambda: sum(1 for _ in walk_json(wide)))
+            total += elapsed
+            print(f"  {node_count} nodes")
+
+            def index_documents():
+                index = PackIndex({'BP': 'BP', 'RP': 'RP'})
+                return index, [path for _, path, _ in index.iter_documents()]
+
+            (pack_index, documents), elapsed = timed("PackIndex scan and parse", index_documents)
+            total += elapsed
+            if os.path.join('BP', 'entities', 'deep_entity.json') not in documents:
+                failures.append("the pack index did not parse the deep file")
+
+            namespace_info = NamespaceInfo(namespace='bench')
+            namespace_test = NamespaceTest({}, namespace_info, pack_index=pack_index)
+            _, elapsed = timed("NamespaceTest (from disk)", lambda: namespace_test.validate(pack_index.pack_paths))
+            total += elapsed
+            if namespace_test.report.total_errors != 1:
+                failures.append(f"NamespaceTest reported {namespace_test.report.total_errors} errors, expected 1")
+
+            translatable_test = TranslatableTest({}, namespace_info, pack_index=pack_index)
+            _, elapsed = timed("TranslatableTest (from disk)", lambda: translatable_test.validate(pack_index.pack_paths))
+            total += elapsed
+            if translatable_test.report.total_warnings != 1:
+                failures.append(f"TranslatableTest reported {translatable_test.report.total_warnings} warnings, expected 1")
+        finally:
+            os.chdir(previous_dir)
+
+        # The whole suite must finish on the project instead of aborting; not part of the limit
+        try:
+            entry, _ = timed("Full validation (untimed)", lambda: validate_project(
+                root, BENCH_SETTINGS, os.path.join(root, 'report.json')))
+            print(f"  {entry['summary']['total_errors']} errors, {entry['summary']['total_warnings']} warnings")
+        except Exception as e:
+            failures.append(f"full validation failed: {type(e).__name__}: {e}")
+
+    print(f"{'Total':<32} {total:.3f}s")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if total > limit_seconds:
+        print(f"FAIL: exceeded {limit_seconds:.2f}s limit")
+    if failures or total > limit_seconds:
+        sys.exit(1)
+    print(f"OK: within {limit_seconds:.2f}s limit")
+
+
+if __name__ == '__main__':
+    main()
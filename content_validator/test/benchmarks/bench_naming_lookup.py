@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the indexed folder lookup used by the naming test.
+
+Generates a resource pack whose animations, render controllers and models are
+nested many folders deep, then times NamingTest over it (including the pack
+index scan) against a recursive glob per folder kind. Every generated file has
+a badly named identifier, so the warning count shows that nested files are all
+checked. Exits non-zero if a file is missed or the run exceeds the time limit.
+
+Usage:
+    python test/benchmarks/bench_naming_lookup.py [file_count] [depth] [limit_seconds]
+"""
+
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.models import NamespaceInfo
+from src.pack_index import PackIndex
+from src.tests.naming_test import NamingTest
+
+FOLDER_KINDS = {
+    'animations': lambda i: {'format_version': '1.10.0', 'animations': {f'animation.other.{i}': {}}},
+    'render_controllers': lambda i: {'format_version': '1.10.0', 'render_controllers': {f'controller.render.other.{i}': {}}},
+    'models/entity': lambda i: {'format_version': '1.12.0', 'minecraft:geometry': [{'description': {'identifier': f'geometry.other.{i}'}}]},
+}
+
+
+def build_pack(root: str, file_count: int, depth: int) -> str:
+    """Write file_count files per folder kind, spread over folders nested depth levels deep."""
+    rp_path = os.path.join(root, 'RP')
+
+    for folder_kind, make_document in FOLDER_KINDS.items():
+        for i in range(file_count):
+            nested = [f'level_{level}_{(i >> level) % 2}' for level in range(i % (depth + 1))]
+            folder = os.path.join(rp_path, *folder_kind.split('/'), *nested)
+            os.makedirs(folder, exist_ok=True)
+            with open(os.path.join(folder, f'asset_{i}.json'), 'w') as f:
+                json.dump(make_document(i), f)
+
+        # Unrelated files in the same tree that the lookup must skip
+        textures = os.path.join(rp_path, 'textures', *[f'level_{level}' for level in range(depth)])
+        os.makedirs(textures, exist_ok=True)
+        for i in range(file_count):
+            open(os.path.join(textures, f'texture_{folder_kind.replace("/", "_")}_{i}.png'), 'wb').close()
+
+    return rp_path
+
+
+def main():
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+    limit_seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 2.0
+
+    with tempfile.TemporaryDirectory() as root:
+        rp_path = build_pack(root, file_count, depth)
+        os.chdir(root)
+
+        start = time.perf_counter()
+        pack_index = PackIndex({'RP': rp_path})
+        test = NamingTest({}, NamespaceInfo(namespace='bench'), pack_index=pack_index)
+        report = test.validate(pack_index.pack_paths)
+        elapsed = time.perf_counter() - start
+
+        # Reference point: one recursive glob per folder kind, listing only
+        start = time.perf_counter()
+        globbed = sum(
+            len(glob.glob(os.path.join(rp_path, *folder_kind.split('/'), '**', '*.json'), recursive=True))
+            for folder_kind in FOLDER_KINDS
+        )
+        glob_elapsed = time.perf_counter() - start
+
+    expected = file_count * len(FOLDER_KINDS)
+    print(f"Files per kind:  {file_count} (up to {depth} folders deep)")
+    print(f"Indexed lookup:  {elapsed:.3f}s including scan and parsing")
+    print(f"Recursive glob:  {glob_elapsed:.3f}s listing {globbed} files only")
+    print(f"Warnings:        {report.total_warnings} of {expected} expected")
+
+    failed = False
+    if report.total_warnings != expected:
+        print("FAIL: nested files were not all checked")
+        failed = True
+    if elapsed > limit_seconds:
+        print(f"FAIL: exceeded {limit_seconds:.2f}s limit")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print(f"OK: within {limit_seconds:.2f}s limit")
+
+
+if __name__ == '__main__':
+    main()
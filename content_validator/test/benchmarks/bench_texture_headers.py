@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the header-only texture budget test.
+
+Generates a resource pack with thousands of synthetic PNG and TGA textures and
+times TextureTest over it, including the pack index scan. Exits non-zero if the
+run exceeds the time limit.
+
+Usage:
+    python test/benchmarks/bench_texture_headers.py [texture_count] [limit_seconds]
+"""
+
+import os
+import struct
+import sys
+import tempfile
+import time
+import zlib
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.pack_index import PackIndex
+from src.tests.texture_test import TextureTest
+
+
+def png_bytes(width: int, height: int) -> bytes:
+    """Build a PNG with a valid IHDR and an empty IDAT; the pixels are never read."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    ihdr = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', ihdr) + chunk(b'IDAT', b'') + chunk(b'IEND', b'')
+
+
+def tga_bytes(width: int, height: int) -> bytes:
+    """Build an uncompressed 32-bit TGA header."""
+    return struct.pack('<BBBHHBHHHHBB', 0, 0, 2, 0, 0, 0, 0, 0, width, height, 32, 8)
+
+
+def build_pack(root: str, texture_count: int) -> str:
+    """Write texture_count textures spread over nested folders."""
+    rp_path = os.path.join(root, 'RP')
+    sizes = [(16, 16), (64, 32), (128, 128), (256, 256), (66, 27), (2048, 1024)]
+
+    for i in range(texture_count):
+        folder = os.path.join(rp_path, 'textures', f'category_{i % 8}', f'group_{i % 25}')
+        os.makedirs(folder, exist_ok=True)
+        width, height = sizes[i % len(sizes)]
+        if i % 10 == 0:
+            file_path, data = os.path.join(folder, f'texture_{i}.tga'), tga_bytes(width, height)
+        else:
+            file_path, data = os.path.join(folder, f'texture_{i}.png'), png_bytes(width, height)
+        with open(file_path, 'wb') as f:
+            f.write(data)
+
+    return rp_path
+
+
+def main():
+    texture_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    limit_seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+
+    with tempfile.TemporaryDirectory() as root:
+        rp_path = build_pack(root, texture_count)
+        os.chdir(root)
+
+        start = time.perf_counter()
+        pack_index = PackIndex({'RP': rp_path})
+        test = TextureTest({}, pack_index=pack_index)
+        report = test.validate(pack_index.pack_paths)
+        elapsed = time.perf_counter() - start
+
+    print(f"Textures:        {texture_count}")
+    print(f"Elapsed:         {elapsed:.3f}s ({elapsed / texture_count * 1e6:.1f} us per texture)")
+    print(f"Warnings:        {report.total_warnings}")
+    print(f"Possible issues: {report.total_possible_issues}")
+    print(f"Info:            {report.total_info}")
+
+    if elapsed > limit_seconds:
+        print(f"FAIL: exceeded {limit_seconds:.2f}s limit")
+        sys.exit(1)
+    print(f"OK: within {limit_seconds:.2f}s limit")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for walk_json, the iterative traversal shared by the pack checks.
+
+Runs under pytest or directly, exiting non-zero if a check fails.
+
+Usage:
+    python test/test_walk_json.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.rules import RuleSet
+from src.utils import walk_json
+
+
+def test_walk_json_yields_paths_in_document_order():
+    data = {'a': [1, {'b': 2}], 'c': 3}
+    assert list(walk_json(data)) == [
+        ('', None, data),
+        ('a', 'a', data['a']),
+        ('a[0]', 0, 1),
+        ('a[1]', 1, {'b': 2}),
+        ('a[1].b', 'b', 2),
+        ('c', 'c', 3),
+    ]
+
+
+def test_walk_json_stops_when_the_loop_breaks():
+    visited = []
+    for path, _, value in walk_json({'a': 'minecraft:x', 'b': {'c': 'minecraft:y'}}):
+        visited.append(path)
+        if value == 'minecraft:x':
+            break
+    assert visited == ['', 'a']
+
+
+def test_walk_json_prune_skips_children_but_yields_the_node():
+    data = {'volume': {'nested': 1}, 'sound': 'mob.test', 'pitch': [1, 2]}
+    paths = [path for path, _, _ in walk_json(data, prune=lambda path, key, value: key in ('volume', 'pitch'))]
+    assert paths == ['', 'volume', 'sound', 'pitch']
+
+
+def test_walk_json_handles_deep_nesting():
+    depth = 10000
+    data = current = {}
+    for _ in range(depth):
+        current['child'] = {}
+        current = current['child']
+    current['identifier'] = 'minecraft:deep'
+    values = [value for _, _, value in walk_json(data)]
+    assert len(values) == depth + 2
+    assert values[-1] == 'minecraft:deep'
+
+
+def test_reference_path_prune_keeps_identifier_definitions():
+    rules = RuleSet()
+    data = {
+        'minecraft:recipe_shaped': {
+            'description': {'identifier': 'minecraft:custom_recipe'},
+            'key': {'A': {'item': 'minecraft:stick'}},
+            'result': {'item': 'minecraft:stick'},
+        },
+        'minecraft:entity': {'description': {'identifier': 'minecraft:custom'}},
+    }
+
+    def definitions(prune=None):
+        return [path for path, _, value in walk_json(data, prune=prune)
+                if isinstance(value, str) and rules.is_identifier_definition(path, 'BP/entities/x.json')]
+
+    pruned = definitions(lambda path, key, value: rules.is_reference_path(path))
+    assert pruned == definitions()
+    assert 'minecraft:entity.description.identifier' in pruned
+
+
+def main():
+    failed = 0
+    for name, test in sorted(globals().items()):
+        if name.startswith('test_') and callable(test):
+            try:
+                test()
+                print(f"PASS {name}")
+            except AssertionError as e:
+                failed += 1
+                print(f"FAIL {name} {e}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Batch entry point for the Content Validator.
+
+Validates several projects (each a Regolith project or a folder with BP/RP
+packs) on one shared process pool. Every project gets its own report next to
+the combined summary, and the summary lists per-project results and totals.
+
+Usage:
+    python validate_many.py [--settings JSON] [--workers N] [--summary PATH] [--list FILE] [roots ...]
+"""
+
+import os
+import sys
+import json
+import argparse
+import logging
+from src.batch import validate_many, DEFAULT_SUMMARY_PATH
+from src.utils import logger
+
+
+def main():
+    """Batch entry point."""
+    parser = argparse.ArgumentParser(description='Validate several Minecraft Bedrock projects on one worker pool')
+    parser.add_argument('roots', nargs='*', help='Project root directories')
+    parser.add_argument('--list', dest='list_file', help='File with one project root per line')
+    parser.add_argument('--settings', '-s', help='Settings as JSON (defaults to filter.json settings)')
+    parser.add_argument('--workers', '-w', type=int, help='Number of worker processes (defaults to CPU count)')
+    parser.add_argument('--summary', default=DEFAULT_SUMMARY_PATH, help='Path of the combined summary file')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
+
+    args = parser.parse_args()
+
+    try:
+        roots = list(args.roots)
+        if args.list_file:
+            with open(args.list_file, 'r', encoding='utf-8') as f:
+                roots.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+        if not roots:
+            parser.error("no project roots given")
+
+        # parse_settings reads sys.argv[1], which is a project root here
+        settings = json.loads(args.settings) if args.settings else _filter_settings()
+
+        log_level = 'DEBUG' if args.verbose else settings.get('log_level', 'INFO')
+        logging.getLogger().setLevel(getattr(logging, log_level.upper()))
+
+        summary = validate_many(roots, settings, max_workers=args.workers, summary_path=args.summary,
+                                log_level='DEBUG' if args.verbose else 'WARNING')
+        totals = summary['totals']
+
+        print(f"📦 {totals['projects']} projects validated in {totals['seconds']:.1f}s "
+              f"on {totals['workers']} workers")
+        for entry in summary['projects']:
+            if 'error' in entry:
+                print(f"  💥 {entry['project']}: {entry['error']}")
+            else:
+                result = entry['summary']
+                status = '✅' if result['is_valid'] else '❌'
+                print(f"  {status} {entry['project']}: {result['total_errors']} errors, "
+                      f"{result['total_warnings']} warnings ({entry['seconds']:.1f}s)")
+        print(f"📄 Summary: {args.summary}")
+
+        all_valid = totals['valid_projects'] == totals['projects']
+        if all_valid:
+            sys.exit(0)
+        if settings.get('exit_on_error', True):
+            logger.error("❌ Batch validation failed!")
+            sys.exit(1)
+        logger.info("📊 Continuing due to exit_on_error=false setting")
+        sys.exit(0)
+
+    except Exception as e:
+        logger.error(f"Fatal error during batch validation: {e}")
+        sys.exit(1)
+
+
+def _filter_settings():
+    """Load the settings block of filter.json."""
+    filter_json_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'filter.json')
+    if not os.path.exists(filter_json_path):
+        logger.warning("No settings provided and filter.json not found, using defaults")
+        return {}
+    with open(filter_json_path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('settings', {})
+
+
+if __name__ == "__main__":
+    main()